@@ -0,0 +1,84 @@
+"""
+Benchmark of the response decoding in the handlers.
+
+Compares the old path (check_result decodes the body, then the handler decodes it again with the standard library)
+with VKResponse, which decodes the body once with the fastest available backend.
+
+Usage: python benchmarks/bench_decode.py [--items 1000] [--repeat 200]
+"""
+
+import sys
+import json
+import argparse
+
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parservk.core import jsonlib
+from parservk.core.response import StaticResponse, VKResponse
+
+
+def create_page(items: int) -> bytes:
+    """
+    Creates the body of a groups.getMembers page with extended fields.
+
+    :param items: Number of members on the page.
+    :return: The body of the response.
+    """
+
+    members = [
+        {
+            "id": index,
+            "first_name": f"Name{index}",
+            "last_name": f"Surname{index}",
+            "sex": index % 3,
+            "city": {"id": index % 100, "title": f"City{index % 100}"},
+            "bdate": "1.1.2000",
+            "can_access_closed": True,
+            "is_closed": False,
+        }
+        for index in range(items)
+    ]
+
+    return json.dumps({"response": {"count": items, "items": members}}).encode()
+
+
+def decode_twice(content: bytes) -> list:
+    response = StaticResponse("https://api.vk.com/method/groups.getMembers", content=content)
+    response.raise_for_status()
+    if "error" in json.loads(response.content):
+        return []
+
+    return json.loads(response.content)["response"]["items"]
+
+
+def decode_once(content: bytes) -> list:
+    response = VKResponse.wrap(StaticResponse("https://api.vk.com/method/groups.getMembers", content=content))
+    if not response.is_valid():
+        return []
+
+    return response.data["items"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    content = create_page(args.items)
+    assert decode_twice(content) == decode_once(content)
+
+    twice = timeit(lambda: decode_twice(content), number=args.repeat) / args.repeat
+    once = timeit(lambda: decode_once(content), number=args.repeat) / args.repeat
+
+    print(f"page: {args.items} items, {len(content) / 1024:.1f} KiB, backend: {jsonlib.BACKEND}")
+    print(f"decode twice (stdlib): {twice * 1000:.3f} ms/page")
+    print(f"decode once  (VKResponse): {once * 1000:.3f} ms/page")
+    print(f"saved: {(twice - once) * 1000:.3f} ms/page ({(1 - once / twice) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+End-to-end throughput benchmark of the public entry points against the local mock of the VK API(benchmarks/mockvk.py).
+
+Every scenario runs in its own process, so the peak RSS belongs to the scenario. For each scenario the calls are repeated
+and the suite reports requests/s and items/s over all calls, p50/p99 of the call duration and the peak RSS.
+
+The synchronous scenarios are repeated for each transport passed in --transport(grequests or a transport from TRANSPORTS),
+the asynchronous scenarios run once.
+
+Usage: python benchmarks/bench_endpoints.py [--repeat 5] [--latency 0.01] [--transport grequests,threads,urllib3] [--only users.get,wall.get]
+"""
+
+import sys
+import json
+import time
+import asyncio
+import resource
+import argparse
+import subprocess
+
+from pathlib import Path
+from statistics import quantiles
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mockvk import MockVKServer
+
+
+def count_items(result: Any) -> int:
+    """
+    Counts the items of the result(Lists are counted recursively, other values are one item).
+
+    :param result: The result of the entry point.
+    :return: The number of items.
+    """
+
+    if isinstance(result, list):
+        return sum(count_items(item) if isinstance(item, list) else 1 for item in result)
+
+    if isinstance(result, dict):
+        return sum(count_items(value) for value in result.values() if isinstance(value, list))
+
+    return 1
+
+
+def run_sync(parser: Any, name: str) -> int:
+    """
+    Runs the synchronous scenario.
+
+    :param parser: ParserVK.
+    :param name: The name of the scenario.
+    :return: The number of items.
+    """
+
+    if name == "users.get":
+        return count_items(parser.users.get(user_ids=list(range(1, 5001)))["users"])
+    if name == "users.get+execute":
+        return count_items(parser.users.get(user_ids=list(range(1, 5001)))["users"])
+    if name == "friends.get":
+        return count_items(parser.friends.get(user_ids=list(range(1, 201))))
+    if name == "groups.getById":
+        return count_items(parser.groups.getById(group_ids=list(range(1, 2001))))
+    if name == "groups.isMember":
+        return count_items(parser.groups.isMember(group_id=1, user_ids=list(range(1, 2001))))
+    if name == "groups.getMembers":
+        return count_items(parser.groups.getMembers(group_id=1))
+    if name == "groups.iter_members":
+        return sum(len(page) for page in parser.groups.iter_members(group_id=1, pages=True))
+    if name == "wall.get":
+        return count_items(parser.wall.get(owner_id=1))
+    if name == "wall.iter_wall":
+        return sum(len(page) for page in parser.wall.iter_wall(owner_id=1, pages=True))
+    if name == "graph.crawl":
+        from parservk.features.graph import GraphCrawler
+
+        return sum(1 for _ in GraphCrawler(parser, depth=2, max_nodes=2000).crawl([1]))
+
+    raise ValueError(f"Scenario {name} not found")
+
+
+async def run_async(parser: Any, name: str) -> int:
+    """
+    Runs the asynchronous scenario.
+
+    :param parser: AsyncParserVK.
+    :param name: The name of the scenario without the "async:" prefix.
+    :return: The number of items.
+    """
+
+    if name == "users.get":
+        return count_items((await parser.users.get(user_ids=list(range(1, 5001))))["users"])
+    if name == "groups.getMembers":
+        return count_items(await parser.groups.getMembers(group_id=1))
+    if name == "groups.iter_members":
+        items = 0
+        async for page in parser.groups.iter_members(group_id=1, pages=True):
+            items += len(page)
+
+        return items
+
+    raise ValueError(f"Scenario async:{name} not found")
+
+
+SCENARIOS = [
+    "users.get",
+    "users.get+execute",
+    "friends.get",
+    "groups.getById",
+    "groups.isMember",
+    "groups.getMembers",
+    "groups.iter_members",
+    "wall.get",
+    "wall.iter_wall",
+    "graph.crawl",
+    "async:users.get",
+    "async:groups.getMembers",
+    "async:groups.iter_members",
+]
+
+
+def measure(name: str, url: str, transport: str, repeat: int) -> dict[str, Any]:
+    """
+    Runs the scenario in this process, a new parser is created for every call.
+
+    :param name: The name of the scenario.
+    :param url: The URL of the mock API.
+    :param transport: The transport of the synchronous scenarios.
+    :param repeat: Number of calls.
+    :return: Dict with the durations of the calls, the number of items and the peak RSS in KiB.
+    """
+
+    from parservk.core import ParserVK, AsyncParserVK
+
+    tokens = [f"token{index}" for index in range(3)]
+    params = {"tokens": tokens, "api_url": url, "rate_limit": None, "max_retries": 5}
+    durations, items = [], 0
+
+    for _ in range(repeat):
+        if name.startswith("async:"):
+            async def call() -> int:
+                async with AsyncParserVK(**params) as parser:
+                    return await run_async(parser, name[len("async:"):])
+
+            start = time.perf_counter()
+            items += asyncio.run(call())
+        else:
+            parser = ParserVK(transport=transport, execute=name.endswith("+execute"), **params)
+            start = time.perf_counter()
+            items += run_sync(parser, name)
+
+        durations.append(time.perf_counter() - start)
+
+    return {"durations": durations, "items": items, "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+
+def report(name: str, result: dict[str, Any], requests: int) -> str:
+    """
+    Formats the line of the report.
+
+    :param name: The name of the scenario.
+    :param result: The result of measure.
+    :param requests: Number of the requests received by the mock.
+    :return: The line of the report.
+    """
+
+    durations = sorted(result["durations"])
+    total = sum(durations)
+    p50, p99 = (durations[0], durations[0]) if len(durations) == 1 else (quantiles(durations, n=100)[49], quantiles(durations, n=100)[98])
+
+    return (
+        f"{name:<26} {requests / total:>10,.1f} {result['items'] / total:>12,.0f} "
+        f"{p50 * 1000:>10.1f} {p99 * 1000:>10.1f} {result['rss'] / 1024:>10.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--transport", default="grequests", help="comma separated transports of the synchronous scenarios")
+    parser.add_argument("--only", default=None, help="comma separated scenarios")
+    parser.add_argument("--scenario", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--url", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(measure(args.scenario, args.url, args.transport, args.repeat)))
+        return
+
+    scenarios = SCENARIOS if args.only is None else args.only.split(",")
+    transports = args.transport.split(",")
+    with MockVKServer(latency=args.latency, error_rate=args.error_rate) as server:
+        print(f"mock: latency {args.latency * 1000:.0f} ms, error rate {args.error_rate}, repeat: {args.repeat}")
+
+        for index, transport in enumerate(transports):
+            print(f"\ntransport: {transport}")
+            print(f"{'scenario':<26} {'requests/s':>10} {'items/s':>12} {'p50 ms':>10} {'p99 ms':>10} {'RSS MiB':>10}")
+
+            for name in scenarios:
+                if index and name.startswith("async:"):
+                    continue
+
+                before = server.mock.requests
+                process = subprocess.run(
+                    [sys.executable, __file__, "--scenario", name, "--url", server.url, "--transport", transport, "--repeat", str(args.repeat)],
+                    capture_output=True,
+                    text=True,
+                )
+                if process.returncode:
+                    print(f"{name:<26} failed: {process.stderr.strip().splitlines()[-1] if process.stderr.strip() else process.returncode}")
+                    continue
+
+                print(report(name, json.loads(process.stdout.strip().splitlines()[-1]), server.mock.requests - before))
+
+
+if __name__ == "__main__":
+    main()
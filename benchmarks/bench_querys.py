@@ -0,0 +1,74 @@
+"""
+Micro-benchmark of building the querys: the cost per query of Base.get_querys_from_data.
+
+The cases are a single id with the explicit submethod, a single id with the submethod inferred from the name of the calling function,
+a batch of ids split by the limit of the method, and the pages of a paginated submethod(_paginate_querys).
+
+Usage: python benchmarks/bench_querys.py [--runs 2000] [--transport requests]
+"""
+
+import sys
+import time
+import argparse
+
+from pathlib import Path
+from statistics import median
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def measure(func: Callable[[], list], runs: int) -> float:
+    """
+    Measures the cost per query.
+
+    :param func: Function building the querys.
+    :param runs: Number of calls.
+    :return: The median duration of the call divided by the number of querys in microseconds.
+    """
+
+    querys = len(func())
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+
+    return median(durations) / querys * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--transport", default="requests")
+    args = parser.parse_args()
+
+    from parservk.core import ParserVK
+
+    vk = ParserVK(tokens=["token"], transport=args.transport, rate_limit=None)
+    users, groups = vk.users, vk.groups
+    params = users._update_all(params=users.base_params.copy())
+
+    def get(ids: list) -> list:
+        # The submethod is taken from the name of this function
+        return users.get_querys_from_data(ids, params, multi_ids="user_ids")
+
+    cases = {
+        "users.get, 1 id": lambda: users.get_querys_from_data([1], params, submethod="get", multi_ids="user_ids"),
+        "users.get, 1 id, inferred": lambda: get([1]),
+        "users.get, 5000 ids": lambda: users.get_querys_from_data(list(range(5000)), params, submethod="get", multi_ids="user_ids"),
+        "groups.getMembers, 100 pages": lambda: list(
+            groups._paginate_querys(
+                ids=[1], method="groups", submethod="getmembers", params=params, min=0, max=100000, count=1000, multi_ids="group_id"
+            )
+        ),
+    }
+
+    print(f"transport: {args.transport}, runs: {args.runs}")
+    print(f"{'case':<32} {'us/query':>10}")
+    for name, func in cases.items():
+        print(f"{name:<32} {measure(func, args.runs):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
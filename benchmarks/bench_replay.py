@@ -0,0 +1,106 @@
+"""
+Records a crawl into a cassette and replays it offline under cProfile.
+
+The crawl is recorded against the given VK API URL(By default a local mock from benchmarks/mockvk.py is started),
+then it is replayed from the cassette without the network, so the profiles of different releases can be compared on the same responses.
+
+Usage: python benchmarks/bench_replay.py [--scenario groups.getMembers] [--cassette members.cassette] [--time-scale 0] [--top 25]
+       python benchmarks/bench_replay.py --replay-only --cassette members.cassette
+"""
+
+import sys
+import time
+import pstats
+import cProfile
+import argparse
+import subprocess
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parservk.core import ParserVK
+
+
+SCENARIOS = {
+    "groups.getMembers": lambda parser: parser.groups.getMembers(group_id=1),
+    "users.get": lambda parser: parser.users.get(user_ids=list(range(1, 5001))),
+    "users.getFollowers": lambda parser: parser.users.get(user_id=1, followers=True, data_followers=True),
+    "wall.get": lambda parser: parser.wall.get(owner_id=1),
+}
+
+
+def record(scenario: str, url: str, path: str, tokens: list[str]) -> float:
+    """
+    Runs the scenario against the API and records it into the cassette.
+
+    :param scenario: The name of the scenario.
+    :param url: The URL of the VK API.
+    :param path: Path to the cassette.
+    :param tokens: Access tokens.
+    :return: Duration in seconds.
+    """
+
+    parser = ParserVK(tokens=tokens, api_url=url, cassette="record", cassette_path=path)
+    start = time.perf_counter()
+    SCENARIOS[scenario](parser)
+    duration = time.perf_counter() - start
+    parser.request_cassette.close()
+    print(f"recorded {parser.request_cassette.stats['recorded']} requests in {duration:.3f} s")
+
+    return duration
+
+
+def replay(scenario: str, url: str, path: str, time_scale: float, top: int) -> float:
+    """
+    Replays the scenario from the cassette under cProfile and prints the profile.
+
+    :param scenario: The name of the scenario.
+    :param url: The URL of the VK API used on recording.
+    :param path: Path to the cassette.
+    :param time_scale: Multiplier of the recorded response times.
+    :param top: Number of the functions in the profile.
+    :return: Duration in seconds.
+    """
+
+    parser = ParserVK(tokens=["offline"], api_url=url, rate_limit=None, cassette="replay", cassette_path=path, cassette_time_scale=time_scale)
+    profile = cProfile.Profile()
+    start = time.perf_counter()
+    profile.runcall(SCENARIOS[scenario], parser)
+    duration = time.perf_counter() - start
+    print(f"replayed {parser.request_cassette.stats} in {duration:.3f} s (time scale {time_scale})")
+    pstats.Stats(profile).sort_stats("cumulative").print_stats(top)
+
+    return duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenario", default="groups.getMembers", choices=list(SCENARIOS))
+    parser.add_argument("--cassette", default="bench.cassette")
+    parser.add_argument("--url", default=None, help="URL of the VK API to record(a local mock by default)")
+    parser.add_argument("--tokens", default="token", help="comma separated tokens for recording")
+    parser.add_argument("--time-scale", type=float, default=0.0)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--replay-only", action="store_true")
+    args = parser.parse_args()
+
+    url = args.url or "http://127.0.0.1:18790/method/"
+    if not args.replay_only:
+        mock = None
+        if args.url is None:
+            mock = subprocess.Popen([sys.executable, str(Path(__file__).resolve().parent / "mockvk.py"), "--port", "18790", "--latency", "0.02"])
+            time.sleep(1)
+
+        try:
+            record(args.scenario, url, args.cassette, args.tokens.split(","))
+        finally:
+            if not mock is None:
+                mock.terminate()
+                mock.wait()
+
+    replay(args.scenario, url, args.cassette, args.time_scale, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark of the SQLite profiles of DBManager.
+
+Loads generated users with BulkSink (upserts in batched transactions) and then runs point lookups by id,
+for the default SQLite settings and for each profile from SQLITE_PROFILES.
+
+Usage: python benchmarks/bench_sqlite_profiles.py [--rows 100000] [--batch 1000] [--lookups 20000] [--dir .]
+"""
+
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import bindparam, select
+
+from parservk.features.dao import DBManager, DBSettings, SQLITE_PROFILES, flatten
+
+
+def create_users(rows: int) -> list[dict]:
+    """
+    Creates the users with the fields of users.get.
+
+    :param rows: Number of users.
+    :return: A list of users.
+    """
+
+    return [
+        {
+            "id": index,
+            "first_name": f"Name{index}",
+            "last_name": f"Surname{index}",
+            "sex": index % 3,
+            "bdate": "1.1.2000",
+            "city": {"id": index % 1000, "title": f"City{index % 1000}"},
+            "last_seen": {"time": 1700000000 + index, "platform": index % 7},
+            "counters": {"friends": index % 500, "followers": index % 5000},
+            "is_closed": False,
+        }
+        for index in range(rows)
+    ]
+
+
+def run(profile: str, users: list[dict], batch: int, lookups: int, directory: str) -> tuple[float, float]:
+    """
+    Loads the users into a new database and runs the point lookups.
+
+    :param profile: The name of the profile or "default".
+    :param users: The users.
+    :param batch: Number of users in one transaction.
+    :param lookups: Number of point lookups.
+    :param directory: Directory of the temporary database.
+    :return: A tuple containing the inserted rows per second and the lookups per second.
+    """
+
+    with tempfile.TemporaryDirectory(dir=directory) as directory:
+        manager = DBManager(
+            str(Path(directory) / "bench.sqlite3"),
+            settings=DBSettings(),
+            sqlite_profile=None if profile == "default" else profile,
+        )
+        table = manager.create_schema()["users"]
+
+        start = time.perf_counter()
+        with manager.create_sink(table, batch_size=batch, conflict=("id",), transform=flatten) as sink:
+            sink.write_many(users)
+        insert = len(users) / (time.perf_counter() - start)
+
+        ids = random.Random(0).choices(range(len(users)), k=lookups)
+        statement = select(table.c.first_name).where(table.c.id == bindparam("id"))
+        start = time.perf_counter()
+        with manager.engine.connect() as connection:
+            for id in ids:
+                connection.execute(statement, {"id": id}).first()
+        read = lookups / (time.perf_counter() - start)
+
+        manager.engine.dispose()
+
+    return insert, read
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--dir", default=None, help="directory of the databases (a disk, not tmpfs, to measure fsync)")
+    args = parser.parse_args()
+
+    users = create_users(args.rows)
+    print(f"rows: {args.rows}, batch: {args.batch}, lookups: {args.lookups}")
+
+    for profile in ("default", *SQLITE_PROFILES):
+        insert, read = run(profile, users, args.batch, args.lookups, args.dir)
+        print(f"{profile:>12}: {insert:>10,.0f} rows/s inserted, {read:>10,.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark of the startup cost: the import time of parservk, the construction of ParserVK and the first use of a section.
+
+The import is measured in a fresh interpreter for each run, the construction and the first use in this process.
+The heaviest top-level packages imported by parservk are taken from `python -X importtime`.
+
+Usage: python benchmarks/bench_startup.py [--imports 10] [--importtime 10] [--parsers 200] [--transport requests]
+"""
+
+import sys
+import time
+import argparse
+import subprocess
+
+from pathlib import Path
+from statistics import median
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def measure_import(module: str, runs: int) -> float:
+    """
+    Measures the import time of the module in fresh interpreters.
+
+    :param module: The module.
+    :param runs: Number of runs.
+    :return: The median import time in seconds.
+    """
+
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    durations = [
+        float(subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout)
+        for _ in range(runs)
+    ]
+
+    return median(durations)
+
+
+def measure_importtime(module: str) -> dict[str, float]:
+    """
+    Measures the import time of the top-level packages imported by the module with `python -X importtime`.
+
+    :param module: The module.
+    :return: Dict where keys are the top-level packages and values are their cumulative import times in seconds.
+    """
+
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT, capture_output=True, text=True, check=True)
+    packages = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if not "." in name:
+            packages[name] = int(cumulative) / 1e6
+
+    return packages
+
+
+def measure_parsers(runs: int, transport: str) -> tuple[float, float]:
+    """
+    Measures the construction of ParserVK and the first access to a section with building its querys.
+
+    :param runs: Number of parsers.
+    :param transport: The transport of the parsers.
+    :return: A tuple containing the median construction time and the median time of the first use in seconds.
+    """
+
+    from parservk.core import ParserVK
+
+    construction, first_use = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        parser = ParserVK(tokens=["token"], transport=transport)
+        constructed = time.perf_counter()
+        parser.users.get(user_ids=[1, 2, 3], ispool=True)
+        finished = time.perf_counter()
+        construction.append(constructed - start)
+        first_use.append(finished - constructed)
+
+    return median(construction), median(first_use)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--imports", type=int, default=10)
+    parser.add_argument("--importtime", type=int, default=10, help="number of the heaviest packages to show")
+    parser.add_argument("--parsers", type=int, default=200)
+    parser.add_argument("--transport", default="requests")
+    args = parser.parse_args()
+
+    print(f"import parservk: {measure_import('parservk', args.imports) * 1000:.1f} ms (median of {args.imports})")
+    if args.importtime:
+        packages = measure_importtime("parservk")
+        print(f"gevent imported: {'yes' if 'gevent' in packages else 'no'}, the heaviest packages(-X importtime, cumulative):")
+        for name, duration in sorted(packages.items(), key=lambda item: item[1], reverse=True)[: args.importtime]:
+            print(f"  {name:<24} {duration * 1000:>8.1f} ms")
+
+    construction, first_use = measure_parsers(args.parsers, args.transport)
+    print(f"ParserVK(transport={args.transport!r}): {construction * 1e6:.0f} us, first use of users: {first_use * 1e6:.0f} us (median of {args.parsers})")
+
+
+if __name__ == "__main__":
+    main()
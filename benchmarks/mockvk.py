@@ -0,0 +1,399 @@
+"""
+Local mock of the VK API for the benchmarks, only the standard library is used.
+
+Implements users.get, users.getFollowers, friends.get, wall.get, groups.getById, groups.getMembers, groups.isMember and execute
+with deterministic data, configurable latency, a rate limit per access token and injected errors.
+
+Usage: python benchmarks/mockvk.py [--port 8080] [--latency 0.05] [--rate-limit 20] [--error-rate 0.01]
+Then: ParserVK(tokens=[...], api_url="http://127.0.0.1:8080/method/")
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+
+from collections import defaultdict, deque
+from typing import Any, Callable, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+class MockVK:
+    """
+    The data and the methods of the mock API.
+    """
+
+    def __init__(
+        self,
+        members: int = 10000,
+        posts: int = 1000,
+        friends: int = 100,
+        followers: int = 1000,
+        rate_limit: Optional[int] = None,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initializes the mock.
+
+        :param members: Number of members of every group. Default: 10000.
+        :param posts: Number of posts on every wall. Default: 1000.
+        :param friends: Number of friends of every user. Default: 100.
+        :param followers: Number of followers of every user. Default: 1000.
+        :param rate_limit: Maximum number of requests per second for one access token, the extra requests get the error 6(Optional).
+        :param error_rate: Share of the calls that get the error 6 or 10 at random. Default: 0.0.
+        :param seed: Seed of the injected errors. Default: 0.
+        """
+
+        self.members = members
+        self.posts = posts
+        self.friends = friends
+        self.followers = followers
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.requests = 0
+        self.calls = defaultdict(int)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._windows = defaultdict(deque)
+        self._methods = {
+            "users.get": self.users_get,
+            "users.getfollowers": self.users_get_followers,
+            "friends.get": self.friends_get,
+            "wall.get": self.wall_get,
+            "groups.getbyid": self.groups_get_by_id,
+            "groups.getmembers": self.groups_get_members,
+            "groups.ismember": self.groups_is_member,
+        }
+
+    @staticmethod
+    def error(code: int, message: str) -> dict:
+        return {"error": {"error_code": code, "error_msg": message}}
+
+    @staticmethod
+    def get_ids(params: dict, name: str) -> list[str]:
+        """
+        Get the ids from the plural or singular param.
+
+        :param params: Params of the call.
+        :param name: The plural name of the param, e.g. "user_ids".
+        :return: A list of ids.
+        """
+
+        value = params.get(name, params.get(name[:-1], ""))
+
+        return [id.strip() for id in str(value).split(",") if id.strip()]
+
+    @staticmethod
+    def to_number(id: Any) -> int:
+        """
+        Converts the id or the username to the number.
+
+        :param id: Id or username.
+        :return: The number.
+        """
+
+        id = str(id).lstrip("-")
+
+        return int(id) if id.isdigit() else sum(map(ord, id))
+
+    @staticmethod
+    def paginate(params: dict, total: int, create: Callable[[int], Any], max_count: int, default_count: Optional[int] = None) -> dict:
+        """
+        Creates the page of the paginated method.
+
+        :param params: Params of the call(offset, count).
+        :param total: The total count.
+        :param create: Function creating the item by its index.
+        :param max_count: Maximum count of the method.
+        :param default_count: Count of the method if the count param is not passed, like VK(Optional, max_count by default).
+        :return: The page.
+        """
+
+        offset = int(params.get("offset", 0))
+        count = min(int(params.get("count", default_count or max_count)), max_count)
+
+        return {"count": total, "items": [create(index) for index in range(offset, min(offset + count, total))]}
+
+    def users_get(self, params: dict) -> list:
+        fields = set(str(params.get("fields", "")).split(","))
+        users = []
+        for id in self.get_ids(params, "user_ids") or ["1"]:
+            number = self.to_number(id)
+            user = {"id": number, "first_name": f"Name{number}", "last_name": f"Surname{number}", "is_closed": False}
+            if "city" in fields:
+                user["city"] = {"id": number % 1000, "title": f"City{number % 1000}"}
+            if "counters" in fields:
+                user["counters"] = {"friends": self.friends, "followers": self.followers}
+            users.append(user)
+
+        return users
+
+    def users_get_followers(self, params: dict) -> dict:
+        number = self.to_number(params.get("user_id", 1))
+
+        return self.paginate(params, self.followers, lambda index: number * 1000 + index + 1, 1000, 100)
+
+    def friends_get(self, params: dict) -> dict:
+        number = self.to_number(params.get("user_id", 1))
+
+        return self.paginate(params, self.friends, lambda index: (number * 7919 + index * 104729) % 1000000 + 1, 5000)
+
+    def wall_get(self, params: dict) -> dict:
+        owner_id = int(params.get("owner_id", 1))
+
+        return self.paginate(
+            params,
+            self.posts,
+            lambda index: {
+                "id": self.posts - index,
+                "owner_id": owner_id,
+                "from_id": owner_id,
+                "date": 1700000000 - index * 60,
+                "text": f"Post {self.posts - index}",
+                "likes": {"count": index % 100},
+            },
+            100,
+        )
+
+    def groups_get_by_id(self, params: dict) -> list:
+        groups = []
+        for id in self.get_ids(params, "group_ids") or ["1"]:
+            number = self.to_number(id)
+            groups.append({"id": number, "name": f"Group{number}", "screen_name": f"club{number}", "members_count": self.members})
+
+        return groups
+
+    def groups_get_members(self, params: dict) -> dict:
+        return self.paginate(params, self.members, lambda index: index + 1, 1000)
+
+    def groups_is_member(self, params: dict) -> Any:
+        if "user_ids" in params:
+            return [{"user_id": int(id), "member": int(id) % 2} for id in self.get_ids(params, "user_ids")]
+
+        return int(params.get("user_id", 0)) % 2
+
+    def is_limited(self, token: str) -> bool:
+        """
+        Check if the rate limit of the token is exceeded by the request.
+
+        :param token: The access token.
+        :return: True if the request must get the error 6.
+        """
+
+        if self.rate_limit is None:
+            return False
+
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows[token]
+            while window and now - window[0] >= 1:
+                window.popleft()
+
+            if len(window) >= self.rate_limit:
+                return True
+
+            window.append(now)
+
+        return False
+
+    def call(self, method: str, params: dict) -> Any:
+        """
+        Calls the method, the result is the response or the error of the method.
+
+        :param method: The method.
+        :param params: Params of the call.
+        :return: Dict with the response or the error.
+        """
+
+        function = self._methods.get(method.lower())
+        if function is None:
+            return self.error(3, "Unknown method passed")
+
+        with self._lock:
+            self.calls[method.lower()] += 1
+            failed = self.error_rate and self._random.random() < self.error_rate
+
+        if failed:
+            return self.error(*self._random.choice([(6, "Too many requests per second"), (10, "Internal server error")]))
+
+        return {"response": function(params)}
+
+    def execute(self, params: dict) -> dict:
+        """
+        Executes the calls of the VKScript code "return [API.method({...}), ...];".
+
+        :param params: Params of the call.
+        :return: Dict with the response and the errors of the calls.
+        """
+
+        code = str(params.get("code", ""))
+        decoder = json.JSONDecoder()
+        results, errors = [], []
+        position = code.find("API.")
+
+        while position != -1:
+            start = code.index("(", position)
+            method = code[position + 4 : start]
+            arguments, end = decoder.raw_decode(code, start + 1)
+            result = self.call(method, {key: str(value) for key, value in arguments.items()})
+
+            if "error" in result:
+                results.append(False)
+                errors.append({**result["error"], "method": method})
+            else:
+                results.append(result["response"])
+
+            position = code.find("API.", end)
+
+        return {"response": results, "execute_errors": errors} if errors else {"response": results}
+
+    def handle(self, method: str, params: dict) -> dict:
+        """
+        Handles the request of the method.
+
+        :param method: The method from the URL.
+        :param params: Params of the request.
+        :return: The body of the response.
+        """
+
+        with self._lock:
+            self.requests += 1
+
+        if self.is_limited(str(params.get("access_token", ""))):
+            return self.error(6, "Too many requests per second")
+
+        if method.lower() == "execute":
+            return self.execute(params)
+
+        return self.call(method, params)
+
+
+class MockHTTPServer(ThreadingHTTPServer):
+    """
+    Threading HTTP server with a listen backlog for hundreds of concurrent connections(The default backlog of 5 drops the SYN packets,
+    and the clients wait for the retransmission for a second).
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class MockVKServer:
+    """
+    HTTP server of MockVK on a background thread.
+
+    Example:
+        with MockVKServer(latency=0.02) as server:
+            parser = ParserVK(tokens=["token"], api_url=server.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0, **kwargs: Any) -> None:
+        """
+        Initializes the server.
+
+        :param host: Host. Default: "127.0.0.1".
+        :param port: Port(0 for a free port). Default: 0.
+        :param latency: Delay of every response in seconds. Default: 0.0.
+        :param jitter: Maximum random addition to the delay in seconds. Default: 0.0.
+        :param kwargs: Params of MockVK(members, posts, friends, followers, rate_limit, error_rate, seed).
+        """
+
+        self.mock = MockVK(**kwargs)
+        self.latency = latency
+        self.jitter = jitter
+        self._server = MockHTTPServer((host, port), self._create_handler())
+        self._thread = None
+
+    def _create_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self.respond(dict(parse_qsl(urlsplit(self.path).query)))
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+                self.respond({**dict(parse_qsl(urlsplit(self.path).query)), **dict(parse_qsl(body))})
+
+            def respond(self, params: dict) -> None:
+                if server.latency or server.jitter:
+                    time.sleep(server.latency + random.random() * server.jitter)
+
+                method = urlsplit(self.path).path.rsplit("/", 1)[-1]
+                data = json.dumps(server.mock.handle(method, params)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    @property
+    def url(self) -> str:
+        """
+        Get the URL of the API for the api_url param of ParserVK.
+
+        :return: URL, e.g. "http://127.0.0.1:8080/method/".
+        """
+
+        host, port = self._server.server_address[:2]
+
+        return f"http://{host}:{port}/method/"
+
+    def start(self) -> "MockVKServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mockvk", daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockVKServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--members", type=int, default=10000)
+    parser.add_argument("--posts", type=int, default=1000)
+    args = parser.parse_args()
+
+    server = MockVKServer(
+        args.host,
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        error_rate=args.error_rate,
+        members=args.members,
+        posts=args.posts,
+    )
+    print(f"Mock VK API: {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,27 @@ from .constants import (
     EXCEPTIONS_LIST,
     EXCEPTIONS_DICT,
 )
-from .parservk import ParserVK, Users, Groups, Friends, Wall
+from .parservk import ParserVK, AsyncParserVK, Users, Groups, Friends, Wall, WallSync
 from .poolmanager import PoolManager
+from .executebatcher import ExecuteBatcher
+from .tokenscheduler import TokenBucket, TokenScheduler
+from .asynctransport import AsyncQuery, AsyncTransport
+from .transports import (
+    TRANSPORTS,
+    Transport,
+    RequestsTransport,
+    ThreadPoolTransport,
+    Urllib3Transport,
+    register_transport,
+    create_transport,
+)
+from .concurrency import ConcurrencyController
+from .retry import VKError, RetryPolicy, get_error_code, NETWORK_ERROR_CODE, CLIENT_ERROR_CODE
+from .response import StaticResponse, VKResponse
+from .cache import CacheBackend, MemoryCache, SQLiteCache, ResponseCache
+from .checkpoint import CheckpointStore
+from .metrics import DEFAULT_BUCKETS, Histogram, Metrics
+from .cassette import Cassette
 from .models import DataUsers, DataGroups, DataWall, DataFriends
 from .logger import _logger
 from .initmixin import InitMixin
@@ -16,7 +35,13 @@ from .utils import (
     submethods_from_class,
     multi_ids_from_class,
     method_from_class,
-    called_from
+    descriptors_from_class,
+    MethodDescriptor,
+    called_from,
+    task_url,
+    task_data,
+    task_api_method,
+    is_get_task
 )
 from .handlers.basehandler import BaseHandler
 from .handlers.handlers import Handlers
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from time import perf_counter
+from typing import Any, Optional
+
+from .response import StaticResponse
+
+
+class AsyncQuery:
+    """
+    A query for the asyncio transport.
+
+    ** Has the same shape as grequests.AsyncRequest (method, url, kwargs, session), so the pool can handle both the same way. **
+    """
+
+    def __init__(self, method: str, url: str, session: Any = None, **kwargs: Any) -> None:
+        """
+        Initializes the query.
+
+        :param method: HTTP method (POST or GET).
+        :param url: The URL of the server to which the query will be sent.
+        :param session: Not used, kept for compatibility with grequests.AsyncRequest.
+        :param kwargs: Arguments of the request (data, params, headers, proxy).
+        """
+
+        self.method = method
+        self.url = url
+        self.session = session
+        self.kwargs = kwargs
+        self.response = None
+        self.exception = None
+
+
+class AsyncTransport:
+    """
+    Transport sending the AsyncQuery tasks with aiohttp on the running event loop.
+    """
+
+    def __init__(self, limit: int = 100, timeout: Optional[float] = None) -> None:
+        """
+        Initializes the transport.
+
+        :param limit: Maximum number of simultaneous connections. Default: 100.
+        :param timeout: Total timeout of one request in seconds(Optional).
+        """
+
+        self.limit = limit
+        self.timeout = timeout
+        self._session = None
+
+    async def get_session(self) -> Any:
+        """
+        Get the aiohttp session, it is created on the first call inside the running event loop.
+
+        :return: aiohttp.ClientSession.
+        """
+
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+
+        return self._session
+
+    async def send(self, task: AsyncQuery) -> Optional[StaticResponse]:
+        """
+        Sends the task.
+
+        :param task: The task to send.
+        :return: StaticResponse or None if the request failed(The exception is saved in task.exception).
+        """
+
+        session = await self.get_session()
+        kwargs = dict(task.kwargs)
+        if "data" in kwargs:
+            kwargs["data"] = {key: str(value) for key, value in kwargs["data"].items()}
+
+        try:
+            start = perf_counter()
+            async with session.request(task.method, task.url, **kwargs) as response:
+                content = await response.read()
+
+            task.response = StaticResponse(
+                task.url,
+                content=content,
+                status_code=response.status,
+                data=task.kwargs.get("data"),
+                elapsed=timedelta(seconds=perf_counter() - start),
+            )
+        except Exception as e:
+            task.exception = e
+
+        return task.response
+
+    async def close(self) -> None:
+        """
+        Close the aiohttp session.
+        """
+
+        if not self._session is None:
+            await self._session.close()
+            self._session = None
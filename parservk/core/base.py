@@ -1,9 +1,18 @@
-import grequests
-from typing import Any, Union, Optional
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Callable, Container, Coroutine, Iterator, Union, Optional, TYPE_CHECKING
 from random import shuffle
 
 from .initmixin import InitMixin
-from .utils import called_from
+from .asynctransport import AsyncQuery
+from .retry import VKError
+from .response import VKResponse
+from .checkpoint import CheckpointStore
+from .utils import MethodDescriptor, called_from, task_data
+from .geventlib import load_grequests
+
+if TYPE_CHECKING:
+    import grequests
 
 class Base(InitMixin):
     """
@@ -51,7 +60,8 @@ class Base(InitMixin):
         elif type_query == "get":
             query = {
                 "url": url,
-                "params": params,
+                # The access token is stamped into the params, they are copied for each query
+                "params": dict(params),
                 "headers": headers,
                 "proxies": proxies,
             }
@@ -80,13 +90,44 @@ class Base(InitMixin):
         :return: A grequests.AsyncRequest object with the request parameters.
         """
 
+        grequests = load_grequests()
         if type_query == "post":
             if not len(data):
                 data = self.update_params(params=params, **headers, **proxies)
             return grequests.post(url, data=data, session=self.poolmanager.session)
 
         elif type_query == "get":
-            return grequests.get(url, params=params, headers=headers, proxies=proxies, session=self.poolmanager.session)
+            return grequests.get(url, params=dict(params), headers=headers, proxies=proxies, session=self.poolmanager.session)
+
+    def _create_asyncio_query(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] = {},
+        headers: dict[str, Any] = {},
+        proxies: dict[str, Any] = {},
+        data: dict[str, Any] = {},
+        type_query: str = "post",
+    ) -> AsyncQuery:
+        """
+        Creates a query for the asyncio transport.
+
+        :param url: The URL of the server to which the request will be sent.
+        :param params: The request parameters.
+        :param headers: The request headers.
+        :param proxies: The proxy servers for the request.
+        :param data: The request data.
+        :param type_query: The type of request (post or get). Default: post.
+        :return: An AsyncQuery object with the request parameters.
+        """
+
+        if type_query == "post":
+            if not len(data):
+                data = self.update_params(params=params, **headers, **proxies)
+            return AsyncQuery("POST", url, data=data)
+
+        elif type_query == "get":
+            return AsyncQuery("GET", url, params=dict(params), headers=headers, proxy=(proxies or {}).get("https"))
 
     def _create_query(
         self,
@@ -97,8 +138,8 @@ class Base(InitMixin):
         proxies: dict[str, Any] = {},
         data: dict[str, Any] = {},
         type_query: str = "post",
-        type_lib: str = "grequests",
-    ) -> Union[None, dict, grequests.AsyncRequest]:
+        type_lib: Optional[str] = None,
+    ) -> Union[None, dict, grequests.AsyncRequest, AsyncQuery]:
         """
         Creates a query to the server at the specified URL with the given parameters, headers, and data using the specified library.
 
@@ -108,11 +149,22 @@ class Base(InitMixin):
         :param proxies: The proxy servers for the query.
         :param data: The query data.
         :param type_query: The type of query (post or get). Default: post.
-        :param type_lib: The library to use for the query (grequests or requests). Default: grequests.
-        :return: A dictionary with the query parameters if using "requests", or a grequests.AsyncRequest object if using "grequests".
+        :param type_lib: The library to use for the query (grequests, asyncio or a transport from TRANSPORTS). Default: the transport of the parser.
+        :return: A grequests.AsyncRequest object if using "grequests", an AsyncQuery object if using "asyncio", otherwise a dictionary with the query parameters.
         """
 
-        if type_lib == "grequests":
+        type_lib = type_lib or self.type_lib
+
+        if type_lib == "asyncio":
+            return self._create_asyncio_query(
+                url,
+                params=params,
+                headers=headers,
+                proxies=proxies,
+                data=data,
+                type_query=type_query,
+            )
+        elif type_lib == "grequests":
             return self._create_grequests(
                 url,
                 params=params,
@@ -121,7 +173,7 @@ class Base(InitMixin):
                 data=data,
                 type_query=type_query,
             )
-        elif type_lib == "requests":
+        else:
             return self._create_requests(
                 url,
                 params=params,
@@ -131,6 +183,75 @@ class Base(InitMixin):
                 type_query=type_query,
             )
 
+    def _start(
+        self, querys: list, result_handler: Callable[[dict], Any], **kwargs: Any
+    ) -> Union[Any, Coroutine[Any, Any, Any]]:
+        """
+        Adds the querys to the pool, processes them and returns the handled result.
+
+        ** With the asyncio transport returns a coroutine, so the public submethods are awaitable. The errors of the call are published in parser.errors(See _check_errors). **
+
+        :param querys: A list of querys.
+        :param result_handler: A function that extracts the result of the submethod from the handlers results.
+        :param kwargs: Arguments for the handlers.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed.
+        :return: The result of result_handler or a coroutine returning it.
+        """
+
+        if self.type_lib == "asyncio":
+            return self._start_async(querys, result_handler, **kwargs)
+
+        self.handlers.errors.clear()
+        self.poolmanager.add(querys)
+        results = self.handlers.run(self.poolmanager, **kwargs)
+        self._flush_checkpoint(kwargs.get("checkpoint"))
+        self._check_errors()
+
+        return result_handler(results)
+
+    async def _start_async(self, querys: list, result_handler: Callable[[dict], Any], **kwargs: Any) -> Any:
+        """
+        Adds the querys to the pool, processes them and their subquerys on the event loop and returns the handled result.
+
+        :param querys: A list of querys.
+        :param result_handler: A function that extracts the result of the submethod from the handlers results.
+        :param kwargs: Arguments for the handlers.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed.
+        :return: The result of result_handler.
+        """
+
+        self.handlers.errors.clear()
+        self.poolmanager.add(querys)
+        results = await self.handlers.run_async(self.poolmanager, **kwargs)
+        self._flush_checkpoint(kwargs.get("checkpoint"))
+        self._check_errors()
+
+        return result_handler(results)
+
+    def _check_errors(self) -> None:
+        """
+        Publishes the errors of the call in parser.errors and raises the first of them if the raise_on_error param of the parser is set.
+
+        ** The errors are left after the retries, the failed requests add nothing to the result. **
+
+        :raises VKError: If the call has errors and the raise_on_error param is set.
+        """
+
+        errors = self.parser.errors = list(self.handlers.errors)
+        if errors and self.parser.raise_on_error:
+            raise errors[0]
+
+    @staticmethod
+    def _flush_checkpoint(checkpoint: Optional[CheckpointStore]) -> None:
+        """
+        Writes the pages buffered in the checkpoint store after the querys are processed.
+
+        :param checkpoint: Store of the finished pages(Optional).
+        """
+
+        if not checkpoint is None:
+            checkpoint.flush()
+
     def _paginate_querys(
         self,
         ids: Union[str, int, list[str, int]],
@@ -140,6 +261,7 @@ class Base(InitMixin):
         min: int,
         max: int,
         count: int,
+        skipped_offsets: Container[int] = (),
         **kwargs: Any,
     ) -> list:
         """
@@ -152,11 +274,39 @@ class Base(InitMixin):
         :param min: The minimum value for paginated query.
         :param max: The maximum value for paginated query.
         :param count: The number of elements per page.
+        :param skipped_offsets: Offsets of the pages that are already finished(Optional).
         :param kwargs: Additional parameters for the query.
         :return: A list of queries for paginated data retrieval.
         """
 
-        querys = []
+        return list(self._iter_paginate_querys(ids, method, submethod, params, min, max, count, skipped_offsets, **kwargs))
+
+    def _iter_paginate_querys(
+        self,
+        ids: Union[str, int, list[str, int]],
+        method: str,
+        submethod: str,
+        params: dict[str, Any],
+        min: int,
+        max: int,
+        count: int,
+        skipped_offsets: Container[int] = (),
+        **kwargs: Any,
+    ) -> Iterator:
+        """
+        Lazily creates queries for paginated data retrieval, a page query is created only when it is requested.
+
+        :param ids: A list of identifiers for the query.
+        :param method: The method for retrieving data.
+        :param submethod: The submethod for retrieving data.
+        :param params: The query parameters.
+        :param min: The minimum value for paginated query.
+        :param max: The maximum value for paginated query.
+        :param count: The number of elements per page.
+        :param skipped_offsets: Offsets of the pages that are already finished(Optional).
+        :param kwargs: Additional parameters for the query.
+        :return: A generator of queries for paginated data retrieval.
+        """
 
         if not isinstance(ids, list):
             
@@ -164,22 +314,227 @@ class Base(InitMixin):
 
         for offset in range(min, max, count):
 
-            url = self.get_data_from_method(method, submethod)[-1]
+            if offset in skipped_offsets:
+                continue
+
             params = params.copy()
             self._update_all(params=params, offset=offset)
-            querys.extend(self.get_querys_from_data(ids, params, method, submethod, **kwargs))
+            yield from self.get_querys_from_data(ids, params, method, submethod, **kwargs)
 
-        return querys
+    def _iter_pages(
+        self,
+        ids: list[str, int],
+        submethod: str,
+        params: dict[str, Any],
+        count: int,
+        offset: int,
+        max: Union[int, str],
+        multi_ids: str,
+        in_flight: int = 10,
+        pages: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        job: Optional[str] = None,
+    ) -> Union[Iterator, AsyncIterator]:
+        """
+        Streams a paginated submethod: the first page gives the total count, then the next pages are requested lazily.
+
+        ** With the asyncio transport returns an asynchronous generator.
+        With the checkpoint param every consumed page is recorded in the store and a resumed job requests only the missing pages,
+        the pages stored with items are yielded again without requests. **
+
+        :param ids: A list with one identifier.
+        :param submethod: The name of the section's submethod.
+        :param params: The query parameters.
+        :param count: The number of elements per page.
+        :param offset: Offset of the first page.
+        :param max: Maximum offset or "all".
+        :param multi_ids: The name of the ids param.
+        :param in_flight: Maximum number of pages in flight. Default: 10.
+        :param pages: Flag about yielding pages(lists of items) instead of items. Default: False.
+        :param checkpoint: Store of the finished pages(Optional).
+        :param job: Name of the job in the store(Optional, created from the query by default).
+        :return: A generator of items or pages.
+        """
+
+        first = self.get_querys_from_data(
+            ids, self._update_all(params=params.copy(), offset=offset), submethod=submethod, multi_ids=multi_ids
+        )
+        skipped, stored, total = (), {}, None
+
+        if not checkpoint is None:
+            job = job or checkpoint.create_key(self._NAME, submethod, ids[0], params)
+            skipped = checkpoint.get_offsets(job)
+            stored = checkpoint.get_pages(job) if checkpoint.store_items else {}
+            total = checkpoint.get_total(job)
+
+            if not total is None and offset in skipped:
+                first = []
+
+        rest = lambda total: self._iter_paginate_querys(
+            ids=ids,
+            method=self._NAME,
+            submethod=submethod,
+            params=params,
+            min=offset + count,
+            max=total if max == "all" else min(max, total),
+            count=count,
+            skipped_offsets=skipped,
+            multi_ids=multi_ids,
+        )
+        state = (stored, total, checkpoint, job)
+
+        if self.type_lib == "asyncio":
+            return self._iter_pages_async(first, rest, in_flight, pages, *state)
+
+        return self._iter_pages_sync(first, rest, in_flight, pages, *state)
+
+    def _iter_pages_sync(
+        self,
+        first: list,
+        rest: Callable[[int], Iterator],
+        in_flight: int,
+        pages: bool,
+        stored: dict[int, list] = {},
+        total: Optional[int] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        job: Optional[str] = None,
+    ) -> Iterator:
+        """
+        Synchronous implementation of _iter_pages.
+
+        :param first: A list with the query of the first page(Empty if the total count is known from the checkpoint).
+        :param rest: A function returning the generator of the next page querys by the total count.
+        :param in_flight: Maximum number of pages in flight.
+        :param pages: Flag about yielding pages instead of items.
+        :param stored: The items of the finished pages by offsets(Optional).
+        :param total: The total count from the checkpoint(Optional).
+        :param checkpoint: Store of the finished pages(Optional).
+        :param job: Name of the job in the store(Optional).
+        :return: A generator of items or pages.
+        """
+
+        for items in stored.values():
+            yield from self._unpack_page(items, pages)
+
+        for task, response in self.poolmanager.imap(first, in_flight):
+            data = self._get_response_data(response)
+            total = data["count"]
+            if not checkpoint is None:
+                checkpoint.set_total(job, total)
+
+            yield from self._unpack_page(data["items"], pages)
+            self._add_checkpoint_page(checkpoint, job, task, data["items"])
+
+        for task, page in self.poolmanager.imap(rest(total), in_flight):
+            items = self._get_response_data(page)["items"]
+            yield from self._unpack_page(items, pages)
+            self._add_checkpoint_page(checkpoint, job, task, items)
+
+        if not checkpoint is None:
+            checkpoint.finish(job)
+
+    async def _iter_pages_async(
+        self,
+        first: list,
+        rest: Callable[[int], Iterator],
+        in_flight: int,
+        pages: bool,
+        stored: dict[int, list] = {},
+        total: Optional[int] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        job: Optional[str] = None,
+    ) -> AsyncIterator:
+        """
+        Asynchronous implementation of _iter_pages.
+
+        :param first: A list with the query of the first page(Empty if the total count is known from the checkpoint).
+        :param rest: A function returning the generator of the next page querys by the total count.
+        :param in_flight: Maximum number of pages in flight.
+        :param pages: Flag about yielding pages instead of items.
+        :param stored: The items of the finished pages by offsets(Optional).
+        :param total: The total count from the checkpoint(Optional).
+        :param checkpoint: Store of the finished pages(Optional).
+        :param job: Name of the job in the store(Optional).
+        :return: An asynchronous generator of items or pages.
+        """
+
+        for items in stored.values():
+            for item in self._unpack_page(items, pages):
+                yield item
+
+        async for task, response in self.poolmanager.imap_async(first, in_flight):
+            data = self._get_response_data(response)
+            total = data["count"]
+            if not checkpoint is None:
+                checkpoint.set_total(job, total)
+
+            for item in self._unpack_page(data["items"], pages):
+                yield item
+            self._add_checkpoint_page(checkpoint, job, task, data["items"])
+
+        async for task, page in self.poolmanager.imap_async(rest(total), in_flight):
+            items = self._get_response_data(page)["items"]
+            for item in self._unpack_page(items, pages):
+                yield item
+            self._add_checkpoint_page(checkpoint, job, task, items)
+
+        if not checkpoint is None:
+            checkpoint.finish(job)
+
+    @staticmethod
+    def _add_checkpoint_page(checkpoint: Optional[CheckpointStore], job: str, task: Any, items: list) -> None:
+        """
+        Records the consumed page in the checkpoint store.
+
+        :param checkpoint: Store of the finished pages(Nothing is recorded if it is None).
+        :param job: Name of the job in the store.
+        :param task: The query of the page.
+        :param items: The items of the page.
+        """
+
+        if not checkpoint is None:
+            checkpoint.add_page(job, int(task_data(task)["offset"]), items)
+
+    @staticmethod
+    def _unpack_page(items: list, pages: bool) -> list:
+        """
+        Returns the items of the page or the page itself.
+
+        :param items: The items of the page.
+        :param pages: Flag about yielding pages instead of items.
+        :return: A list of items or a list with one page.
+        """
+
+        return [items] if pages else items
+
+    @staticmethod
+    def _get_response_data(response: Any) -> Any:
+        """
+        Returns the "response" part of the result of the query.
+
+        :param response: The result of the query.
+        :raises VKError: If the query failed.
+        :return: The data of the response.
+        """
+
+        response = VKResponse.wrap(response)
+        if not response.is_valid():
+            raise VKError.from_response(response)
+
+        return response.data
 
     def _update_access_token(self, params: dict) -> dict:
         """
         Updates the access token and returns the updated parameters.
 
+        ** The tokens are taken in turn(round-robin), so several tokens share the requests even if the rate limit is disabled.
+        With the rate limit the TokenScheduler stamps the token again when the task is dispatched. **
+
         :param params: A dictionary of parameters.
         :return: The updated parameters with a new access token.
         """
 
-        return self.update_params(params=params, access_token=list(self.tokens)[0])
+        return self.update_params(params=params, access_token=next(self._tokens_cycle))
 
     @staticmethod
     def update_params(params: dict, **kwargs: Any) -> dict:
@@ -225,7 +580,7 @@ class Base(InitMixin):
         for partial_ids in ids:
 
             self._update_all(params=params, **self.headers, **{multi_ids: partial_ids})
-            querys.append(self._create_query(url, data=params))
+            querys.append(self._create_query(url, data=params.copy()))
 
         return querys
 
@@ -344,29 +699,55 @@ class Base(InitMixin):
         """
         Generates a list of queries for data retrieval from the API based on input parameters.
 
+        ** If the response cache is set, the cached ids are grouped into separate queries that are resolved locally by the pool.
+        The URL, the default ids param and the limits are taken from the precomputed descriptor of the submethod(See get_descriptor). **
+
         :param ids: Identifiers for which the requests will be sent.
         :param params: Parameters to be added to the query.
         :param method: Section API VK(Users, Groups, ...)(Optional).
-        :param submethod: The name of the section's submethod(Optional).
+        :param submethod: The name of the section's submethod(Optional, the name of the calling function by default).
         :param kwargs: Additional parameters for the query (multi_ids).
         :return: A list of querys.
         """
         
         
-        method = method or self._NAME
-        submethod = submethod or called_from(True)
-        data_method = self.get_data_from_method(method.upper(), submethod)
-        multi_ids = kwargs.get("multi_ids", data_method[0]["multi_ids"][0])
-        limits_per_category = self._limits_per_category[method.upper()].get(multi_ids, 1)
+        descriptor = self.get_descriptor(method or self._NAME, submethod or called_from(True))
+        multi_ids = kwargs.get("multi_ids", descriptor.multi_ids)
+        limits_per_category = descriptor.limits.get(multi_ids, 1)
+        cached_ids = ()
+
+        if not self.parser.response_cache is None and self.parser.response_cache.is_cacheable(descriptor.url):
+            cached_ids, ids = self.parser.response_cache.lookup(descriptor.url, params, ids)
+
+        return [
+            query
+            for part_ids in (cached_ids, ids)
+            if part_ids
+            for query in self._format_ids(
+                ids=part_ids,
+                max_ids_per_group=limits_per_category,
+                callable_func=self._get_querys_from_ids,
+                url=descriptor.url,
+                params=params.copy(),
+                multi_ids=multi_ids,
+            )
+        ]
 
-        return self._format_ids(
-            ids=ids,
-            max_ids_per_group=limits_per_category,
-            callable_func=self._get_querys_from_ids,
-            url=data_method[-1],
-            params=params.copy(),
-            multi_ids=multi_ids,
-        )
+    def get_descriptor(self, method: str, submethod: str) -> MethodDescriptor:
+        """
+        Get the precomputed descriptor of the submethod.
+
+        :param method: Section API VK(Users, Groups, ...).
+        :param submethod: The name of the section's submethod.
+        :raises ValueError: If the method or the submethod is not valid.
+        :return: MethodDescriptor with the URL, the default ids param and the limits of the submethod.
+        """
+
+        descriptor = self._descriptors.get((method.upper(), submethod.lower()))
+        if descriptor is None:
+            raise ValueError("Method is not valid.")
+
+        return descriptor
 
     def get_data_from_method(self, method: str, submethod: str) -> tuple[dict, str]:
         """
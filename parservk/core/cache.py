@@ -0,0 +1,392 @@
+import time
+import sqlite3
+import hashlib
+import threading
+
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+from . import jsonlib
+from .response import StaticResponse, VKResponse
+from .utils import task_url, task_data
+
+
+class CacheBackend:
+    """
+    Base class of the storages of the response cache.
+
+    ** A backend stores decoded records by string keys, each record expires after its ttl. **
+    """
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Get the records that are stored and not expired.
+
+        :param keys: Keys of the records.
+        :return: Dict where keys are the found keys and values are the records.
+        """
+
+        raise NotImplementedError
+
+    def set_many(self, records: dict[str, Any], ttl: float) -> None:
+        """
+        Store the records.
+
+        :param records: Dict where keys are the keys and values are the records.
+        :param ttl: Time to live of the records in seconds.
+        """
+
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Remove all records.
+        """
+
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-memory backend with LRU eviction.
+    """
+
+    def __init__(self, maxsize: int = 100000, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes the backend.
+
+        :param maxsize: Maximum number of records, the least recently used records are evicted. Default: 100000.
+        :param clock: Function returning the current time in seconds. Default: time.monotonic.
+        :raises ValueError: If maxsize is not positive.
+        """
+
+        if maxsize <= 0:
+            raise ValueError("The maxsize must be positive.")
+
+        self.maxsize = maxsize
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._records = OrderedDict()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        found = {}
+        now = self.clock()
+
+        with self._lock:
+            for key in keys:
+                entry = self._records.get(key)
+                if entry is None:
+                    continue
+
+                if entry[0] <= now:
+                    del self._records[key]
+                    continue
+
+                self._records.move_to_end(key)
+                found[key] = entry[1]
+
+        return found
+
+    def set_many(self, records: dict[str, Any], ttl: float) -> None:
+        expires = self.clock() + ttl
+
+        with self._lock:
+            for key, record in records.items():
+                self._records[key] = (expires, record)
+                self._records.move_to_end(key)
+
+            while len(self._records) > self.maxsize:
+                self._records.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    On-disk backend storing the records in a SQLite database, the records survive restarts.
+    """
+
+    MAX_VARIABLES = 500
+
+    def __init__(self, path: str = "parservk_cache.sqlite3", clock: Callable[[], float] = time.time) -> None:
+        """
+        Initializes the backend.
+
+        :param path: Path to the database file(":memory:" for a temporary database). Default: parservk_cache.sqlite3.
+        :param clock: Function returning the current time in seconds, must be the wall clock. Default: time.time.
+        """
+
+        self.path = path
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+        )
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        found = {}
+        now = self.clock()
+
+        with self._lock:
+            for step in range(0, len(keys), self.MAX_VARIABLES):
+                chunk = keys[step : step + self.MAX_VARIABLES]
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM responses WHERE expires > ? AND key IN ({', '.join('?' * len(chunk))})",
+                    (now, *chunk),
+                )
+                found.update((key, jsonlib.loads(value)) for key, value in rows)
+
+        return found
+
+    def set_many(self, records: dict[str, Any], ttl: float) -> None:
+        expires = self.clock() + ttl
+
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+                [(key, jsonlib.dumps(record), expires) for key, record in records.items()],
+            )
+
+    def purge(self) -> int:
+        """
+        Remove the expired records.
+
+        :return: The number of removed records.
+        """
+
+        with self._lock:
+            return self._connection.execute("DELETE FROM responses WHERE expires <= ?", (self.clock(),)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+
+        self._connection.close()
+
+
+class ResponseCache:
+    """
+    Cache of the records returned by the VK API methods that fetch objects by ids(users.get, groups.getById).
+
+    ** The records are stored one per id under the key of the method, the normalized params(The access token and headers are excluded) and the id.
+    The queries of the ids that are all cached are resolved locally without sending them.
+    The records found by lookup are kept until their queries are resolved, so the backend is read once per id. **
+    """
+
+    DEFAULT_TTL = {"users.get": 3600.0, "groups.getbyid": 3600.0}
+    IDS_PARAMS = {"users.get": "user_ids", "groups.getbyid": "group_ids"}
+    SERVICE_PARAMS = ("access_token",)
+    # Maximum number of the keys kept by lookup for resolve(The keys of the queries that are never sent), the dropped keys are read from the backend again
+    MAX_LOOKED_UP = 100000
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[dict[str, float]] = None,
+        excluded_params: Iterable[str] = (),
+    ) -> None:
+        """
+        Initializes the cache.
+
+        :param backend: Storage of the records(Optional, MemoryCache by default).
+        :param ttl: Time to live in seconds by method, e.g. {"users.get": 600}(Overrides DEFAULT_TTL, 0 disables caching of the method).
+        :param excluded_params: Params that are not part of the key(For example, headers).
+        """
+
+        self.backend = MemoryCache() if backend is None else backend
+        self.ttl = {**self.DEFAULT_TTL, **{method.lower(): value for method, value in (ttl or {}).items()}}
+        self.excluded_params = set(self.SERVICE_PARAMS) | set(excluded_params)
+        self._stats = {"hits": 0, "misses": 0, "resolved": 0, "stored": 0}
+        self._looked_up = {}
+
+    @staticmethod
+    def get_method(url: str) -> str:
+        """
+        Get the VK API method from the URL.
+
+        :param url: The URL of the query.
+        :return: Method in lower case, e.g. "users.get".
+        """
+
+        return url.rsplit("/", 1)[-1].lower()
+
+    def is_cacheable(self, url: str) -> bool:
+        """
+        Check if the records of the method are cached.
+
+        :param url: The URL of the query.
+        :return: True if the method is cached, False otherwise.
+        """
+
+        method = self.get_method(url)
+
+        return method in self.IDS_PARAMS and self.ttl.get(method, 0) > 0
+
+    def create_key(self, method: str, params: dict[str, Any], id: Any) -> str:
+        """
+        Creates the key of the record.
+
+        :param method: Method in lower case.
+        :param params: Params of the query.
+        :param id: Id of the record.
+        :return: Key, e.g. "users.get:1a2b3c4d5e6f7a8b:1".
+        """
+
+        ids_param = self.IDS_PARAMS[method]
+        excluded = self.excluded_params | {ids_param, ids_param[:-1]}
+        normalized = sorted((str(key), str(value)) for key, value in params.items() if not key in excluded)
+        digest = hashlib.sha1(repr(normalized).encode()).hexdigest()[:16]
+
+        return f"{method}:{digest}:{id}"
+
+    def lookup(self, url: str, params: dict[str, Any], ids: list[Any]) -> tuple[list, list]:
+        """
+        Splits the ids into cached and not cached.
+
+        ** The found records and the missed keys are kept for resolve, so the queries of these ids are not looked up in the backend again. **
+
+        :param url: The URL of the query.
+        :param params: Params of the query.
+        :param ids: Ids of the query.
+        :return: A tuple containing the cached ids and the ids that must be requested.
+        """
+
+        method = self.get_method(url)
+        keys = [self.create_key(method, params, id) for id in ids]
+        found = self.backend.get_many(keys)
+        if len(self._looked_up) + len(keys) > self.MAX_LOOKED_UP:
+            self._looked_up.clear()
+        self._looked_up.update((key, found.get(key)) for key in keys)
+        hits = [id for id, key in zip(ids, keys) if key in found]
+        misses = [id for id, key in zip(ids, keys) if not key in found]
+        self._stats["hits"] += len(hits)
+        self._stats["misses"] += len(misses)
+
+        return hits, misses
+
+    def resolve(self, tasks: list) -> tuple[list, list[int]]:
+        """
+        Resolves the tasks whose ids are all cached.
+
+        :param tasks: A list of tasks.
+        :return: A tuple containing the list of responses(None for the tasks that must be sent) and the indexes of the tasks that must be sent.
+        """
+
+        results = [None] * len(tasks)
+        indexes = []
+
+        for index, task in enumerate(tasks):
+            records = self._get_records(task)
+            if records is None:
+                indexes.append(index)
+                continue
+
+            results[index] = StaticResponse(task_url(task), {"response": records}, data=task_data(task))
+            self._stats["resolved"] += 1
+
+        return results, indexes
+
+    def store(self, tasks: list, results: list) -> list:
+        """
+        Stores the records of the successful responses of the cached methods.
+
+        :param tasks: A list of tasks.
+        :param results: A list of responses of the tasks.
+        :return: A list of responses, the responses of the cached methods are wrapped into VKResponse(Decoded once).
+        """
+
+        stored = []
+        for task, result in zip(tasks, results):
+            url = task_url(task)
+            if result is None or not self.is_cacheable(url):
+                stored.append(result)
+                continue
+
+            result = VKResponse.wrap(result)
+            if result.is_valid() and isinstance(result.data, list):
+                method = self.get_method(url)
+                data = task_data(task)
+                records = {self.create_key(method, data, record["id"]): record for record in result.data if "id" in record}
+                self.backend.set_many(records, self.ttl[method])
+                self._stats["stored"] += len(records)
+
+            stored.append(result)
+
+        return stored
+
+    def clear(self) -> None:
+        """
+        Remove all records.
+        """
+
+        self.backend.clear()
+
+    def _get_records(self, task: Any) -> Optional[list]:
+        """
+        Get the cached records of all ids of the task.
+
+        ** The records kept by lookup are taken first, only the other keys are read from the backend. **
+
+        :param task: Pool task.
+        :return: A list of records in order of the ids or None if the task is not cached or at least one id is missing.
+        """
+
+        url = task_url(task)
+        if not self.is_cacheable(url):
+            return None
+
+        method = self.get_method(url)
+        ids_param = self.IDS_PARAMS[method]
+        data = task_data(task)
+        ids = data.get(ids_param, data.get(ids_param[:-1]))
+        if ids is None:
+            return None
+
+        ids = [id.strip() for id in str(ids).split(",") if id.strip()]
+        keys = [self.create_key(method, data, id) for id in ids]
+        found, unknown, missed = {}, [], False
+        for key in keys:
+            if not key in self._looked_up:
+                unknown.append(key)
+                continue
+
+            # None is the key missed by lookup
+            record = self._looked_up.pop(key)
+            if record is None:
+                missed = True
+            else:
+                found[key] = record
+
+        if missed:
+            return None
+
+        if unknown:
+            found.update(self.backend.get_many(unknown))
+
+        if not ids or len(found) < len(keys):
+            return None
+
+        return [found[key] for key in keys]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get the statistics of the cache.
+
+        :return: Dict with the number of hit and missed ids, resolved tasks and stored records.
+        """
+
+        return dict(self._stats)
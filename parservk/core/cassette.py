@@ -0,0 +1,262 @@
+import gzip
+import hashlib
+import threading
+
+from collections import defaultdict, deque
+from datetime import timedelta
+from typing import Any, Iterable, Iterator, Optional
+
+from . import jsonlib
+from .response import StaticResponse
+from .utils import task_url, task_data, task_api_method
+
+
+class Cassette:
+    """
+    Recording of the VK API requests and responses for replaying a crawl offline.
+
+    ** The cassette is a gzip-compressed file with one JSON entry per HTTP request: the method, the params without the access token,
+    the status, the body and the elapsed time of the response. The access tokens are removed from the params and scrubbed from the bodies.
+    On replay the responses are matched by the method and params(Requests with the same params are served in the recorded order),
+    the original timing is reproduced with the elapsed times multiplied by time_scale. **
+
+    Example:
+        parser = ParserVK(tokens=[...], cassette="record", cassette_path="members.cassette")
+        parser.groups.getMembers(group_id=1)
+        parser.request_cassette.close()
+
+        parser = ParserVK(tokens=["offline"], rate_limit=None, cassette="replay", cassette_path="members.cassette", cassette_time_scale=0)
+        parser.groups.getMembers(group_id=1)
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+    FORMAT = "parservk-cassette"
+    VERSION = 1
+    SERVICE_PARAMS = ("access_token",)
+    SCRUBBED = "***"
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        time_scale: float = 1.0,
+        strict: bool = True,
+        excluded_params: Iterable[str] = (),
+    ) -> None:
+        """
+        Initializes the cassette, the file is created in the record mode and loaded in the replay mode.
+
+        :param path: Path to the cassette file.
+        :param mode: record or replay. Default: replay.
+        :param time_scale: Multiplier of the recorded elapsed times on replay(0 replays without delays). Default: 1.0.
+        :param strict: Flag about raising LookupError on replay if the request was not recorded(Otherwise the request fails like a network error). Default: True.
+        :param excluded_params: Params that are not part of the key(For example, headers).
+        :raises ValueError: If the mode is not valid, time_scale is negative or the file is not a cassette.
+        """
+
+        if not mode in (self.RECORD, self.REPLAY):
+            raise ValueError(f"The mode must be {self.RECORD} or {self.REPLAY}, not {mode}")
+
+        if time_scale < 0:
+            raise ValueError("The time_scale must not be negative.")
+
+        self.path = path
+        self.mode = mode
+        self.time_scale = time_scale
+        self.strict = strict
+        self.excluded_params = set(self.SERVICE_PARAMS) | set(excluded_params)
+        self._lock = threading.Lock()
+        self._tokens = set()
+        self._entries = defaultdict(deque)
+        self._last = {}
+        self._stats = {"recorded": 0, "replayed": 0, "missed": 0}
+        self._file = None
+
+        if self.is_replay():
+            self._load()
+        else:
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+            self._write({"format": self.FORMAT, "version": self.VERSION})
+
+    def is_replay(self) -> bool:
+        """
+        Check if the responses are served from the cassette.
+
+        :return: True in the replay mode, False in the record mode.
+        """
+
+        return self.mode == self.REPLAY
+
+    def create_key(self, method: str, params: dict[str, Any]) -> str:
+        """
+        Creates the key of the request.
+
+        :param method: VK API method, e.g. "groups.getMembers".
+        :param params: Params of the request.
+        :return: Key, e.g. "groups.getmembers:1a2b3c4d5e6f7a8b".
+        """
+
+        normalized = sorted((str(key), str(value)) for key, value in params.items() if not key in self.excluded_params)
+        digest = hashlib.sha1(repr(normalized).encode()).hexdigest()[:16]
+
+        return f"{method.lower()}:{digest}"
+
+    def record(self, tasks: list, responses: list) -> list:
+        """
+        Writes the requests and their responses to the cassette.
+
+        :param tasks: A list of sent tasks.
+        :param responses: A list of responses of the tasks(None for the failed tasks).
+        :return: The same responses.
+        """
+
+        with self._lock:
+            for task, response in zip(tasks, responses):
+                self._write(self._create_entry(task, response))
+                self._stats["recorded"] += 1
+
+            self._file.flush()
+
+        return responses
+
+    def play(self, task: Any) -> Optional[StaticResponse]:
+        """
+        Get the recorded response of the task.
+
+        ** The last response of the key is repeated when the recorded ones are exhausted(For example, when the replay retries more often). **
+
+        :param task: The task.
+        :raises LookupError: If the request was not recorded and the cassette is strict.
+        :return: StaticResponse with the recorded status, body and scaled elapsed time or None if the recorded request failed.
+        """
+
+        key = self.create_key(task_api_method(task), task_data(task))
+        with self._lock:
+            entries = self._entries.get(key)
+            entry = entries.popleft() if entries else self._last.get(key)
+            if entry is None:
+                self._stats["missed"] += 1
+                if self.strict:
+                    raise LookupError(f"The request {task_api_method(task)} with the key {key} was not recorded in {self.path}")
+
+                return None
+
+            self._last[key] = entry
+            self._stats["replayed"] += 1
+
+        if entry["status"] is None:
+            return None
+
+        return StaticResponse(
+            task_url(task),
+            content=entry["body"].encode(),
+            status_code=entry["status"],
+            data=task_data(task),
+            elapsed=timedelta(seconds=entry["elapsed"] * self.time_scale),
+        )
+
+    @staticmethod
+    def delay(responses: Iterable[Optional[StaticResponse]]) -> float:
+        """
+        Get the time the concurrently sent requests took.
+
+        :param responses: Replayed responses.
+        :return: The longest elapsed time in seconds, 0.0 if there are no responses.
+        """
+
+        return max((response.elapsed.total_seconds() for response in responses if not response is None), default=0.0)
+
+    def _create_entry(self, task: Any, response: Any) -> dict[str, Any]:
+        """
+        Creates the entry of the request, the access tokens are scrubbed.
+
+        :param task: The sent task.
+        :param response: The response of the task(None if the task failed).
+        :return: Dict with the key, the method, the params, the status, the elapsed time and the body.
+        """
+
+        method = task_api_method(task)
+        data = task_data(task)
+        token = data.get("access_token")
+        if token:
+            self._tokens.add(str(token))
+
+        entry = {
+            "key": self.create_key(method, data),
+            "method": method,
+            "params": {key: value for key, value in data.items() if not key in self.excluded_params},
+            "status": None,
+            "elapsed": 0.0,
+            "body": None,
+        }
+        if response is None:
+            return entry
+
+        body = response.content.decode("utf-8", "replace")
+        for token in self._tokens:
+            body = body.replace(token, self.SCRUBBED)
+
+        entry.update(status=response.status_code, elapsed=response.elapsed.total_seconds(), body=body)
+
+        return entry
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        self._file.write(jsonlib.dumps(entry).decode())
+        self._file.write("\n")
+
+    def _load(self) -> None:
+        """
+        Loads the entries of the cassette.
+
+        :raises ValueError: If the file is not a cassette.
+        """
+
+        entries = self._read()
+        header = next(entries, None)
+        if not isinstance(header, dict) or header.get("format") != self.FORMAT:
+            raise ValueError(f"The file {self.path} is not a cassette")
+
+        for entry in entries:
+            self._entries[entry["key"]].append(entry)
+
+    def _read(self) -> Iterator[dict[str, Any]]:
+        """
+        Reads the entries of the cassette, the tail of a cassette that was not closed is skipped.
+
+        :return: A generator of entries.
+        """
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            try:
+                for line in file:
+                    if line.endswith("\n"):
+                        yield jsonlib.loads(line)
+            except EOFError:
+                return
+
+    def close(self) -> None:
+        """
+        Close the file of the cassette in the record mode.
+        """
+
+        with self._lock:
+            if not self._file is None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get the statistics of the cassette.
+
+        :return: Dict with the number of recorded, replayed and missed requests.
+        """
+
+        return dict(self._stats)
@@ -0,0 +1,248 @@
+import time
+import sqlite3
+import hashlib
+import threading
+
+from typing import Any, Callable, Optional
+
+from . import jsonlib
+
+
+class CheckpointStore:
+    """
+    Durable state of long-running crawls in a SQLite database.
+
+    ** A job records its total count, the finished pages(Offsets and optionally items) and an arbitrary state(For example, the frontier of a graph crawl).
+    The finished pages are buffered and written in one transaction every `interval` pages or `interval_time` seconds, so a crash loses at most one interval. **
+    """
+
+    def __init__(
+        self,
+        path: str = "parservk_checkpoints.sqlite3",
+        interval: int = 10,
+        interval_time: float = 5.0,
+        store_items: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes the store.
+
+        :param path: Path to the database file(":memory:" for a temporary database). Default: parservk_checkpoints.sqlite3.
+        :param interval: Number of finished pages after which the buffer is written. Default: 10.
+        :param interval_time: Seconds after which the buffer is written. Default: 5.0.
+        :param store_items: Flag about storing the items of the pages, so a resumed job can replay them without requests. Default: False.
+        :param clock: Function returning the current time in seconds. Default: time.monotonic.
+        """
+
+        self.path = path
+        self.interval = interval
+        self.interval_time = interval_time
+        self.store_items = store_items
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._buffer = []
+        self._flushed = clock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs (job TEXT PRIMARY KEY, total INTEGER, state BLOB, finished INTEGER NOT NULL DEFAULT 0, updated REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pages (job TEXT NOT NULL, start INTEGER NOT NULL, items BLOB, PRIMARY KEY (job, start))"
+        )
+
+    @staticmethod
+    def create_key(method: str, submethod: str, id: Any, params: dict[str, Any]) -> str:
+        """
+        Creates the name of the job from the query.
+
+        :param method: Section API VK(Users, Groups, ...).
+        :param submethod: The name of the section's submethod.
+        :param id: Identifier of the query(Group id, owner id, ...).
+        :param params: The query parameters(The access token and offset are excluded).
+        :return: Name of the job, e.g. "groups.getmembers:1:1a2b3c4d5e6f7a8b".
+        """
+
+        normalized = sorted((str(key), str(value)) for key, value in params.items() if not key in ("access_token", "offset"))
+        digest = hashlib.sha1(repr(normalized).encode()).hexdigest()[:16]
+
+        return f"{method.lower()}.{submethod.lower()}:{id}:{digest}"
+
+    def _upsert_job(self, job: str, **values: Any) -> None:
+        """
+        Creates the job or updates its columns.
+
+        :param job: Name of the job.
+        :param values: Columns to update(total, state, finished).
+        """
+
+        self._connection.execute("INSERT OR IGNORE INTO jobs (job, updated) VALUES (?, ?)", (job, time.time()))
+        for column, value in values.items():
+            self._connection.execute(f"UPDATE jobs SET {column} = ?, updated = ? WHERE job = ?", (value, time.time(), job))
+
+    def get_total(self, job: str) -> Optional[int]:
+        """
+        Get the total count of the items of the job.
+
+        :param job: Name of the job.
+        :return: The total count or None if the job is not started.
+        """
+
+        with self._lock:
+            row = self._connection.execute("SELECT total FROM jobs WHERE job = ?", (job,)).fetchone()
+
+        return None if row is None else row[0]
+
+    def set_total(self, job: str, total: int) -> None:
+        """
+        Set the total count of the items of the job.
+
+        :param job: Name of the job.
+        :param total: The total count.
+        """
+
+        with self._lock:
+            self._upsert_job(job, total=total)
+
+    def get_offsets(self, job: str) -> set[int]:
+        """
+        Get the offsets of the finished pages.
+
+        :param job: Name of the job.
+        :return: A set of offsets.
+        """
+
+        self.flush()
+        with self._lock:
+            rows = self._connection.execute("SELECT start FROM pages WHERE job = ?", (job,))
+
+            return {row[0] for row in rows}
+
+    def get_pages(self, job: str) -> dict[int, list]:
+        """
+        Get the stored items of the finished pages.
+
+        :param job: Name of the job.
+        :return: Dict where keys are the offsets and values are the items(Only the pages stored with items).
+        """
+
+        self.flush()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT start, items FROM pages WHERE job = ? AND items IS NOT NULL ORDER BY start", (job,)
+            )
+
+            return {offset: jsonlib.loads(items) for offset, items in rows}
+
+    def add_page(self, job: str, offset: int, items: Optional[list] = None) -> None:
+        """
+        Records the finished page, the buffer is written when the interval is reached.
+
+        :param job: Name of the job.
+        :param offset: Offset of the page.
+        :param items: Items of the page(Stored only if store_items is set).
+        """
+
+        with self._lock:
+            self._buffer.append((job, offset, jsonlib.dumps(items) if self.store_items and not items is None else None))
+
+            if len(self._buffer) >= self.interval or self.clock() - self._flushed >= self.interval_time:
+                self.flush()
+
+    def get_state(self, job: str) -> Any:
+        """
+        Get the state of the job.
+
+        :param job: Name of the job.
+        :return: The decoded state or None if it is not set.
+        """
+
+        with self._lock:
+            row = self._connection.execute("SELECT state FROM jobs WHERE job = ?", (job,)).fetchone()
+
+        return None if row is None or row[0] is None else jsonlib.loads(row[0])
+
+    def set_state(self, job: str, state: Any) -> None:
+        """
+        Set the state of the job, the buffered pages are written in the same transaction.
+
+        :param job: Name of the job.
+        :param state: The state(Must be JSON serializable).
+        """
+
+        with self._lock:
+            self.flush(state={job: jsonlib.dumps(state)})
+
+    def flush(self, state: Optional[dict[str, bytes]] = None) -> None:
+        """
+        Write the buffered pages.
+
+        :param state: Encoded states of the jobs to write in the same transaction(Optional).
+        """
+
+        with self._lock:
+            if not self._buffer and not state:
+                return
+
+            self._connection.execute("BEGIN")
+            try:
+                for job in {page[0] for page in self._buffer}:
+                    self._upsert_job(job)
+
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO pages (job, start, items) VALUES (?, ?, ?)", self._buffer
+                )
+                for job, value in (state or {}).items():
+                    self._upsert_job(job, state=value)
+
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+
+            self._buffer.clear()
+            self._flushed = self.clock()
+
+    def finish(self, job: str) -> None:
+        """
+        Marks the job as finished.
+
+        :param job: Name of the job.
+        """
+
+        with self._lock:
+            self.flush()
+            self._upsert_job(job, finished=1)
+
+    def is_finished(self, job: str) -> bool:
+        """
+        Check if the job is finished.
+
+        :param job: Name of the job.
+        :return: True if the job is finished, False otherwise.
+        """
+
+        with self._lock:
+            row = self._connection.execute("SELECT finished FROM jobs WHERE job = ?", (job,)).fetchone()
+
+        return bool(row and row[0])
+
+    def delete(self, job: str) -> None:
+        """
+        Removes the job and its pages, so the next run starts from the beginning.
+
+        :param job: Name of the job.
+        """
+
+        with self._lock:
+            self._buffer = [page for page in self._buffer if not page[0] == job]
+            self._connection.execute("DELETE FROM pages WHERE job = ?", (job,))
+            self._connection.execute("DELETE FROM jobs WHERE job = ?", (job,))
+
+    def close(self) -> None:
+        """
+        Write the buffered pages and close the connection to the database.
+        """
+
+        self.flush()
+        self._connection.close()
@@ -0,0 +1,122 @@
+from typing import Any
+
+from .retry import get_error_code
+
+
+class ConcurrencyController:
+    """
+    Controller of the number of requests in flight, the window is adapted with AIMD (additive increase, multiplicative decrease).
+
+    ** The window grows by `increase` after each wave without overload and is multiplied by `decrease` when the error rate or the latency of the wave exceeds the limits. **
+    """
+
+    OVERLOAD_ERROR_CODES = (6, 9, 10, 29)
+
+    def __init__(
+        self,
+        initial: int = 10,
+        minimum: int = 1,
+        maximum: int = 100,
+        increase: int = 1,
+        decrease: float = 0.5,
+        latency_target: float = 2.0,
+        error_threshold: float = 0.05,
+    ) -> None:
+        """
+        Initializes the controller.
+
+        :param initial: Initial window. Default: 10.
+        :param minimum: Minimum window. Default: 1.
+        :param maximum: Maximum window. Default: 100.
+        :param increase: Additive increase of the window after a wave without overload. Default: 1.
+        :param decrease: Multiplicative decrease of the window after an overloaded wave. Default: 0.5.
+        :param latency_target: Mean latency of a wave in seconds above which the wave is overloaded. Default: 2.0.
+        :param error_threshold: Share of failed requests in a wave above which the wave is overloaded. Default: 0.05.
+        :raises ValueError: If the limits of the window are not valid.
+        """
+
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("The window limits must satisfy 1 <= minimum <= initial <= maximum.")
+
+        if not 0 < decrease < 1:
+            raise ValueError("The decrease must be in the range from 0 to 1.")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+        self._window = initial
+        self._stats = {
+            "requests": 0,
+            "errors": 0,
+            "waves": 0,
+            "increases": 0,
+            "decreases": 0,
+            "last_latency": 0.0,
+            "last_error_rate": 0.0,
+        }
+
+    def is_overloaded(self, response: Any) -> bool:
+        """
+        Check if the response signals the overload (request failed or VK returned a rate limit error).
+
+        :param response: The response.
+        :return: True if the response signals the overload, False otherwise.
+        """
+
+        error_code = get_error_code(response)
+
+        return error_code == 0 or error_code in self.OVERLOAD_ERROR_CODES
+
+    def observe(self, responses: list) -> int:
+        """
+        Record the responses of a wave and adapt the window.
+
+        :param responses: The responses of the wave.
+        :return: The new window.
+        """
+
+        if not responses:
+            return self._window
+
+        errors = sum(self.is_overloaded(response) for response in responses)
+        latencies = [response.elapsed.total_seconds() for response in responses if not response is None]
+        latency = sum(latencies) / len(latencies) if latencies else 0.0
+        error_rate = errors / len(responses)
+
+        self._stats["requests"] += len(responses)
+        self._stats["errors"] += errors
+        self._stats["waves"] += 1
+        self._stats["last_latency"] = latency
+        self._stats["last_error_rate"] = error_rate
+
+        if error_rate > self.error_threshold or latency > self.latency_target:
+            self._window = max(self.minimum, int(self._window * self.decrease))
+            self._stats["decreases"] += 1
+        else:
+            self._window = min(self.maximum, self._window + self.increase)
+            self._stats["increases"] += 1
+
+        return self._window
+
+    @property
+    def window(self) -> int:
+        """
+        Get the current number of requests allowed in flight.
+
+        :return: The window.
+        """
+
+        return self._window
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the statistics of the controller.
+
+        :return: Dict with the current window and the counters.
+        """
+
+        return {"window": self._window, **self._stats}
@@ -0,0 +1,223 @@
+import json
+
+from typing import Any, Iterable
+
+from .response import StaticResponse, VKResponse
+from .utils import task_url, task_data, task_api_method, is_get_task
+
+
+class ExecuteBatcher:
+    """
+    Packs pending API calls into VK `execute` requests and splits the combined responses back per call.
+
+    ** The full documentation can be viewed on the official website at the url: `https://dev.vk.com/en/method/execute` **
+    """
+
+    MAX_CALLS = 25
+    METHOD = "execute"
+    SERVICE_PARAMS = ("access_token", "v")
+
+    def __init__(
+        self,
+        url_api: str = "https://api.vk.com/method/",
+        max_calls: int = MAX_CALLS,
+        excluded_params: Iterable[str] = (),
+    ) -> None:
+        """
+        Initializes the batcher.
+
+        :param url_api: The URL of the VK API.
+        :param max_calls: Maximum number of calls in one execute request(VK allows up to 25). Default: 25.
+        :param excluded_params: Params that are not passed to the packed calls(For example, headers).
+        :raises ValueError: If max_calls is not in the range from 1 to 25.
+        """
+
+        if not 1 <= max_calls <= self.MAX_CALLS:
+            raise ValueError(f"max_calls must be in the range from 1 to {self.MAX_CALLS}.")
+
+        self.url_api = url_api
+        self.url = url_api + self.METHOD
+        self.max_calls = max_calls
+        self.excluded_params = set(self.SERVICE_PARAMS) | set(excluded_params)
+
+    def is_packable(self, task: Any) -> bool:
+        """
+        Check if the task is a VK API call that can be packed into execute.
+
+        ** The GET tasks are sent as is, their headers and proxies cannot be passed to the packed calls. **
+
+        :param task: Pool task.
+        :return: True if the task can be packed, False otherwise.
+        """
+
+        url = task_url(task)
+
+        return url.startswith(self.url_api) and not url == self.url and not is_get_task(task) and bool(task_data(task))
+
+    def create_code(self, tasks: list) -> str:
+        """
+        Creates a VKScript code calling the methods of the tasks.
+
+        :param tasks: Pool tasks.
+        :return: VKScript code returning a list of the results of the calls.
+        """
+
+        calls = []
+        for task in tasks:
+            params = {key: value for key, value in task_data(task).items() if not key in self.excluded_params}
+            calls.append(f"API.{task_api_method(task)}({json.dumps(params, ensure_ascii=False)})")
+
+        return f"return [{', '.join(calls)}];"
+
+    def create_task(self, tasks: list) -> Any:
+        """
+        Creates an execute task of the same type as the packed tasks.
+
+        :param tasks: Pool tasks.
+        :return: execute task.
+        """
+
+        first = task_data(tasks[0])
+        data = {"code": self.create_code(tasks), "access_token": first.get("access_token"), "v": first.get("v")}
+
+        if isinstance(tasks[0], dict):
+            return {"url": self.url, "data": data}
+
+        return tasks[0].__class__(tasks[0].method, self.url, data=data, session=tasks[0].session)
+
+    def pack(self, tasks: list) -> tuple[list, list[list[int]]]:
+        """
+        Packs the tasks into execute tasks.
+
+        ** Calls are grouped by access token and API version, tasks that cannot be packed are passed as is. **
+
+        :param tasks: Pool tasks.
+        :return: A tuple containing:
+            - A list of tasks to process.
+            - A layout, where for each task to process is a list of indexes of the original tasks(One index if the task was passed as is).
+        """
+
+        groups = {}
+        packed_tasks = []
+        layout = []
+
+        for index, task in enumerate(tasks):
+            if not self.is_packable(task):
+                packed_tasks.append(task)
+                layout.append([index])
+                continue
+
+            data = task_data(task)
+            groups.setdefault((data.get("access_token"), data.get("v")), []).append(index)
+
+        for indexes in groups.values():
+            for step in range(0, len(indexes), self.max_calls):
+                chunk = indexes[step : step + self.max_calls]
+
+                packed_tasks.append(tasks[chunk[0]] if len(chunk) == 1 else self.create_task([tasks[index] for index in chunk]))
+                layout.append(chunk)
+
+        return packed_tasks, layout
+
+    def unpack(self, tasks: list, packed_tasks: list, layout: list[list[int]], results: list) -> list:
+        """
+        Splits the results of the processed tasks back per original task.
+
+        ** The access token the execute request was sent with is copied onto the packed tasks. **
+
+        :param tasks: Original pool tasks.
+        :param packed_tasks: Tasks returned by pack.
+        :param layout: Layout returned by pack.
+        :param results: Results of the processed packed tasks.
+        :return: A list of results in the order of the original tasks.
+        """
+
+        unpacked = [None] * len(tasks)
+
+        for chunk, packed_task, result in zip(layout, packed_tasks, results):
+            if len(chunk) == 1:
+                unpacked[chunk[0]] = result
+                continue
+
+            for index in chunk:
+                task_data(tasks[index], create=True)["access_token"] = task_data(packed_task).get("access_token")
+
+            for index, response in zip(chunk, self.split(result, [tasks[index] for index in chunk])):
+                unpacked[index] = response
+
+        return unpacked
+
+    def split(self, result: Any, tasks: list) -> list:
+        """
+        Splits the result of the execute request into results per call.
+
+        ** Calls that failed inside execute get a response with the VK `error` payload. **
+
+        :param result: The result of the execute request(None if the request failed).
+        :param tasks: Packed tasks in order of the calls.
+        :return: A list of results in order of the calls.
+        """
+
+        if result is None:
+            return [None] * len(tasks)
+
+        try:
+            result.raise_for_status()
+            payload = VKResponse.wrap(result).json()
+        except Exception:
+            return [None] * len(tasks)
+
+        if "error" in payload:
+            return [self._create_response(task, {"error": payload["error"]}, result) for task in tasks]
+
+        responses = payload.get("response") or []
+        errors = list(payload.get("execute_errors", []))
+        splitted = []
+
+        for index, task in enumerate(tasks):
+            response = responses[index] if index < len(responses) else False
+
+            if response is False:
+                splitted.append(self._create_response(task, {"error": self._pop_error(errors, task)}, result))
+                continue
+
+            splitted.append(self._create_response(task, {"response": response}, result))
+
+        return splitted
+
+    @staticmethod
+    def _pop_error(errors: list[dict], task: Any) -> dict:
+        """
+        Pops the execute error corresponding to the task.
+
+        :param errors: The execute_errors list.
+        :param task: The failed task.
+        :return: The error of the task.
+        """
+
+        method = task_api_method(task)
+        for index, error in enumerate(errors):
+            if error.get("method") == method:
+
+                return errors.pop(index)
+
+        return errors.pop(0) if errors else {"error_code": 0, "error_msg": "Unknown execute error", "method": method}
+
+    @staticmethod
+    def _create_response(task: Any, payload: dict, result: Any) -> StaticResponse:
+        """
+        Creates a response for the packed task.
+
+        :param task: The packed task.
+        :param payload: The payload of the call.
+        :param result: The result of the execute request.
+        :return: StaticResponse for the task.
+        """
+
+        return StaticResponse(
+            task_url(task),
+            payload,
+            status_code=result.status_code,
+            data=task_data(task),
+            elapsed=getattr(result, "elapsed", None),
+        )
@@ -0,0 +1,88 @@
+import sys
+import warnings
+
+from types import ModuleType
+from typing import Any, Optional
+
+
+# Modules of the HTTP stack of grequests whose direct references to the ssl classes are replaced after the late monkey-patching
+PATCHED_MODULES = ("urllib3",)
+
+
+def get_grequests() -> Optional[ModuleType]:
+    """
+    Get grequests if it is already loaded, without loading it.
+
+    :return: The grequests module or None if it is not loaded.
+    """
+
+    return sys.modules.get("grequests")
+
+
+def load_grequests() -> ModuleType:
+    """
+    Imports grequests on the first use.
+
+    ** grequests monkey-patches the standard library with gevent on import(socket, ssl, time, ...), so it is loaded only when the grequests transport is used.
+    If ssl was imported before, the modules of PATCHED_MODULES keep the references to the unpatched ssl classes, and HTTPS requests fail with RecursionError
+    (See https://github.com/gevent/gevent/issues/1016). These references are replaced with the patched classes. **
+
+    :return: The grequests module.
+    """
+
+    grequests = get_grequests()
+    if not grequests is None:
+        return grequests
+
+    ssl = sys.modules.get("ssl")
+    originals = {} if ssl is None else dict(vars(ssl))
+    import gevent.monkey
+
+    with warnings.catch_warnings():
+        # The warning about ssl imported before the monkey-patching, the references are replaced below
+        warnings.filterwarnings("ignore", category=gevent.monkey.MonkeyPatchWarning)
+        import grequests
+
+    if originals:
+        _replace_ssl_references(originals, vars(ssl))
+
+    return grequests
+
+
+def load_gevent() -> ModuleType:
+    """
+    Imports gevent through grequests, so the standard library is patched before gevent is used.
+
+    :return: The gevent module.
+    """
+
+    load_grequests()
+
+    return sys.modules["gevent"]
+
+
+def _replace_ssl_references(originals: dict[str, Any], patched: dict[str, Any]) -> None:
+    """
+    Replaces the references to the unpatched ssl classes and functions in the modules of PATCHED_MODULES.
+
+    ** Only the callables replaced by gevent are matched, so the constants(ints, strings) shared with other modules are not touched. **
+
+    :param originals: Attributes of the ssl module before the monkey-patching.
+    :param patched: Attributes of the ssl module after the monkey-patching.
+    """
+
+    replaced = {
+        id(value): patched[name] for name, value in originals.items() if callable(value) and name in patched and not patched[name] is value
+    }
+    if not replaced:
+        return
+
+    for name, module in list(sys.modules.items()):
+        if module is None or not name.split(".")[0] in PATCHED_MODULES:
+            continue
+
+        namespace = vars(module)
+        for attr, value in list(namespace.items()):
+            # The originals are alive in `originals`, so their ids are not reused
+            if callable(value) and id(value) in replaced:
+                namespace[attr] = replaced[id(value)]
@@ -1,8 +1,7 @@
 from .basehandler import BaseHandler
 from .subquery import SubQuery
 from .utils import (
-    create_compile_from_class,
-    create_compiles,
+    split_method_from_url,
     create_names,
     create_names_and_obj,
     get_subclasses,
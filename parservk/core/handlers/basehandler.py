@@ -1,16 +1,18 @@
 from typing import Any, Union, Optional
 
 from .subquery import SubQuery
+from ..retry import VKError
+from ..response import VKResponse
+from ..utils import task_data
 
 
 class BaseHandler:
     skipped_handlers = ["main_handler"]
-    
-    RE_URL_API = r"https?://api.vk.com/method/"
 
     def __init__(self, poolmanager, parser, handlers) -> None:
         self._result = []
-        self._subquerys_ids = []
+        self._subquerys_ids = set()
+        self._checkpoint_pages = {}
         self.subquerys = []
         self.poolmanager = poolmanager
         self.parser = parser
@@ -37,19 +39,22 @@ class BaseHandler:
 
     @staticmethod
     def check_result(result, passed_exception: list = []) -> bool:
-        try:
 
-            result.raise_for_status()
-            
-            if not "error" in result.json():
-            	
-            	return True
-            	
-        except Exception as e:
-            pass
-        
-        return False
+        return VKResponse.wrap(result).is_valid()
     
+    def create_error(self, result) -> VKError:
+        """
+        Creates a structured error for the failed result and registers it in the handlers errors.
+
+        :param result: The failed result.
+        :return: VKError with the code, message, method and params of the call.
+        """
+
+        error = VKError.from_response(result)
+        self.handlers.errors.append(error)
+
+        return error
+
     def create_subquery(
         self,
         ids: list[int],
@@ -58,13 +63,85 @@ class BaseHandler:
         base_results=None,
         groups_by=None,
     ) -> SubQuery:
-        self._subquerys_ids.extend(ids)
+        self._subquerys_ids.update(ids)
         path_subquery = path_subquery or f"{self.name}.{self.method}"
         subquery = SubQuery(ids, path_subquery, params, base_results, groups_by)
         self.subquerys.append(subquery)
 
         return subquery
 
+    def paginate(self, section: Any, data: dict, id: int, object_id: Any, **kwargs: Any) -> Union[list, SubQuery]:
+        """
+        Creates the subquery of the next pages of the paginated submethod(groups.getMembers, wall.get).
+
+        ** With the checkpoint param the finished pages are recorded in the store.
+        The pages stored with items are taken from the store instead of being requested again, so a resumed job sends only the missing pages. **
+
+        :param section: The section of the submethod(Groups, Wall).
+        :param data: The data of the response(count and items).
+        :param id: Id of the query.
+        :param object_id: Id of the paginated object(Group id, owner id).
+        :param kwargs: Arguments of the handlers(params, min, max, count, multi_ids, checkpoint).
+        :return: The items of the page or the subquery of the next pages.
+        """
+
+        items = data["items"]
+        checkpoint = kwargs.get("checkpoint")
+
+        if self.is_subquery_id(id):
+            page = self._checkpoint_pages.pop(id, None)
+            if not page is None:
+                checkpoint.add_page(*page, items)
+
+            return items
+
+        count = kwargs.get("count")
+        min = kwargs.get("min")
+        max = data["count"] if kwargs.get("max") == "all" else kwargs.get("max")
+        stored = {}
+
+        if not checkpoint is None:
+            job = checkpoint.create_key(self.name, self.method, object_id, kwargs.get("params"))
+            checkpoint.set_total(job, data["count"])
+            checkpoint.add_page(job, min - count, items)
+            stored = checkpoint.get_pages(job)
+
+        querys = section._paginate_querys(
+            ids=[object_id],
+            method=self.name,
+            submethod=self.method,
+            params=kwargs.get("params"),
+            min=min,
+            max=max,
+            count=count,
+            skipped_offsets=stored,
+            multi_ids=kwargs.get("multi_ids"),
+        )
+        base_results = [(id, items)] + [
+            (-1 - offset, page) for offset, page in stored.items() if min <= offset < max
+        ]
+
+        if not len(querys):
+
+            return items if len(base_results) == 1 else [page for _, page in base_results]
+
+        ids = self.poolmanager.add(querys)
+        if not checkpoint is None:
+            self._checkpoint_pages.update(
+                (query_id, (job, int(task_data(query)["offset"]))) for query_id, query in zip(ids, querys)
+            )
+
+        return self.create_subquery(ids, base_results=base_results)
+
+    def clear_subquerys(self) -> None:
+        """
+        Clears the subquerys, their ids and the checkpoint pages of the finished run.
+        """
+
+        self._subquerys_ids.clear()
+        self._checkpoint_pages.clear()
+        self.subquerys.clear()
+
     def is_subquery_id(self, id: int) -> bool:
     	return id in self._subquerys_ids
 
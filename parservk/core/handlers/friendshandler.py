@@ -8,10 +8,10 @@ class FriendsHandler(BaseHandler):
     def get_handler(self, result, id: int, **kwargs: Any):
         if not self.check_result(result):
 
-            return []
+            return self.create_error(result)
 
         data_friends = kwargs.get("data_friends")
-        items = result.json()["response"]["items"]
+        items = result.data["items"]
 
         if data_friends:
 
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from time import perf_counter
+from typing import Any, Optional, TYPE_CHECKING
 
 from .subquery import SubQuery
-from .utils import create_compiles, get_submethods_from_method
+from ..retry import VKError
+from ..response import VKResponse
+from ..utils import task_api_method
+from .utils import get_registry, get_submethods_from_method, split_method_from_url
 
-from time import perf_counter as p
 if TYPE_CHECKING:
     from ..poolmanager import PoolManager
     from ..parservk import ParserVK
@@ -24,13 +27,14 @@ class Handlers:
         :param parser: Class instance ParserVK.
         """
         
-        self._processed_ids = []
+        self._processed_ids = {}
         self._processed_subquerys = []
+        self.errors = []
         
         self.poolmanager = poolmanager
         self.parser = parser
 
-        self._re_compiles = create_compiles(parser=self.parser, poolmanager=self.poolmanager, handlers=self)
+        self._classhandlers = {}
         self.results = self.create_results()
     
     @staticmethod
@@ -53,22 +57,129 @@ class Handlers:
         """
 
         results = {}
-        for _, classhandler, name in self._re_compiles:
-            results[name] = {key: [] for key in classhandler._submethods_handler}
-
+        for name, class_ in get_registry()["classes"].items():
+            results[name] = {key: [] for key in self.create_submethods(name, class_.skipped_handlers)}
 
         return results
 
+    def get_classhandler(self, name: str) -> Optional[object]:
+        """
+        Get the class handler of the method, it is created on the first use.
+
+        :param name: The name of the method, e.g. "groups".
+        :return: The instance of the subclass of BaseHandler or None if the method is not supported.
+        """
+
+        classhandler = self._classhandlers.get(name)
+        if classhandler is None:
+            class_ = get_registry()["classes"].get(name)
+            if class_ is None:
+                return None
+
+            classhandler = self._classhandlers[name] = class_(parser=self.parser, poolmanager=self.poolmanager, handlers=self)
+
+        return classhandler
+
+    def run(self, poolmanager: Optional[PoolManager] = None, **kwargs: Any) -> dict[str, dict[str, list]]:
+        """
+        Processes the querys and their subquerys wave by wave until both pools are empty.
+
+        ** Works as a work queue without recursion: the waves of the subquerys are taken before the next wave of the querys,
+        so the subquerys are interleaved with the querys and the responses of each wave are released once they are handled.
+        The state of the subquerys is cleared when the run is finished(See clear_subquerys). **
+
+        :param poolmanager: The pool with the querys(Optional, only the subquerys are processed by default).
+        :param kwargs: Arguments for the handlers.
+        :return: Dictionary with processing results.
+        """
+
+        count_subquerys = len(self._processed_subquerys)
+        try:
+            while True:
+                pool = self._get_waiting_pool(poolmanager)
+                if pool is None:
+                    return self.results
+
+                pool.step(callable_func=self.main_handler, **kwargs)
+                count_subquerys = self._update_subquerys_params(kwargs, count_subquerys)
+        finally:
+            self.clear_subquerys()
+
+    async def run_async(self, poolmanager: Optional[PoolManager] = None, **kwargs: Any) -> dict[str, dict[str, list]]:
+        """
+        Processes the querys and their subquerys wave by wave on the event loop, like run.
+
+        :param poolmanager: The pool with the querys(Optional, only the subquerys are processed by default).
+        :param kwargs: Arguments for the handlers.
+        :return: Dictionary with processing results.
+        """
+
+        count_subquerys = len(self._processed_subquerys)
+        try:
+            while True:
+                pool = self._get_waiting_pool(poolmanager)
+                if pool is None:
+                    return self.results
+
+                await pool.step_async(callable_func=self.main_handler, **kwargs)
+                count_subquerys = self._update_subquerys_params(kwargs, count_subquerys)
+        finally:
+            self.clear_subquerys()
+
+    def clear_subquerys(self) -> None:
+        """
+        Clears the state of the subquerys of the finished run: the ids waiting for the results, the processed subquerys and the subquerys of the class handlers.
+        """
+
+        self._processed_ids.clear()
+        self._processed_subquerys.clear()
+        for classhandler in self._classhandlers.values():
+            classhandler.clear_subquerys()
+
+    def _get_waiting_pool(self, poolmanager: Optional[PoolManager] = None) -> Optional[PoolManager]:
+        """
+        Get the pool whose wave is processed next, the pool of the subquerys goes first.
+
+        :param poolmanager: The pool with the querys(Optional).
+        :return: The waiting pool or None if there are no tasks left.
+        """
+
+        for pool in (self.poolmanager, poolmanager):
+            if not pool is None and pool.is_state_waiting():
+
+                return pool
+
+    def _update_subquerys_params(self, kwargs: dict[str, Any], count_subquerys: int) -> int:
+        """
+        Updates the arguments of the handlers with the params of the new subquerys.
+
+        :param kwargs: Arguments for the handlers.
+        :param count_subquerys: The number of subquerys whose params are already applied.
+        :return: The number of processed subquerys.
+        """
+
+        for subquery in self._processed_subquerys[count_subquerys:]:
+            kwargs.update(subquery.params)
+
+        return len(self._processed_subquerys)
+
     def start_subquerys(self, **kwargs: Any) -> None:
         """
-        Starts a subquerys.
+        Starts the subquerys until no subquerys are left.
 
         :param kwargs: Arguments for the subquery.
         """
 
-        for subquery in self._processed_subquerys:
-            kwargs.update(subquery.params)
-        self.poolmanager.start(callable_func=self.main_handler, **kwargs)
+        self.run(**kwargs)
+
+    async def start_subquerys_async(self, **kwargs: Any) -> None:
+        """
+        Starts the subquerys on the event loop until no subquerys are left.
+
+        :param kwargs: Arguments for the subquery.
+        """
+
+        await self.run_async(**kwargs)
 
     def update_subquery_data_handler(self, id: int, subquery_result: list) -> None:
         """
@@ -78,15 +189,24 @@ class Handlers:
         :param subquery_result: Subquery result.
         """
 
-        for subquery in self._processed_subquerys:
+        subquery = self._processed_ids.pop(id, None)
+
+        if not subquery is None:
 
-            if id in subquery.ids:
+            subquery.update_results(id, subquery_result)
 
-                self._processed_ids.remove(id)
+    def skip_subquery_data_handler(self, id: int) -> None:
+        """
+        Skip the subquery data of the failed request.
+
+        :param id: Subquery id.
+        """
 
-                subquery.update_results(id, subquery_result)
+        subquery = self._processed_ids.pop(id, None)
 
-                return
+        if not subquery is None:
+
+            subquery.skip_result(id)
 
     def push_subquery_results_handler(self) -> None:
         """
@@ -102,8 +222,8 @@ class Handlers:
         """
         Checks if the callable result is a subquery and processes it accordingly.
 
-        ** If the callable result is an instance of SubQuery, this method extends the processed ids with the subquery ids
-        from the class handler and appends the subquery to the list of processed subqueries. **
+        ** If the callable result is an instance of SubQuery, this method maps the ids of the subquery that are waiting for results
+        to the subquery and appends the subquery to the list of processed subqueries. **
 
         :param classhandler: The class handler object.
         :param callable_result: The result of the callable, which can be of any type.
@@ -112,7 +232,7 @@ class Handlers:
 
         if isinstance(callable_result, SubQuery):
 
-            self._processed_ids.extend(classhandler._subquerys_ids)
+            self._processed_ids.update(dict.fromkeys(callable_result.processed_ids, callable_result))
 
             self._processed_subquerys.append(callable_result)
 
@@ -128,12 +248,43 @@ class Handlers:
     	
     	return not len(self._processed_ids) and len(self._processed_subquerys)
 
+    def call_handler(self, classhandler: object, result: VKResponse, id: int, **kwargs: Any) -> Any:
+        """
+        Calls the handler of the result, the decoding and the handler are timed if the parser records the metrics.
+
+        :param classhandler: The class handler of the method.
+        :param result: The result.
+        :param id: The request id.
+        :param kwargs: Arguments for requests.
+        :return: The result of the handler.
+        """
+
+        metrics = self.parser.request_metrics
+        if metrics is None:
+            return classhandler.main_handler(result=result, id=id, **kwargs)
+
+        method = task_api_method(result)
+        start = perf_counter()
+        try:
+            result.json()
+        except ValueError:
+            pass
+
+        decoded = perf_counter()
+        callable_result = classhandler.main_handler(result=result, id=id, **kwargs)
+        metrics.observe("decode", method, decoded - start)
+        metrics.observe("handler", method, perf_counter() - decoded)
+
+        return callable_result
+
     def main_handler(
         self, results: list, ids: list[int], **kwargs: Any
     ) -> dict[str, dict[str, list]]:
         """
         Primary request handler.
 
+        ** The failed requests add nothing to the results, their errors are collected in the errors attribute(See VKError), which is cleared on the start of each call of a submethod and published in parser.errors. **
+
         :param results: List of request results.
         :param ids: List of request ids.
         :param kwargs: Arguments for requests.
@@ -141,43 +292,42 @@ class Handlers:
         """
 
         for result, id in zip(results, ids):
-            url = result.url
+            result = VKResponse.wrap(result)
+            method = split_method_from_url(result.url, self.parser.api_url)
+            classhandler = None if method is None else self.get_classhandler(method[0])
 
-            for compile, classhandler, name in self._re_compiles:
+            if classhandler is None:
 
-                if compile.fullmatch(url):
+                continue
 
-                    callable_result = classhandler.main_handler(
-                        result=result, id=id, **kwargs
-                    )
+            callable_result = self.call_handler(classhandler, result, id, **kwargs)
 
-                    if id in self._processed_ids:
+            if isinstance(callable_result, VKError):
 
-                        self.update_subquery_data_handler(id, callable_result)
+                # The error is registered in errors by the handler, the results keep only the data
+                self.skip_subquery_data_handler(id)
 
-                    else:
-           
-                        result = self.results[classhandler.name][classhandler.method]
+                continue
 
-                        if not isinstance(callable_result, list):
+            if id in self._processed_ids:
 
-                            result.append(callable_result)
+                self.update_subquery_data_handler(id, callable_result)
 
-                        else:
+            else:
 
-                            result.extend(callable_result)
+                result = self.results[classhandler.name][classhandler.method]
 
-                    self.is_subquery(classhandler, callable_result)
+                if not isinstance(callable_result, list):
 
-                    break
+                    result.append(callable_result)
 
-        if self.is_completed_subquery():
-            self.push_subquery_results_handler()
+                else:
 
-        if self.poolmanager.is_state_waiting():
+                    result.extend(callable_result)
 
-            self.start_subquerys(**kwargs)
+            self.is_subquery(classhandler, callable_result)
+
+        if self.is_completed_subquery():
+            self.push_subquery_results_handler()
 
-            return self.poolmanager.callable_results[0]           
-        
         return self.results
\ No newline at end of file
@@ -183,6 +183,17 @@ class SubQuery:
 
         return self.results
 
+    def skip_result(self, id: int) -> None:
+        """
+        Marks the id as processed without adding a result(The call of the id failed).
+
+        :param id: The id to skip.
+        """
+
+        if self.is_id_in_subquery(id):
+
+            self._remove_processed_id(id)
+
     def push_results(self, base_results: dict[str, dict]) -> Union[None, dict]:
         """
         Pushes the results to the base results.
@@ -199,6 +210,16 @@ class SubQuery:
 
         return base_results
 
+    @property
+    def processed_ids(self) -> set:
+        """
+        Returns the ids whose results have not been received yet.
+
+        :return: A set of ids.
+        """
+
+        return self._processed_ids
+
     @property
     def method_alias(self) -> str:
         """
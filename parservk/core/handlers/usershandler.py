@@ -28,17 +28,17 @@ class UsersHandler(BaseHandler):
     def get_handler(self, result, id: int, **kwargs: Any):
         if not self.check_result(result):
 
-            return []
+            return self.create_error(result)
 
-        return result.json()["response"]
+        return result.data
 
     def getsubscriptions_handler(self, result, id: int, **kwargs: Any):
         if not self.check_result(result):
 
-            return []
+            return self.create_error(result)
 
         data_subscriptions = kwargs.get("data_subscriptions")
-        result = result.json()["response"]
+        result = result.data
 
         if data_subscriptions:
 
@@ -60,10 +60,10 @@ class UsersHandler(BaseHandler):
     def getfollowers_handler(self, result, id: int, **kwargs: Any):
         if not self.check_result(result):
 
-            return []
+            return self.create_error(result)
 
         data_followers = kwargs.get("data_followers")
-        result = result.json()["response"]
+        result = result.data
 
         if data_followers:
 
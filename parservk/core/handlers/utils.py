@@ -6,36 +6,27 @@ from typing import Any, Optional, Union
 
 from .basehandler import BaseHandler
 
-def create_compile_from_class(class_: object, *args: Any, **kwargs: Any) -> tuple[re.Pattern, object, str]:
-    """
-    Creates a regular expression based on the class.
+# Registry of the handlers: the subclasses of BaseHandler it was built for, the classes and the handler functions by name
+_registry = {"subclasses": None, "classes": {}, "functions": {}, "submethods": {}}
 
-    :param class_: A subclass of BaseHandler.
-    :param args: Additional arguments for creating an instance of the class.
-    :param kwargs: Keyword arguments for creating an instance of the class.
-    
-    :return: A tuple containing:
-        - A compiled regular expression.
-        - An instance of the class.
-        - The name of the class.
+def split_method_from_url(url: str, url_api: str) -> Optional[tuple[str, str]]:
     """
+    Splits the URL of the query into the method and the submethod.
 
-    name = class_.get_name(class_)
-    re_compile = re.compile(f"""{class_.RE_URL_API}{name}\.[a-zA-Z]+""", re.VERBOSE)
+    :param url: The URL of the query, e.g. "https://api.vk.com/method/groups.getMembers".
+    :param url_api: The URL of the VK API.
     
-    return re_compile, class_(*args, **kwargs), name
-
-def create_compiles(*args: Any, **kwargs: Any) -> list[tuple]:
+    :return: A tuple containing the method and the submethod in lower case, e.g. ("groups", "getmembers"), or None if the URL is not a VK API method.
     """
-    Creates a list of compilations for all subclasses of BaseHandler.
 
-    :param args: Additional arguments for creating instances of classes.
-    :param kwargs: Keyword arguments for creating instances of classes.
-    
-    :return: A list of tuples with regular expressions, objects, and class names.
-    """
+    if not url.startswith(url_api):
+        return None
 
-    return [create_compile_from_class(child_class, *args, **kwargs) for child_class in get_subclasses()]
+    method, _, submethod = url[len(url_api):].partition("?")[0].partition(".")
+    if not method or not submethod:
+        return None
+
+    return method.lower(), submethod.lower()
 
 def create_names() -> list[str]:
     """
@@ -44,7 +35,7 @@ def create_names() -> list[str]:
     :return: A list of names.
     """
  
-    return [child_class.get_name(child_class) for child_class in get_subclasses()]
+    return list(get_registry()["classes"])
 
 def create_names_and_obj() -> dict[str, object]:
     """
@@ -53,7 +44,7 @@ def create_names_and_obj() -> dict[str, object]:
     :return: A dictionary where keys are names and values are objects.
     """
     
-    return dict(zip(create_names(), get_subclasses()))
+    return dict(get_registry()["classes"])
 
 def get_subclasses() -> list:
     """
@@ -64,19 +55,60 @@ def get_subclasses() -> list:
 
     return BaseHandler.__subclasses__()
 
+def get_registry() -> dict[str, dict]:
+    """
+    Gets the registry of the handlers.
+
+    ** The registry is built once and shared by all parsers, it is rebuilt only if the subclasses of BaseHandler change.
+    The returned dicts must not be modified. **
+
+    :return: Dict with the keys:
+        - "classes": Dict where keys are names and values are subclasses of BaseHandler.
+        - "functions": Dict where keys are names and values are dicts of the handler functions(*_handler) by function name.
+        - "submethods": Cache of get_submethods_from_method.
+    """
+
+    subclasses = tuple(get_subclasses())
+    if _registry["subclasses"] != subclasses:
+        re_handler = re.compile(r".+_handler")
+        classes = {child_class.get_name(child_class): child_class for child_class in subclasses}
+        _registry.update(
+            subclasses=subclasses,
+            classes=classes,
+            functions={
+                name: {
+                    function_name: function
+                    for function_name, function in inspect.getmembers(class_, predicate=inspect.isfunction)
+                    if re_handler.fullmatch(function_name)
+                }
+                for name, class_ in classes.items()
+            },
+            submethods={},
+        )
+
+    return _registry
+
 def get_submethods_from_method(method: str, skipped_handlers: list[str] = []) -> dict[str, Any]:
     """
     Extracts submethods from the specified method.
 
+    ** The result is taken from the registry, so it is shared and must not be modified. **
+
     :param method: The name of the method.
     :param skipped_handlers: Handlers to skip.
     :return: A dictionary of submethods.
     """
-    re_handler = re.compile(r".+_handler")
-    obj = get_obj_from_method(method)
-    submethods = inspect.getmembers(obj, predicate=inspect.isfunction)
-    
-    return {submethod[0].split("_")[0]: submethod[-1] for submethod in submethods if re_handler.fullmatch(submethod[0]) and not submethod[0] in skipped_handlers}
+
+    registry = get_registry()
+    key = (method.lower(), tuple(skipped_handlers))
+    submethods = registry["submethods"].get(key)
+    if submethods is None:
+        functions = registry["functions"].get(key[0], {})
+        submethods = registry["submethods"][key] = {
+            name.split("_")[0]: function for name, function in functions.items() if not name in skipped_handlers
+        }
+
+    return submethods
 
 def get_obj_from_method(method: str, default: Optional[Any] = None) -> Union[Optional[Any], object]:
     """
@@ -88,7 +120,7 @@ def get_obj_from_method(method: str, default: Optional[Any] = None) -> Union[Opt
     :return: An object or the default value.
     """
     
-    return create_names_and_obj().get(method.lower(), default)
+    return get_registry()["classes"].get(method.lower(), default)
 
 def is_method_supported(method: str, enable_logging: Optional[logging.Logger] = None) -> bool:
     """
@@ -99,7 +131,7 @@ def is_method_supported(method: str, enable_logging: Optional[logging.Logger] =
     
     :return: True if the method is supported, otherwise False.
     """
-    result = method.lower() in create_names()
+    result = method.lower() in get_registry()["classes"]
     
     if not result and enable_logging is not None:
         enable_logging.warning(f"The method '{method}' is not supported by the BaseHandler.")
@@ -1,9 +1,15 @@
 import logging
 
+from itertools import cycle
+
 from .logger import _logger
 from .poolmanager import PoolManager
+from .executebatcher import ExecuteBatcher
 from .handlers.handlers import Handlers
-from .utils import method_from_class
+from .utils import MethodDescriptor, method_from_class, descriptors_from_class
+
+# Methods, limits and descriptors of the sections by the base class, its subclasses and the URL of the VK API, shared by all parsers
+_methods_and_limits = {}
 
 class InitMixin:
     
@@ -18,33 +24,95 @@ class InitMixin:
         """
 
         self.parser = parser
-        self.poolmanager = PoolManager()
-        self.handlers = Handlers(PoolManager(), self.parser)
         self.tokens = self.parser.tokens
+        self._tokens_cycle = cycle(self.tokens)
         self.v = self.parser.v_api
         self.headers = self.parser.headers
         self.proxies = self.parser.proxies
+        self.type_lib = self.parser.transport
+        self.URL_API = self.parser.api_url
+        self.poolmanager = self.create_poolmanager()
+        self.handlers = Handlers(self.create_poolmanager(), self.parser)
         self.base_params = {
-            "access_token": list(self.tokens)[0],
+            "access_token": next(iter(self.tokens)),
             "v": self.v,
         }
         self.__class__._NAME = getattr(self, "_NAME", self.__class__.__name__.upper())
         self.logger = logger(f"{self.__module__}.{self._NAME.title()}")
         self._limits = getattr(self, "_limits", {})
         self._methods, self._limits_per_category = self.create_methods_and_limits()
+        self._descriptors = self.create_descriptors()
         self.FIELDS = ", ".join(self.fields_list)
         	
+    def create_poolmanager(self) -> PoolManager:
+        """
+        Create a pool configured by the parser settings.
+
+        :return: New instance PoolManager.
+        """
+
+        batcher = None
+        if self.parser.execute:
+            batcher = ExecuteBatcher(
+                self.URL_API,
+                max_calls=self.parser.execute_max_calls,
+                excluded_params=self.headers or {},
+            )
+
+        return PoolManager(
+            batcher=batcher,
+            token_scheduler=self.parser.token_scheduler,
+            async_transport=self.parser.async_transport,
+            transport=self.parser.http_transport,
+            concurrency=self.parser.concurrency,
+            retry_policy=self.parser.retry_policy,
+            cache=self.parser.response_cache,
+            metrics=self.parser.request_metrics,
+            cassette=self.parser.request_cassette,
+        )
+
     def create_methods_and_limits(self) -> tuple[dict]:
     	"""
         Create methods and limits for the mixin based on child classes.
 
+        ** The methods and limits are computed once for the URL of the VK API and shared by the sections of all parsers, they must not be modified. **
+
         :return: A tuple containing a dictionary of methods and a dictionary of limits per category.
         """
 
-    	methods = {}
-    	limits_per_category = {}
-    	for child_class in type(self).__bases__[0].__subclasses__():
-    		methods[child_class._NAME] = method_from_class(child_class)
-    		limits_per_category[child_class._NAME] = child_class._limits
-    	
-    	return methods, limits_per_category
\ No newline at end of file
+    	return self.__get_sections_data()[:2]
+
+    def create_descriptors(self) -> dict[tuple[str, str], MethodDescriptor]:
+    	"""
+        Create the descriptors of the submethods of the sections based on child classes.
+
+        ** The descriptors are computed once for the URL of the VK API and shared by the sections of all parsers. **
+
+        :return: A dictionary where keys are tuples (name of the section, submethod in lowercase) and values are MethodDescriptor.
+        """
+
+    	return self.__get_sections_data()[-1]
+
+    def __get_sections_data(self) -> tuple[dict, dict, dict]:
+    	"""
+        Get the methods, limits and descriptors of the child classes, they are computed on the first call.
+
+        :return: A tuple containing a dictionary of methods, a dictionary of limits per category and a dictionary of descriptors.
+        """
+
+    	base = type(self).__bases__[0]
+    	subclasses = tuple(base.__subclasses__())
+    	key = (base, subclasses, self.URL_API)
+    	if not key in _methods_and_limits:
+    		methods = {}
+    		limits_per_category = {}
+    		descriptors = {}
+    		for child_class in subclasses:
+    			methods[child_class._NAME] = method_from_class(child_class, self.URL_API)
+    			limits_per_category[child_class._NAME] = child_class._limits
+    			for submethod, descriptor in descriptors_from_class(child_class, self.URL_API).items():
+    				descriptors[(child_class._NAME, submethod)] = descriptor
+
+    		_methods_and_limits[key] = (methods, limits_per_category, descriptors)
+
+    	return _methods_and_limits[key]
\ No newline at end of file
@@ -0,0 +1,40 @@
+import json
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+BACKEND = "stdlib" if orjson is None else "orjson"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decodes JSON with orjson if it is installed, otherwise with the standard library.
+
+    :param data: JSON document.
+    :return: The decoded object.
+    :raises ValueError: If the document is not valid JSON.
+    """
+
+    if orjson is None:
+        return json.loads(data)
+
+    return orjson.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encodes the object to JSON with orjson if it is installed, otherwise with the standard library.
+
+    :param obj: The object to encode.
+    :return: UTF-8 encoded JSON document.
+    """
+
+    if orjson is None:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
+    return orjson.dumps(obj)
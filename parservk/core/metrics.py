@@ -0,0 +1,243 @@
+import threading
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Iterable, Optional, Union
+
+
+# Upper bounds of the buckets in seconds, from 1 ms to 30 s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets, like the Prometheus histogram.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initializes the histogram.
+
+        :param buckets: Upper bounds of the buckets. Default: DEFAULT_BUCKETS.
+        :raises ValueError: If there are no buckets.
+        """
+
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets:
+            raise ValueError("At least one bucket is required.")
+
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Adds the value to the bucket with the smallest upper bound that is not less than the value.
+
+        :param value: The value.
+        """
+
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Get the estimate of the quantile, the upper bound of the bucket containing it.
+
+        :param q: The quantile from 0 to 1.
+        :return: The upper bound(inf if the quantile is in the last bucket, 0.0 if the histogram is empty).
+        """
+
+        if not self.count:
+            return 0.0
+
+        rank, cumulative = q * self.count, 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+
+        return float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the histogram as a dict.
+
+        :return: Dict with the cumulative counts of the buckets by upper bound, the sum, the count, p50 and p99.
+        """
+
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+
+        return {"buckets": buckets, "sum": self.sum, "count": self.count, "p50": self.quantile(0.5), "p99": self.quantile(0.99)}
+
+
+class Metrics:
+    """
+    Metrics of the VK API calls by method: histograms of the stages, the number of requests, error codes and bytes transferred.
+
+    ** The stages are "queue"(From adding the task to the pool to sending its wave), "throttle"(Waiting for the token of the rate limit),
+    "network"(From sending the request to receiving the response headers), "decode"(JSON decoding) and "handler"(The handler of the result). **
+
+    Example:
+        parser = ParserVK(tokens=[...], metrics=True)
+        parser.users.get(user_ids=[1, 2])
+        print(parser.request_metrics.to_prometheus())
+    """
+
+    STAGES = ("queue", "throttle", "network", "decode", "handler")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, prefix: str = "parservk") -> None:
+        """
+        Initializes the metrics.
+
+        :param buckets: Upper bounds of the buckets of the histograms in seconds. Default: DEFAULT_BUCKETS.
+        :param prefix: Prefix of the names in the Prometheus export. Default: parservk.
+        """
+
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._requests = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._bytes = defaultdict(int)
+
+    def observe(self, stage: str, method: str, seconds: float) -> None:
+        """
+        Adds the duration of the stage of the call.
+
+        :param stage: The stage(See STAGES).
+        :param method: VK API method, e.g. "users.get".
+        :param seconds: Duration in seconds.
+        """
+
+        with self._lock:
+            histogram = self._histograms.get((stage, method))
+            if histogram is None:
+                histogram = self._histograms[(stage, method)] = Histogram(self.buckets)
+
+            histogram.observe(seconds)
+
+    def add_request(self, method: str, sent: int = 0, received: int = 0, error_code: Optional[int] = None) -> None:
+        """
+        Counts the HTTP request.
+
+        :param method: VK API method, e.g. "users.get".
+        :param sent: Bytes of the request body. Default: 0.
+        :param received: Bytes of the response body. Default: 0.
+        :param error_code: VK error code, 0 for network errors, 5xx and 429 statuses, -1 for the other 4xx statuses(Optional, None if there is no error).
+        """
+
+        with self._lock:
+            self._requests[method] += 1
+            self._bytes[(method, "sent")] += sent
+            self._bytes[(method, "received")] += received
+            if not error_code is None:
+                self._errors[(method, error_code)] += 1
+
+    def get_histogram(self, stage: str, method: str) -> Optional[Histogram]:
+        """
+        Get the histogram of the stage of the method.
+
+        :param stage: The stage(See STAGES).
+        :param method: VK API method.
+        :return: Histogram or None if nothing was observed.
+        """
+
+        return self._histograms.get((stage, method))
+
+    def reset(self) -> None:
+        """
+        Remove all observations.
+        """
+
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+            self._errors.clear()
+            self._bytes.clear()
+
+    @property
+    def stats(self) -> dict[str, dict]:
+        """
+        Get the metrics as a dict.
+
+        :return: Dict with the keys:
+            - "requests": Dict where keys are methods and values are the numbers of requests.
+            - "errors": Dict where keys are methods and values are dicts of the numbers of errors by code.
+            - "bytes": Dict where keys are methods and values are dicts with the sent and received bytes.
+            - "stages": Dict where keys are stages and values are dicts of the histograms(See Histogram.to_dict) by method.
+        """
+
+        with self._lock:
+            errors, transferred, stages = defaultdict(dict), defaultdict(dict), defaultdict(dict)
+            for (method, code), count in self._errors.items():
+                errors[method][code] = count
+
+            for (method, direction), count in self._bytes.items():
+                transferred[method][direction] = count
+
+            for (stage, method), histogram in self._histograms.items():
+                stages[stage][method] = histogram.to_dict()
+
+            return {"requests": dict(self._requests), "errors": dict(errors), "bytes": dict(transferred), "stages": dict(stages)}
+
+    def to_prometheus(self) -> str:
+        """
+        Export the metrics in the Prometheus text format.
+
+        :return: The text of the exposition, e.g. for the /metrics endpoint.
+        """
+
+        name = f"{self.prefix}_stage_seconds"
+        lines = [
+            f"# HELP {name} Duration of the stages of the VK API calls.",
+            f"# TYPE {name} histogram",
+        ]
+
+        with self._lock:
+            for (stage, method), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+                labels = f'stage="{self._escape(stage)}",method="{self._escape(method)}"'
+                for bound, cumulative in histogram.to_dict()["buckets"].items():
+                    lines.append(f'{name}_bucket{{{labels},le="{self._format_bound(bound)}"}} {cumulative}')
+
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            lines.extend(self._format_counter("requests_total", "Number of HTTP requests to the VK API.", self._requests, ("method",)))
+            lines.extend(self._format_counter("errors_total", "Number of the failed requests by VK error code.", self._errors, ("method", "code")))
+            lines.extend(self._format_counter("bytes_total", "Bytes of the request and response bodies.", self._bytes, ("method", "direction")))
+
+        return "\n".join(lines) + "\n"
+
+    def _format_counter(self, name: str, description: str, values: dict, labels: tuple[str, ...]) -> list[str]:
+        """
+        Formats the counter in the Prometheus text format.
+
+        :param name: Name of the counter without the prefix.
+        :param description: The help text.
+        :param values: Dict where keys are the label values(A tuple for several labels) and values are the counts.
+        :param labels: Names of the labels.
+        :return: A list of lines.
+        """
+
+        name = f"{self.prefix}_{name}"
+        lines = [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+        for key, count in sorted(values.items(), key=lambda item: str(item[0])):
+            key = key if isinstance(key, tuple) else (key,)
+            formatted = ",".join(f'{label}="{self._escape(value)}"' for label, value in zip(labels, key))
+            lines.append(f"{name}{{{formatted}}} {count}")
+
+        return lines
+
+    @staticmethod
+    def _escape(value: Any) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def _format_bound(bound: Union[int, float]) -> str:
+        return "+Inf" if bound == float("inf") else repr(float(bound))
@@ -10,7 +10,7 @@ class DataGroupsAndWall(BaseModel):
 	count: int = 1000
 	offset: int = 0
 	max: Union[int, str] = "all"
-class DataUsers(DataBase):
+class DataUsers(DataBase, DataGroupsAndWall):
 	subscriptions: bool = False
 	data_subscriptions: bool = False
 	friends: bool = False
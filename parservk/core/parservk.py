@@ -1,12 +1,23 @@
-from typing import Any, Optional, Union
+from typing import Any, AsyncIterator, Coroutine, Iterator, Literal, NamedTuple, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from .base import Base
+from .executebatcher import ExecuteBatcher
+from .tokenscheduler import TokenScheduler
+from .asynctransport import AsyncTransport
+from .concurrency import ConcurrencyController
+from .retry import RetryPolicy, VKError
+from .cache import ResponseCache, MemoryCache, SQLiteCache
+from .checkpoint import CheckpointStore
+from .metrics import Metrics
+from .cassette import Cassette
+from .transports import create_transport
+from .geventlib import load_grequests
 from .constants import VERSION_API, HEADERS
 from .models import DataUsers, DataGroups, DataFriends, DataWall
 
-from time import perf_counter as p
+
 class Users(Base):
     """
     Wrapper over the users submethods.
@@ -45,6 +56,7 @@ class Users(Base):
             - "subscriptions": List of subscriptions. If no user have been specified, it returns an empty list or the subscriptions param is set to False.
             - "followers": List of followers. If no user have been specified, it returns an empty list or the followers param is set to False.
             - "wall": List of walls. If no user have been specified, it returns an empty list or the wall param is set to False.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed(Otherwise the errors of the call are in parser.errors).
         """
         
         # Temporary implementation
@@ -76,16 +88,24 @@ class Users(Base):
 
         if data.wall:
         	querys.extend(self.parser.wall.get(owner_id=user_id, ispool=True))
-        self.poolmanager.add(querys)
-        self.poolmanager.start(
-            callable_func=self.handlers.main_handler,
+
+        return self._start(
+            querys,
+            self._get_result,
             data_subscriptions=data.data_subscriptions,
             data_followers=data.data_followers,
             data_friends=data.data_friends,
         )
-        
-        
-        result = self.poolmanager.callable_results[-1]
+
+    @staticmethod
+    def _get_result(result: dict[str, dict[str, list]]) -> dict[str, list]:
+        """
+        Extracts the result of the get submethod from the handlers results.
+
+        :param result: The handlers results.
+        :return: Dict containing user data(See get).
+        """
+
         users = result.get("users", {})
         friends = result.get("friends", {})
         wall = result.get("wall", {})
@@ -102,6 +122,7 @@ class Users(Base):
             :param user_id: Id user or username(Optional).
             :param data_subscriptions: Flag indicating whether to retrieve information about each subscription, only if the subscriptions param is set to True and and the number of users is equal to 1(Unofficial param).
         :return: A list of user subscriptions if the ispool param is set to False, otherwise a list of querys.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed(Otherwise the errors of the call are in parser.errors).
         """
 
         return self._get_connections(method="getsubscriptions", ispool=ispool,  **kwargs)
@@ -117,10 +138,45 @@ class Users(Base):
             :param user_id: Id user or username(Optional).
             :param data_followers: Flag indicating whether to retrieve information about each follower, only if the followers param is set to True and and the number of users is equal to 1(Unofficial param).
         :return: A list of user followers if the ispool param is set to False, otherwise a list of querys.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed(Otherwise the errors of the call are in parser.errors).
         """
 
         return self._get_connections(method="getfollowers", ispool=ispool,  **kwargs)
 
+    def iter_followers(
+        self,
+        in_flight: int = 10,
+        pages: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        job: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Union[Iterator, AsyncIterator]:
+        """
+        Stream user followers page by page, the pages are requested while the previous ones are consumed.
+
+        ** The full documentation can be viewed on the official website at the url: `https://dev.vk.com/en/method/users.getFollowers` **
+
+        :param in_flight: Maximum number of pages in flight, the memory is bounded by it. Default: 10.
+        :param pages: Flag about yielding pages(lists of ids) instead of ids. Default: False.
+        :param checkpoint: Store of the consumed pages, a resumed job requests only the missing pages(Optional).
+        :param job: Name of the job in the store(Optional, created from the query by default).
+        :param kwargs: The main params of the query.
+            :param user_id: Id user or username.
+            :param count: Number of followers to retrieve in one query. Default: 1000.
+            :param offset: Offset needed to return a specific subset of followers. Default: 0.
+            :param max: Maximum number of followers to retrieve. Default: "all".
+        :raises VKError: If a page could not be retrieved.
+        :return: A generator of followers ids(An asynchronous generator with the asyncio transport).
+        """
+
+        # Temporary implementation
+        data = self.DATACLASS(**kwargs)
+        params = self._update_all(params=self.base_params.copy(), count=data.count)
+
+        return self._iter_pages(
+            [data.user_id], "getfollowers", params, data.count, data.offset, data.max, "user_ids", in_flight, pages, checkpoint, job
+        )
+
     def _get_connections(
         self, method: str = "getsubscriptions", ispool: bool = False, **kwargs: Any
     ) -> list[dict[str, list]]:
@@ -149,16 +205,14 @@ class Users(Base):
         )
         if ispool:
             return query
-        self.poolmanager.add(query)
-        self.poolmanager.start(
-            callable_func=self.handlers.main_handler,
+
+        return self._start(
+            query,
+            lambda result: result["users"][method],
             data_subscriptions=data.data_subscriptions,
             data_followers=data.data_followers,
-            
         )
 
-        return self.poolmanager.callable_results[-1]["users"][method]
-
 class Groups(Base):
     """
     Wrapper over the groups submethods.
@@ -185,6 +239,7 @@ class Groups(Base):
             :param group_id: Id group or username(Optional).
             :param group_ids: List groups ids or usernames.
         :return: A list groups data if the ispool param is set to False, otherwise a list of querys.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed(Otherwise the errors of the call are in parser.errors).
         """
 
         # Temporary implementation
@@ -200,12 +255,8 @@ class Groups(Base):
         )
         if ispool:
             return query
-        self.poolmanager.add(query)
-        self.poolmanager.start(
-            callable_func=self.handlers.main_handler,
-          
-        )
-        return self.poolmanager.callable_results[-1]["groups"]["getbyid"]
+
+        return self._start(query, lambda result: result["groups"]["getbyid"])
 
     def isMember(self, ispool: bool = False, **kwargs: Any) -> list[Union[int, dict]]:
         """
@@ -219,6 +270,7 @@ class Groups(Base):
             :param user_id: Id user or username(Optional).
             :param user_ids: List users ids or usernames.
         :return: A list containing information about whether the user is a member of the group if the ispool param is set to False, otherwise a list of querys.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed(Otherwise the errors of the call are in parser.errors).
         """
 
         # Temporary implementation
@@ -235,17 +287,17 @@ class Groups(Base):
         )
         if ispool:
             return query
-        self.poolmanager.add(query)
-        self.poolmanager.start(callable_func=self.handlers.main_handler)
-        return self.poolmanager.callable_results[-1]["groups"]["ismember"]
 
-    def getMembers(self, ispool: bool = False, **kwargs: Any) -> list:
+        return self._start(query, lambda result: result["groups"]["ismember"])
+
+    def getMembers(self, ispool: bool = False, checkpoint: Optional[CheckpointStore] = None, **kwargs: Any) -> list:
         """
         Retrieve members of a group based on provided params.
 
         ** The full documentation can be viewed on the official website at the url: `https://dev.vk.com/en/method/groups.getMembers` **
 
         :param ispool: Flag to indicate if using pool(This may be necessary when calling other submethods).
+        :param checkpoint: Store of the finished pages, the pages stored with items are not requested again(Optional, requires store_items).
         :param kwargs: The main params of the query.
             :param group_id: Id group or username.
             :param count: Number of members to retrieve in one query. Default: 1000.
@@ -253,6 +305,7 @@ class Groups(Base):
             :param sort: Sort order. Default: "id_asc"
             :param max: Maximum number of members to retrieve. Default: "all".
         :return: The list is divided into lists in each of them "count" ids if the ispool param is set to False, otherwise a list of querys.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed(Otherwise the errors of the call are in parser.errors).
         """
 
         # Temporary implementation
@@ -270,17 +323,53 @@ class Groups(Base):
         )
         if ispool:
             return query
-        self.poolmanager.add(query)
-        self.poolmanager.start(
-            callable_func=self.handlers.main_handler,
+
+        return self._start(
+            query,
+            lambda result: result["groups"]["getmembers"],
             params=params,
             count=count,
             min=offset + count,
             max=data.max,
             group_id=group_id,
-            multi_ids=multi_ids
+            multi_ids=multi_ids,
+            checkpoint=checkpoint,
+        )
+
+    def iter_members(
+        self,
+        in_flight: int = 10,
+        pages: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        job: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Union[Iterator, AsyncIterator]:
+        """
+        Stream members of a group page by page, the pages are requested while the previous ones are consumed.
+
+        ** The full documentation can be viewed on the official website at the url: `https://dev.vk.com/en/method/groups.getMembers` **
+
+        :param in_flight: Maximum number of pages in flight, the memory is bounded by it. Default: 10.
+        :param pages: Flag about yielding pages(lists of members) instead of members. Default: False.
+        :param checkpoint: Store of the consumed pages, a resumed job requests only the missing pages(Optional).
+        :param job: Name of the job in the store(Optional, created from the query by default).
+        :param kwargs: The main params of the query.
+            :param group_id: Id group or username.
+            :param count: Number of members to retrieve in one query. Default: 1000.
+            :param offset: Offset needed to return a specific subset of members. Default: 0.
+            :param sort: Sort order. Default: "id_asc"
+            :param max: Maximum number of members to retrieve. Default: "all".
+        :raises VKError: If a page could not be retrieved.
+        :return: A generator of members(An asynchronous generator with the asyncio transport).
+        """
+
+        # Temporary implementation
+        data = self.DATACLASS(**kwargs)
+        params = self._update_all(params=self.base_params.copy(), count=data.count, sort=data.sort)
+
+        return self._iter_pages(
+            [data.group_id], "getmembers", params, data.count, data.offset, data.max, "group_ids", in_flight, pages, checkpoint, job
         )
-        return self.poolmanager.callable_results[-1]["groups"]["getmembers"]
 
 
 class Friends(Base):
@@ -308,6 +397,7 @@ class Friends(Base):
             :param user_ids: List of user ids or usernames.
             :param data_friends: Flag indicating whether to retrieve information about each friend(Unofficial param).
         :return: A list of friends data if the ispool param is set to False, otherwise a list of queries.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed(Otherwise the errors of the call are in parser.errors).
         """
 
         # Temporary implementation
@@ -322,12 +412,32 @@ class Friends(Base):
         )
         if ispool:
             return query
-        self.poolmanager.add(query)
-        self.poolmanager.start(
-            callable_func=self.handlers.main_handler,
+
+        return self._start(
+            query,
+            lambda result: result["friends"]["get"],
             data_friends=data.data_friends,
         )
-        return self.poolmanager.callable_results[-1]["friends"]["get"]
+
+class WallSync(NamedTuple):
+    """
+    Result of the incremental sync of a wall.
+
+    :param owner_id: Id of the owner of the wall.
+    :param items: The new posts, newest first(The pinned post goes first if it is new).
+    :param mark: The new high-water mark(The previous mark if the sync is not complete).
+    :param complete: Flag about reaching the known posts or the end of the wall.
+    :param requests: The number of sent requests.
+    :param error: The error of the last request(Optional).
+    """
+
+    owner_id: Union[str, int]
+    items: list[dict]
+    mark: Optional[int]
+    complete: bool
+    requests: int
+    error: Optional[VKError] = None
+
 
 class Wall(Base):
     """
@@ -342,19 +452,21 @@ class Wall(Base):
     # Temporary implementation
     DATACLASS = DataWall
     
-    def get(self, ispool: bool = False, **kwargs: Any):
+    def get(self, ispool: bool = False, checkpoint: Optional[CheckpointStore] = None, **kwargs: Any):
         """
         Retrieve wall posts based on provided params.
 
         ** The full documentation can be viewed on the official website at the url: `https://dev.vk.com/en/method/wall.get` **
 
         :param ispool: Flag to indicate if using pool(This may be necessary when calling other submethods).
+        :param checkpoint: Store of the finished pages, the pages stored with items are not requested again(Optional, requires store_items).
         :param kwargs: The main params of the query.
             :param owner_id: Id of the owner of the wall(User or community).
             :param count: Number of posts to retrieve in one query. Default: 100.
             :param offset: Offset needed to return a specific subset of posts. Default: 0.
             :param max: Maximum number of posts to retrieve. Default: "all".
         :return: A list of wall posts if the ispool param is set to False, otherwise a list of queries.
+        :raises VKError: If the raise_on_error param of the parser is set and one of the calls failed(Otherwise the errors of the call are in parser.errors).
         """
 
         # Temporary implementation
@@ -369,17 +481,267 @@ class Wall(Base):
         )
         if ispool:
         	return query
-        self.poolmanager.add(query)
-        self.poolmanager.start(
-            callable_func=self.handlers.main_handler,
+
+        return self._start(
+            query,
+            lambda result: result["wall"]["get"],
             count=count,
             owner_id=owner_id,
             max=data.max,
             min=count+offset,
             multi_ids="owner_ids",
-            params=params
+            params=params,
+            checkpoint=checkpoint,
         )
-        return self.poolmanager.callable_results[-1]["wall"]["get"]
+
+    def iter_wall(
+        self,
+        in_flight: int = 10,
+        pages: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        job: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Union[Iterator, AsyncIterator]:
+        """
+        Stream wall posts page by page, the pages are requested while the previous ones are consumed.
+
+        ** The full documentation can be viewed on the official website at the url: `https://dev.vk.com/en/method/wall.get` **
+
+        :param in_flight: Maximum number of pages in flight, the memory is bounded by it. Default: 10.
+        :param pages: Flag about yielding pages(lists of posts) instead of posts. Default: False.
+        :param checkpoint: Store of the consumed pages, a resumed job requests only the missing pages(Optional).
+        :param job: Name of the job in the store(Optional, created from the query by default).
+        :param kwargs: The main params of the query.
+            :param owner_id: Id of the owner of the wall(User or community).
+            :param count: Number of posts to retrieve in one query. Default: 100.
+            :param offset: Offset needed to return a specific subset of posts. Default: 0.
+            :param max: Maximum number of posts to retrieve. Default: "all".
+        :raises VKError: If a page could not be retrieved.
+        :return: A generator of posts(An asynchronous generator with the asyncio transport).
+        """
+
+        # Temporary implementation
+        data = self.DATACLASS(**kwargs)
+        params = self._update_all(params=self.base_params.copy(), count=data.count)
+
+        return self._iter_pages(
+            [data.owner_id], "get", params, data.count, data.offset, data.max, "owner_ids", in_flight, pages, checkpoint, job
+        )
+
+
+    def sync(
+        self,
+        owner_id: Union[str, int],
+        since: Optional[int] = None,
+        key: Literal["id", "date"] = "id",
+        count: int = 100,
+        budget: Optional[int] = None,
+    ) -> Union[WallSync, Coroutine[Any, Any, WallSync]]:
+        """
+        Fetch only the posts published after the high-water mark, the pages are requested in order until a known post is reached.
+
+        ** The pinned post is not in the date order, so it never stops the sync and is returned only if it is newer than the mark.
+        With the asyncio transport returns a coroutine. **
+
+        :param owner_id: Id of the owner of the wall(User or community).
+        :param since: The high-water mark, the id or the date of the newest known post(Optional, the whole wall is fetched by default).
+        :param key: The field of the mark(id or date). Default: "id".
+        :param count: Number of posts to retrieve in one query. Default: 100.
+        :param budget: Maximum number of requests(Optional, unlimited by default).
+        :return: The result of the sync.
+        """
+
+        if self.type_lib == "asyncio":
+            return self._sync_single_async(owner_id, since, key, count, budget)
+
+        return self.sync_many({owner_id: since}, key, count, budget)[owner_id]
+
+    async def _sync_single_async(self, owner_id: Union[str, int], since: Optional[int], key: str, count: int, budget: Optional[int]) -> WallSync:
+        """
+        Asynchronous implementation of sync.
+
+        :param owner_id: Id of the owner of the wall.
+        :param since: The high-water mark(Optional).
+        :param key: The field of the mark.
+        :param count: Number of posts to retrieve in one query.
+        :param budget: Maximum number of requests(Optional).
+        :return: The result of the sync.
+        """
+
+        return (await self.sync_many({owner_id: since}, key, count, budget))[owner_id]
+
+    def sync_many(
+        self,
+        marks: dict[Union[str, int], Optional[int]],
+        key: Literal["id", "date"] = "id",
+        count: int = 100,
+        budget: Optional[int] = None,
+    ) -> Union[dict[Union[str, int], WallSync], Coroutine[Any, Any, dict[Union[str, int], WallSync]]]:
+        """
+        Incremental sync of several walls with one request budget.
+
+        ** Each wave requests the next page of every wall that is not synced yet, so the budget is shared evenly between the walls.
+        When the budget is exhausted, the walls that are not synced keep their previous mark.
+        With the asyncio transport returns a coroutine. **
+
+        :param marks: Dict where keys are the ids of the owners and values are the high-water marks(None to fetch the whole wall).
+        :param key: The field of the marks(id or date). Default: "id".
+        :param count: Number of posts to retrieve in one query. Default: 100.
+        :param budget: Maximum number of requests for all walls(Optional, unlimited by default).
+        :raises ValueError: If the key is not supported.
+        :return: Dict where keys are the ids of the owners and values are the results of the sync.
+        """
+
+        if not key in ("id", "date"):
+            raise ValueError('The key must be "id" or "date".')
+
+        states = {owner_id: self._create_sync_state(owner_id, since, key) for owner_id, since in marks.items()}
+
+        if self.type_lib == "asyncio":
+            return self._sync_many_async(states, count, budget)
+
+        while True:
+            querys, owners = self._create_sync_querys(states, count, budget)
+            if not querys:
+                return self._create_sync_results(states)
+
+            budget = None if budget is None else budget - len(querys)
+            for task, response in self.poolmanager.imap(querys, len(querys)):
+                self._update_sync_state(states[owners[id(task)]], response, count)
+
+    async def _sync_many_async(self, states: dict[Union[str, int], dict], count: int, budget: Optional[int]) -> dict[Union[str, int], WallSync]:
+        """
+        Asynchronous implementation of sync_many.
+
+        :param states: The states of the walls by owners.
+        :param count: Number of posts to retrieve in one query.
+        :param budget: Maximum number of requests for all walls(Optional).
+        :return: Dict where keys are the ids of the owners and values are the results of the sync.
+        """
+
+        while True:
+            querys, owners = self._create_sync_querys(states, count, budget)
+            if not querys:
+                return self._create_sync_results(states)
+
+            budget = None if budget is None else budget - len(querys)
+            async for task, response in self.poolmanager.imap_async(querys, len(querys)):
+                self._update_sync_state(states[owners[id(task)]], response, count)
+
+    @staticmethod
+    def _create_sync_state(owner_id: Union[str, int], since: Optional[int], key: str) -> dict[str, Any]:
+        """
+        Creates the state of the sync of the wall.
+
+        :param owner_id: Id of the owner of the wall.
+        :param since: The high-water mark(Optional).
+        :param key: The field of the mark.
+        :return: Dict with the mark, the offset of the next page, the new posts and the flags.
+        """
+
+        return {
+            "owner_id": owner_id,
+            "since": since,
+            "key": key,
+            "offset": 0,
+            "items": [],
+            "done": False,
+            "complete": False,
+            "requests": 0,
+            "error": None,
+        }
+
+    def _create_sync_querys(self, states: dict[Union[str, int], dict], count: int, budget: Optional[int]) -> tuple[list, dict[int, Union[str, int]]]:
+        """
+        Creates the querys of the next pages of the walls that are not synced.
+
+        :param states: The states of the walls by owners.
+        :param count: Number of posts to retrieve in one query.
+        :param budget: The remaining number of requests(Optional).
+        :return: A tuple containing the list of querys and the dict where keys are the ids of the querys and values are the ids of the owners.
+        """
+
+        querys = []
+        owners = {}
+
+        for owner_id, state in states.items():
+            if state["done"] or (not budget is None and len(querys) >= budget):
+                continue
+
+            params = self._update_all(params=self.base_params.copy(), count=count, offset=state["offset"])
+            for query in self.get_querys_from_data([owner_id], params, submethod="get", multi_ids="owner_ids"):
+                owners[id(query)] = owner_id
+                querys.append(query)
+
+            state["requests"] += 1
+
+        return querys, owners
+
+    def _update_sync_state(self, state: dict[str, Any], response: Any, count: int) -> None:
+        """
+        Adds the new posts of the page to the state and checks if the known posts are reached.
+
+        :param state: The state of the wall.
+        :param response: The response of the page.
+        :param count: Number of posts in one query.
+        """
+
+        try:
+            data = self._get_response_data(response)
+        except VKError as error:
+            state.update(done=True, error=error)
+            return
+
+        since, key = state["since"], state["key"]
+        for post in data["items"]:
+            is_new = since is None or post[key] > since
+            if is_new:
+                state["items"].append(post)
+
+            elif not post.get("is_pinned"):
+                state.update(done=True, complete=True)
+                return
+
+        state["offset"] += count
+        if len(data["items"]) < count or state["offset"] >= data["count"]:
+            state.update(done=True, complete=True)
+
+    @staticmethod
+    def _create_sync_results(states: dict[Union[str, int], dict]) -> dict[Union[str, int], WallSync]:
+        """
+        Creates the results of the sync from the states.
+
+        :param states: The states of the walls by owners.
+        :return: Dict where keys are the ids of the owners and values are the results of the sync.
+        """
+
+        results = {}
+        for owner_id, state in states.items():
+            mark = state["since"]
+            if state["complete"] and state["items"]:
+                mark = max(post[state["key"]] for post in state["items"])
+
+            results[owner_id] = WallSync(owner_id, state["items"], mark, state["complete"], state["requests"], state["error"])
+
+        return results
+
+# Sections of the VK API: the subclasses of Base it was built for and the classes by the name of the attribute
+_sections = {"subclasses": None, "classes": {}}
+
+def get_sections() -> dict[str, type]:
+    """
+    Get the sections(methods) of the VK API.
+
+    ** The registry is built once and shared by all parsers, it is rebuilt only if the subclasses of Base change. **
+
+    :return: Dict where keys are the names of the attributes of ParserVK(users, groups, ...) and values are subclasses of Base.
+    """
+
+    subclasses = tuple(Base.__subclasses__())
+    if _sections["subclasses"] != subclasses:
+        _sections.update(subclasses=subclasses, classes={subclass.__name__.lower(): subclass for subclass in subclasses})
+
+    return _sections["classes"]
 
 class ParserVK(BaseModel):
     """
@@ -387,10 +749,32 @@ class ParserVK(BaseModel):
     
     ** Not all methods and submethods are supported at the moment. You can help us and create your own concept of methods or submethods, then send it to the mail: `codecobra03@gmail.com` **
 
+    ** The default grequests transport monkey-patches the standard library with gevent when the first ParserVK is created, i.e. after the other modules are imported.
+    Modules keeping references to the unpatched socket, ssl or threading objects may block or fail under gevent, so import grequests(or call `gevent.monkey.patch_all()`)
+    at the top of the entry script before the other imports, or select a transport without gevent(requests, threads, urllib3 or asyncio). **
+
     :param tokens: Tokens to VK API.
     :param v_api: Version API. Default 5.132.
     :param headers: Headers.
     :param proxies: Proxies(Optional).
+    :param execute: Flag about packing up to execute_max_calls API calls into one `execute` request. Default: False.
+    :param execute_max_calls: Maximum number of API calls in one `execute` request. Default: 25.
+    :param rate_limit: The number of requests per second for each token, the requests are distributed between the tokens(None disables the limit). Default: 3.0.
+    :param transport: The library used for sending the requests(grequests, asyncio or a transport from TRANSPORTS: requests, threads, urllib3). With asyncio the submethods are awaitable. grequests(gevent) is imported only when it is selected. Default: grequests.
+    :param transport_options: Params of the transport, e.g. {"pool_size": 64, "timeout": 10.0}(For asyncio: limit, timeout). Default: the defaults of the transport.
+    :param api_url: The URL of the VK API. Default: https://api.vk.com/method/.
+    :param max_concurrency: Maximum number of requests in flight, the limit is adapted from 1 to this value by the observed latency and errors(None disables the limit). Default: 100.
+    :param max_retries: Maximum number of retries of a call failed with a transient or token error(0 disables the retries). Default: 3.
+    :param cache: Backend of the cache of users.get and groups.getById records(memory, sqlite or None to disable). Default: None.
+    :param cache_path: Path to the database of the sqlite cache. Default: parservk_cache.sqlite3.
+    :param cache_size: Maximum number of records in the memory cache. Default: 100000.
+    :param cache_ttl: Time to live of the records in seconds by method, e.g. {"users.get": 600}. Default: 3600 for each method.
+    :param cassette: Mode of the cassette of the requests(record saves the requests and responses to cassette_path, replay serves them back without the network, None to disable). Default: None.
+    :param cassette_path: Path to the cassette file. Default: parservk.cassette.
+    :param cassette_time_scale: Multiplier of the recorded response times on replay(0 replays without delays). Default: 1.0.
+    :param metrics: Flag about recording the metrics of the requests, they are available in `parser.request_metrics`(See Metrics). Default: False.
+    :param raise_on_error: Flag about raising the first error of the call of a submethod(See VKError) instead of returning the result without the failed requests.
+        The errors of the last call are available in `parser.errors` in both cases. Default: False.
     :param _dynamic_methods: Private param for create methods.
     """
 
@@ -398,12 +782,40 @@ class ParserVK(BaseModel):
     v_api: float = VERSION_API
     headers: dict[str, Any] = HEADERS
     proxies: Optional[dict[str, Any]] = None
-
-    _dynamic_methods: dict[str, Any] = {}
+    execute: bool = False
+    execute_max_calls: int = ExecuteBatcher.MAX_CALLS
+    rate_limit: Optional[float] = 3.0
+    transport: str = "grequests"
+    transport_options: dict[str, Any] = {}
+    api_url: str = Base.URL_API
+    max_concurrency: Optional[int] = 100
+    max_retries: int = 3
+    cache: Optional[Literal["memory", "sqlite"]] = None
+    cache_path: str = "parservk_cache.sqlite3"
+    cache_size: int = 100000
+    cache_ttl: dict[str, float] = {}
+    cassette: Optional[Literal["record", "replay"]] = None
+    cassette_path: str = "parservk.cassette"
+    cassette_time_scale: float = 1.0
+    metrics: bool = False
+    raise_on_error: bool = False
+
+    _dynamic_methods: dict[str, Any] = PrivateAttr(default_factory=dict)
     
     def __init__(self, **kwargs: Union[set[str], float, dict[str, Any]]) -> None:
     	super().__init__(**kwargs)
-    	self.__create_dynamic_methods()
+    	if self.transport == "grequests":
+    		# gevent patches the standard library before the first request of the parser is created
+    		load_grequests()
+    	self._dynamic_methods["token_scheduler"] = TokenScheduler(self.tokens, rate=self.rate_limit) if self.rate_limit else None
+    	self._dynamic_methods["async_transport"] = AsyncTransport(**self.transport_options) if self.transport == "asyncio" else None
+    	self._dynamic_methods["http_transport"] = None if self.transport in ("grequests", "asyncio") else create_transport(self.transport, **self.transport_options)
+    	self._dynamic_methods["retry_policy"] = RetryPolicy(max_retries=self.max_retries) if self.max_retries else None
+    	self._dynamic_methods["concurrency"] = ConcurrencyController(initial=min(10, self.max_concurrency), maximum=self.max_concurrency) if self.max_concurrency else None
+    	self._dynamic_methods["response_cache"] = self.__create_response_cache()
+    	self._dynamic_methods["request_metrics"] = Metrics() if self.metrics else None
+    	self._dynamic_methods["request_cassette"] = self.__create_cassette()
+    	self._dynamic_methods["errors"] = []
     
     # Temporary implementation
     def __call__(self, method: str, submethod: str, **kwargs: Any):
@@ -424,10 +836,15 @@ class ParserVK(BaseModel):
     def __getattr__(self, name: str) -> Any:
         """
         Get a dynamic methods.
+
+        ** The sections(methods) are created on the first access. **
         
         :return: Value by attr name.
         """
         
+        if not name in self._dynamic_methods and name in get_sections():
+            self.__create_dynamic_method(name)
+
         return self._dynamic_methods.get(name)
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -437,12 +854,64 @@ class ParserVK(BaseModel):
         
         self._dynamic_methods[name] = value
     
-    def __create_dynamic_methods(self) -> None:
+    def __create_response_cache(self) -> Optional[ResponseCache]:
+    	"""
+    	Creates the response cache by the cache settings.
+    	
+    	** The backend can be replaced later, e.g. `parser.response_cache.backend = MyBackend()`. **
+    	"""
+    	
+    	if self.cache is None:
+    		return None
+    	
+    	backend = SQLiteCache(self.cache_path) if self.cache == "sqlite" else MemoryCache(self.cache_size)
+    	
+    	return ResponseCache(backend, ttl=self.cache_ttl, excluded_params=self.headers or {})
+
+    def __create_cassette(self) -> Optional[Cassette]:
     	"""
-    	Creates the main sections(methods) for working with the VK API.
+    	Creates the cassette by the cassette settings.
+    	
+    	** In the record mode the cassette must be closed after the crawl, e.g. `parser.request_cassette.close()`. **
+    	"""
+    	
+    	if self.cassette is None:
+    		return None
+    	
+    	return Cassette(self.cassette_path, self.cassette, time_scale=self.cassette_time_scale, excluded_params=self.headers or {})
+
+    def __create_dynamic_method(self, name: str) -> None:
+    	"""
+    	Creates the main section(method) for working with the VK API.
     	
     	** All available sections(methods) and their submethods can be viewed on the official website at the url: `https://dev.vk.com/en/method` **
+
+    	:param name: The name of the section, e.g. "users".
     	"""
     	
-    	for subclass in Base.__subclasses__():
-    		self._dynamic_methods[subclass.__name__.lower()] = subclass(self)
\ No newline at end of file
+    	self._dynamic_methods[name] = get_sections()[name](self)
+
+class AsyncParserVK(ParserVK):
+    """
+    ParserVK working on the asyncio event loop, the submethods of the sections return coroutines.
+
+    ** Example: `users = await parser.users.get(user_ids=[1, 2])`. With ispool=True the submethods still return the list of querys. **
+
+    :param tokens: Tokens to VK API.
+    :param transport: The library used for sending the requests. Default: asyncio.
+    """
+
+    transport: Literal["asyncio"] = "asyncio"
+
+    async def close(self) -> None:
+    	"""
+    	Close the connections of the asyncio transport.
+    	"""
+
+    	await self.async_transport.close()
+
+    async def __aenter__(self) -> "AsyncParserVK":
+    	return self
+
+    async def __aexit__(self, *args: Any) -> None:
+    	await self.close()
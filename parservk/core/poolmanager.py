@@ -1,9 +1,28 @@
-import inspect
+from __future__ import annotations
+
+import asyncio
+import time
 
-import grequests
 import requests
 
-from typing import Any, Union, Optional
+from itertools import count, islice
+from time import perf_counter
+from typing import Any, AsyncIterator, Iterable, Iterator, Union, Optional, TYPE_CHECKING
+
+from .executebatcher import ExecuteBatcher
+from .tokenscheduler import TokenScheduler
+from .asynctransport import AsyncQuery, AsyncTransport
+from .concurrency import ConcurrencyController
+from .retry import RetryPolicy, get_error_code, create_failed_response
+from .cache import ResponseCache
+from .metrics import Metrics
+from .cassette import Cassette
+from .transports import Transport, RequestsTransport
+from .utils import task_data, task_api_method
+from .geventlib import get_grequests, load_grequests, load_gevent
+
+if TYPE_CHECKING:
+    import grequests
 
 class PoolManager:
     """
@@ -11,13 +30,51 @@ class PoolManager:
     """
     
     __states_dict = {0: "empty", 1: "waiting", 2: "executing", 3: "completed"}
-    __supported_types = ["grequests", "requests"]
-    __supported_types_dict = {"grequests": grequests.AsyncRequest, "requests": (str, dict)}
+    __supported_types = ["grequests", "requests", "asyncio"]
+    __supported_types_dict = {"requests": (str, dict), "asyncio": AsyncQuery}
+    __async_types = ["asyncio"]
     __passed_attrs_for_merge = ["_results", "_callable_results", "_processed_func"]
+    # Counter of the tasks ids shared by all pools, the handlers match the results of the querys and the subquerys by these ids
+    __ids = count()
     session = requests.Session()
 
-    def __init__(self):
-        self._processed_func = {name.split("_")[-1]: func for name, func in inspect.getmembers(self, predicate=inspect.ismethod) if name.split("_")[-1] in self.__supported_types}
+    def __init__(
+        self,
+        batcher: Optional[ExecuteBatcher] = None,
+        token_scheduler: Optional[TokenScheduler] = None,
+        async_transport: Optional[AsyncTransport] = None,
+        concurrency: Optional[ConcurrencyController] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[Metrics] = None,
+        cassette: Optional[Cassette] = None,
+        transport: Optional[Transport] = None,
+    ):
+        """
+        Initializes the pool.
+
+        :param batcher: ExecuteBatcher for packing the tasks into execute requests(Optional).
+        :param token_scheduler: TokenScheduler stamping the access token onto each task when it is dispatched(Optional).
+        :param async_transport: AsyncTransport for the asyncio tasks(Optional, created on the first use).
+        :param concurrency: ConcurrencyController capping the number of requests in flight(Optional, unbounded by default).
+        :param retry_policy: RetryPolicy for requeuing the failed tasks(Optional, the tasks are not retried by default).
+        :param cache: ResponseCache resolving the cached tasks locally and storing the new records(Optional).
+        :param metrics: Metrics of the requests, the stages of each task are timed(Optional, nothing is recorded by default).
+        :param transport: Transport of the requests tasks(Optional, RequestsTransport is created on the first use).
+        :param cassette: Cassette recording the requests and responses or serving the recorded responses instead of sending the requests(Optional).
+        """
+
+        self._batcher = batcher
+        self._token_scheduler = token_scheduler
+        self._async_transport = async_transport
+        self._concurrency = concurrency
+        self._retry_policy = retry_policy
+        self._cache = cache
+        self._metrics = metrics
+        self._cassette = cassette
+        self._transport = transport
+        self._enqueued_at = {}
+        self._processed_func = {name: getattr(self, f"_process_{name}") for name in self.__supported_types}
         self._results = []
         self._callable_results = []
         self._tasks = []
@@ -25,15 +82,17 @@ class PoolManager:
         self._tasks_type = None
         self.state = 0
 
-    @staticmethod
-    def get_id(request: Union[str, dict, grequests.AsyncRequest]) -> int:
+    @classmethod
+    def get_id(cls, request: Union[str, dict, grequests.AsyncRequest]) -> int:
         """
         Get id query.
 
+        ** The ids are taken from a counter, unlike id() they are not reused after the tasks of the previous waves are freed. **
+
         :param query: query.
         :return: id.
         """
-        return id(request)
+        return next(cls.__ids)
     
     def get_ids(
         self, querys: list[Union[str, dict, grequests.AsyncRequest]]
@@ -121,6 +180,25 @@ class PoolManager:
 
         return self.state == 3
 
+    def is_async(self) -> bool:
+        """
+        Check if the tasks are processed on the event loop (start_async must be used).
+
+        :return: True if the type of tasks is asynchronous, False otherwise.
+        """
+
+        return self.is_async_type(self._tasks_type)
+
+    def is_async_type(self, type_tasks: Optional[str]) -> bool:
+        """
+        Check if the type of tasks is processed on the event loop.
+
+        :param type_tasks: The type of tasks.
+        :return: True if the type is asynchronous, False otherwise.
+        """
+
+        return type_tasks in self.__async_types
+
     def is_same_type(self, tasks: list[Union[str, list, grequests.AsyncRequest]], check_to_type: Optional[object] = None) -> bool:
         """
         Check if all tasks are of the same type as check_to_type or self._tasks_type.
@@ -130,7 +208,7 @@ class PoolManager:
         :return: True if all tasks are of the same type, False otherwise.
         """
 
-        check_to_type = check_to_type or self.__supported_types_dict.get(self._tasks_type)
+        check_to_type = check_to_type or self._get_supported_types_dict().get(self._tasks_type)
         return all([isinstance(task, check_to_type) for task in tasks])
 
     def is_supported(
@@ -144,7 +222,7 @@ class PoolManager:
         """
         
         if self.is_state_empty() or self.is_state_completed():
-        	for lib, obj in self.__supported_types_dict.items():
+        	for lib, obj in self._get_supported_types_dict().items():
         		if self.is_same_type(tasks, obj):
         			
         			return (True, lib)
@@ -168,6 +246,9 @@ class PoolManager:
         if check_supported[0]:
             self._tasks_type = self._tasks_type or check_supported[1]
             ids = self.get_ids(tasks)
+            if not self._metrics is None:
+                # The queued tasks are alive until their wave is sent, so id() is unique for them
+                self._enqueued_at.update(dict.fromkeys(map(id, tasks), perf_counter()))
             self._tasks_ids.extend(ids)
             self._tasks.extend(tasks)
             self.state = 1
@@ -202,7 +283,7 @@ class PoolManager:
     	Clear the results list and the callable results.
     	"""
     	
-    	self._clear_results
+    	self._clear_results()
     	self._clear_callable_results()
 
     def clear(self) -> None:
@@ -212,6 +293,7 @@ class PoolManager:
 
         self._tasks_type = None
         self._tasks.clear()
+        self._enqueued_at.clear()
 
     def clear_all(self) -> None:
         """
@@ -232,11 +314,40 @@ class PoolManager:
         
         if not self.is_state_waiting():
         	return
+        if self.is_async():
+            raise RuntimeError(f"The {self._tasks_type} tasks must be processed with start_async.")
         if self.is_state_completed():
         	self.clear_results_all()
         self.state = 2
         results = self._process_tasks()
-        results_ids = self._tasks_ids
+        self._complete(results, callable_func, **kwargs)
+
+    async def start_async(self, callable_func: callable = None, **kwargs: Any) -> None:
+        """
+        Start processing the asyncio tasks on the running event loop.
+
+        :param callable_func: A function to call with the results. Defaults to None.
+        :param kwargs: Named arguments for callable func(Any names except results and ids).
+        :raises RuntimeError: If the type of tasks is not asynchronous.
+        """
+
+        if not self.is_state_waiting():
+            return
+        if not self.is_async():
+            raise RuntimeError(f"The {self._tasks_type} tasks must be processed with start.")
+        self.state = 2
+        results = await self._process_tasks_async()
+        self._complete(results, callable_func, **kwargs)
+
+    def _complete(self, results: list, callable_func: callable = None, **kwargs: Any) -> None:
+        """
+        Complete processing: clear the tasks and pass the results to the callable func.
+
+        :param results: A list of results from the tasks.
+        :param callable_func: A function to call with the results. Defaults to None.
+        :param kwargs: Named arguments for callable func.
+        """
+
         self.clear()
 
         if callable_func:
@@ -246,6 +357,106 @@ class PoolManager:
         self._clear_tasks_ids()
         self.state = 3
     
+    def step(self, callable_func: callable = None, size: Optional[int] = None, **kwargs: Any) -> Any:
+        """
+        Process one wave of the tasks and pass its results to the callable func.
+
+        ** The tasks added by the callable func are queued before the remaining tasks, so the subquerys are completed first. The results of the wave are not kept in the pool. **
+
+        :param callable_func: A function to call with the results of the wave. Defaults to None.
+        :param size: Maximum number of tasks in the wave(Optional, get_wave_size by default).
+        :param kwargs: Named arguments for callable func(Any names except results and ids).
+        :raises RuntimeError: If the type of tasks is asynchronous.
+        :return: The result of the callable func or the results of the wave if the callable func is not passed.
+        """
+
+        if not self.is_state_waiting():
+            return None
+        if self.is_async():
+            raise RuntimeError(f"The {self._tasks_type} tasks must be processed with step_async.")
+
+        tasks, ids, remaining = self._take_wave(size)
+        results = self._run(tasks, self._processed_func.get(self._tasks_type))
+
+        return self._complete_wave(results, ids, remaining, callable_func, **kwargs)
+
+    async def step_async(self, callable_func: callable = None, size: Optional[int] = None, **kwargs: Any) -> Any:
+        """
+        Process one wave of the asyncio tasks on the running event loop, like step.
+
+        :param callable_func: A function to call with the results of the wave. Defaults to None.
+        :param size: Maximum number of tasks in the wave(Optional, get_wave_size by default).
+        :param kwargs: Named arguments for callable func(Any names except results and ids).
+        :raises RuntimeError: If the type of tasks is not asynchronous.
+        :return: The result of the callable func or the results of the wave if the callable func is not passed.
+        """
+
+        if not self.is_state_waiting():
+            return None
+        if not self.is_async():
+            raise RuntimeError(f"The {self._tasks_type} tasks must be processed with step.")
+
+        tasks, ids, remaining = self._take_wave(size)
+        results = await self._run_async(tasks)
+
+        return self._complete_wave(results, ids, remaining, callable_func, **kwargs)
+
+    def get_wave_size(self) -> Optional[int]:
+        """
+        Get the number of tasks processed by one step.
+
+        ** The window of the concurrency controller, multiplied by the number of calls in one execute request if the batcher is set. **
+
+        :return: The size of the wave or None if the requests in flight are not capped(All tasks in one wave).
+        """
+
+        if self._concurrency is None:
+            return None
+
+        return self._concurrency.window * (self._batcher.max_calls if self._batcher else 1)
+
+    def _take_wave(self, size: Optional[int] = None) -> tuple[list, list[int], tuple[list, list[int]]]:
+        """
+        Take the tasks of the next wave from the queue.
+
+        :param size: Maximum number of tasks in the wave(Optional, get_wave_size by default).
+        :return: A tuple containing the tasks of the wave, their ids and the remaining tasks with their ids.
+        """
+
+        size = size or self.get_wave_size() or len(self._tasks)
+        tasks, ids = self._tasks[:size], self._tasks_ids[:size]
+        remaining = (self._tasks[size:], self._tasks_ids[size:])
+        self._tasks, self._tasks_ids = [], []
+        self.state = 2
+
+        return tasks, ids, remaining
+
+    def _complete_wave(
+        self, results: list, ids: list[int], remaining: tuple[list, list[int]], callable_func: callable = None, **kwargs: Any
+    ) -> Any:
+        """
+        Complete the wave: pass the results to the callable func and return the remaining tasks to the queue after the added ones.
+
+        :param results: A list of results of the wave.
+        :param ids: A list of ids of the wave.
+        :param remaining: The remaining tasks with their ids.
+        :param callable_func: A function to call with the results. Defaults to None.
+        :param kwargs: Named arguments for callable func.
+        :return: The result of the callable func or the results of the wave if the callable func is not passed.
+        """
+
+        result = callable_func(results=results, ids=ids, **kwargs) if callable_func else results
+
+        self._tasks.extend(remaining[0])
+        self._tasks_ids.extend(remaining[1])
+        if self._tasks:
+            self.state = 1
+        else:
+            self._tasks_type = None
+            self.state = 3
+
+        return result
+
     def _get_attrs_from_init(self) -> list[str]:
         """
         Retrieves a list of attributes defined in the object's __init__ method.
@@ -303,33 +514,524 @@ class PoolManager:
 
         func = self._processed_func.get(self._tasks_type)
 
-        return func() if func else None
+        if not func:
+            return None
 
-    def _process_grequests(self) -> list:
+        results = self._run(self._tasks, func)
+        self._results.extend(results)
+
+        return results
+
+    def _run(self, tasks: list, func: callable) -> list:
         """
-        Process the tasks using grequests.
+        Send the tasks and requeue the failed ones.
 
-        :return: A list of results from the tasks.
+        ** If the retry policy is set, the failed tasks are requeued with backoff, the tasks keep their ids. **
+
+        :param tasks: A list of tasks.
+        :param func: Processing function of the type of tasks.
+        :return: A list of results, where each failed task has a response with the VK-like error payload.
+        """
+
+        self._observe_queue(tasks)
+        results = self._dispatch(tasks, func)
+        attempt = 1
+        retry_indexes = self._get_retry_indexes(tasks, results)
+
+        while retry_indexes and attempt <= self._retry_policy.max_retries:
+            time.sleep(self._retry_policy.delay(attempt))
+            retry_tasks = self._reset_tasks([tasks[index] for index in retry_indexes])
+            for index, result in zip(retry_indexes, self._dispatch(retry_tasks, func)):
+                results[index] = result
+
+            attempt += 1
+            retry_indexes = self._get_retry_indexes(tasks, results, retry_indexes)
+
+        return self._finish_results(tasks, results)
+
+    def imap(self, tasks: Iterable, size: int = 10) -> Iterator[tuple[Any, Any]]:
+        """
+        Send the tasks lazily and yield the results as they come in.
+
+        ** At most size tasks are taken from the iterable and kept in flight at once, so the memory is bounded for any number of tasks. The pool tasks and results are not affected. **
+
+        :param tasks: An iterable of tasks(For example, a generator of paginated querys).
+        :param size: Maximum number of tasks in flight. Default: 10.
+        :raises TypeError: If the type of tasks is not supported or asynchronous.
+        :return: A generator of tuples (task, result) in the order of the tasks.
+        """
+
+        iterator = iter(tasks)
+        while True:
+            wave = list(islice(iterator, size))
+            if not wave:
+                return
+
+            type_tasks = self._get_type(wave)
+            func = self._processed_func.get(type_tasks)
+            if func is None or self.is_async_type(type_tasks):
+                raise TypeError("The type must be the same for all tasks and belong to (str, grequests.AsyncRequest, dict)")
+
+            yield from zip(wave, self._run(wave, func))
+
+    async def imap_async(self, tasks: Iterable, size: int = 10) -> AsyncIterator[tuple[Any, Any]]:
+        """
+        Send the asyncio tasks lazily and yield the results as they come in, like imap.
+
+        :param tasks: An iterable of tasks.
+        :param size: Maximum number of tasks in flight. Default: 10.
+        :return: An asynchronous generator of tuples (task, result) in the order of the tasks.
+        """
+
+        iterator = iter(tasks)
+        while True:
+            wave = list(islice(iterator, size))
+            if not wave:
+                return
+
+            for item in zip(wave, await self._run_async(wave)):
+                yield item
+
+    def _get_type(self, tasks: list) -> Optional[str]:
+        """
+        Get the type of the tasks regardless of the pool state.
+
+        :param tasks: A list of tasks.
+        :return: The type of tasks or None if it is not supported.
+        """
+
+        for lib, obj in self._get_supported_types_dict().items():
+            if self.is_same_type(tasks, obj):
+
+                return lib
+
+    def _get_supported_types_dict(self) -> dict[str, Union[type, tuple[type, ...]]]:
+        """
+        Get the classes of the tasks by type.
+
+        ** The class of the grequests tasks is added only if grequests is loaded, there are no grequests tasks otherwise. **
+
+        :return: Dict where keys are the types of tasks and values are the classes of the tasks.
+        """
+
+        grequests = get_grequests()
+        if grequests is None:
+            return self.__supported_types_dict
+
+        return {"grequests": grequests.AsyncRequest, **self.__supported_types_dict}
+
+    def _dispatch(self, tasks: list, func: callable) -> list:
+        """
+        Send the tasks with the processing function.
+
+        ** If the cache is set, the cached tasks are resolved locally and only the other tasks are sent. **
+
+        :param tasks: A list of tasks.
+        :param func: Processing function of the type of tasks.
+        :return: A list of results in the order of the tasks.
+        """
+
+        if self._cache is None:
+            return self._send_tasks(tasks, func)
+
+        results, indexes = self._cache.resolve(tasks)
+        sent_tasks = [tasks[index] for index in indexes]
+        for index, result in zip(indexes, self._cache.store(sent_tasks, self._send_tasks(sent_tasks, func))):
+            results[index] = result
+
+        return results
+
+    def _send_tasks(self, tasks: list, func: callable) -> list:
+        """
+        Send the tasks with the processing function.
+
+        ** If the batcher is set, the tasks are packed into execute requests and the results are split back per task. **
+
+        :param tasks: A list of tasks.
+        :param func: Processing function of the type of tasks.
+        :return: A list of results in the order of the tasks.
+        """
+
+        if not tasks:
+            return []
+
+        if self._batcher is None:
+            return self._observe_responses(tasks, self._transmit(tasks, func))
+
+        packed_tasks, layout = self._batcher.pack(tasks)
+        return self._batcher.unpack(tasks, packed_tasks, layout, self._observe_responses(packed_tasks, self._transmit(packed_tasks, func)))
+
+    def _transmit(self, tasks: list, func: callable) -> list:
+        """
+        Send the tasks with the processing function or replay them from the cassette.
+
+        :param tasks: A list of tasks.
+        :param func: Processing function of the type of tasks.
+        :return: A list of responses(None for the failed tasks).
+        """
+
+        if self._cassette is None:
+            return func(tasks)
+
+        if not self._cassette.is_replay():
+            return self._cassette.record(tasks, func(tasks))
+
+        return self._replay(tasks)
+
+    def _replay(self, tasks: list) -> list:
+        """
+        Serve the recorded responses of the tasks.
+
+        ** The tasks are stamped by the token scheduler and split into waves like the sent tasks, each wave waits for its longest recorded response. **
+
+        :param tasks: A list of tasks.
+        :return: A list of responses(None for the failed tasks).
+        """
+
+        results = []
+        for wave in self._iter_waves(tasks):
+            responses = [self._cassette.play(self._prepare_task(task)) for task in wave]
+            time.sleep(self._cassette.delay(responses))
+            self._observe_wave(responses)
+            results.extend(responses)
+
+        return results
+
+    def _observe_queue(self, tasks: list) -> None:
+        """
+        Records the time the tasks spent in the pool before their wave was sent.
+
+        :param tasks: A list of tasks of the wave(The tasks of imap are not queued in the pool and are skipped).
+        """
+
+        if self._metrics is None:
+            return
+
+        now = perf_counter()
+        for task in tasks:
+            enqueued_at = self._enqueued_at.pop(id(task), None)
+            if not enqueued_at is None:
+                self._metrics.observe("queue", task_api_method(task), now - enqueued_at)
+
+    def _observe_responses(self, tasks: list, responses: list) -> list:
+        """
+        Records the network time, the bytes and the error codes of the sent requests.
+
+        ** The network time is the elapsed time of the response(Until the headers are received). With the batcher the requests are counted as execute. **
+
+        :param tasks: A list of sent tasks.
+        :param responses: A list of responses of the tasks(None for the failed tasks).
+        :return: The same responses.
+        """
+
+        if self._metrics is None:
+            return responses
+
+        for task, response in zip(tasks, responses):
+            method = task_api_method(task)
+            if response is None:
+                self._metrics.add_request(method, error_code=0)
+                continue
+
+            body = getattr(response.request, "body", None) or ""
+            self._metrics.observe("network", method, response.elapsed.total_seconds())
+            self._metrics.add_request(method, len(body), len(response.content), get_error_code(response))
+
+        return responses
+
+    def _get_retry_indexes(self, tasks: list, results: list, indexes: Optional[list[int]] = None) -> list[int]:
+        """
+        Get the indexes of the tasks that should be retried.
+
+        ** Tasks failed on the token are retried only if the token can be removed from the rotation and other tokens remain. **
+
+        :param tasks: A list of tasks.
+        :param results: A list of results of the tasks.
+        :param indexes: Indexes to check(Optional, all by default).
+        :return: A list of indexes.
+        """
+
+        if self._retry_policy is None:
+            return []
+
+        retry_indexes = []
+        for index in range(len(tasks)) if indexes is None else indexes:
+            kind = self._retry_policy.classify(get_error_code(results[index]))
+
+            if kind == RetryPolicy.RETRYABLE or (kind == RetryPolicy.TOKEN and self._disable_token(tasks[index])):
+                retry_indexes.append(index)
+
+        return retry_indexes
+
+    def _disable_token(self, task: Union[str, dict, grequests.AsyncRequest, AsyncQuery]) -> bool:
+        """
+        Remove the access token of the task from the rotation of the token scheduler.
+
+        :param task: The task failed on the token.
+        :return: True if the task can be retried on another token, False otherwise.
+        """
+
+        if self._token_scheduler is None or len(self._token_scheduler.tokens) < 2:
+            return False
+
+        self._token_scheduler.disable(task_data(task).get("access_token"))
+        return True
+
+    @staticmethod
+    def _reset_tasks(tasks: list) -> list:
+        """
+        Reset the responses of the tasks before they are sent again.
+
+        :param tasks: A list of tasks.
+        :return: The same tasks.
+        """
+
+        for task in tasks:
+            if hasattr(task, "response"):
+                task.response = None
+
+        return tasks
+
+    @staticmethod
+    def _finish_results(tasks: list, results: list) -> list:
+        """
+        Replace the results of the failed tasks with error responses.
+
+        :param tasks: A list of tasks.
+        :param results: A list of results of the tasks.
+        :return: A list of results, where each failed task has a response with the VK-like error payload.
+        """
+
+        return [create_failed_response(task) if result is None else result for task, result in zip(tasks, results)]
+
+    def _prepare_task(self, task: Union[str, dict, grequests.AsyncRequest]) -> Union[str, dict, grequests.AsyncRequest]:
+        """
+        Prepare the task right before it is sent.
+
+        ** If the token scheduler is set, waits for the token that can send the task soonest and stamps it onto the task. **
+
+        :param task: The task to prepare.
+        :return: The prepared task.
         """
-        response = grequests.map(self._tasks)
-        self._results.extend(response)
-        return response
 
-    def _process_requests(self) -> list:
+        if self._token_scheduler is None:
+            return task
+
+        if self._metrics is None:
+            return self._token_scheduler.stamp(task)
+
+        start = perf_counter()
+        self._token_scheduler.stamp(task)
+        self._metrics.observe("throttle", task_api_method(task), perf_counter() - start)
+
+        return task
+
+    def _send_grequest(self, task: grequests.AsyncRequest) -> None:
+        """
+        Prepare and send the grequests task.
+
+        :param task: The task to send.
         """
-        Process the tasks using requests.
+
+        self._prepare_task(task).send()
+
+    async def _process_tasks_async(self) -> list:
+        """
+        Process the asyncio tasks.
 
         :return: A list of results from the tasks.
         """
-        
-        for task in self._tasks:
-            if isinstance(task, str):
-                response = self.session.post(task)
+
+        results = await self._run_async(self._tasks)
+        self._results.extend(results)
+
+        return results
+
+    async def _run_async(self, tasks: list) -> list:
+        """
+        Send the asyncio tasks and requeue the failed ones like _run.
+
+        :param tasks: A list of tasks.
+        :return: A list of results, where each failed task has a response with the VK-like error payload.
+        """
+
+        self._observe_queue(tasks)
+        results = await self._dispatch_async(tasks)
+        attempt = 1
+        retry_indexes = self._get_retry_indexes(tasks, results)
+
+        while retry_indexes and attempt <= self._retry_policy.max_retries:
+            await asyncio.sleep(self._retry_policy.delay(attempt))
+            retry_tasks = self._reset_tasks([tasks[index] for index in retry_indexes])
+            for index, result in zip(retry_indexes, await self._dispatch_async(retry_tasks)):
+                results[index] = result
+
+            attempt += 1
+            retry_indexes = self._get_retry_indexes(tasks, results, retry_indexes)
+
+        return self._finish_results(tasks, results)
+
+    async def _dispatch_async(self, tasks: list) -> list:
+        """
+        Send the asyncio tasks, resolving the cached tasks locally like _dispatch.
+
+        :param tasks: A list of tasks.
+        :return: A list of results in the order of the tasks.
+        """
+
+        if self._cache is None:
+            return await self._send_tasks_async(tasks)
+
+        results, indexes = self._cache.resolve(tasks)
+        sent_tasks = [tasks[index] for index in indexes]
+        for index, result in zip(indexes, self._cache.store(sent_tasks, await self._send_tasks_async(sent_tasks))):
+            results[index] = result
+
+        return results
+
+    async def _send_tasks_async(self, tasks: list) -> list:
+        """
+        Send the asyncio tasks, packing them into execute requests if the batcher is set.
+
+        :param tasks: A list of tasks.
+        :return: A list of results in the order of the tasks.
+        """
+
+        if not tasks:
+            return []
+
+        if self._batcher is None:
+            return self._observe_responses(tasks, await self._transmit_async(tasks))
+
+        packed_tasks, layout = self._batcher.pack(tasks)
+        return self._batcher.unpack(tasks, packed_tasks, layout, self._observe_responses(packed_tasks, await self._transmit_async(packed_tasks)))
+
+    async def _transmit_async(self, tasks: list) -> list:
+        """
+        Send the asyncio tasks and record them if the cassette is recording(The replayed tasks are served in _send_async).
+
+        :param tasks: A list of tasks.
+        :return: A list of responses(None for the failed tasks).
+        """
+
+        responses = await self._process_asyncio(tasks)
+        if self._cassette is None or self._cassette.is_replay():
+            return responses
+
+        return self._cassette.record(tasks, responses)
+
+    async def _send_async(self, task: AsyncQuery) -> Any:
+        """
+        Prepare and send the asyncio task.
+
+        :param task: The task to send.
+        :return: The result of the task(None if the task failed).
+        """
+
+        if not self._token_scheduler is None:
+            start = perf_counter()
+            await self._token_scheduler.stamp_async(task)
+            if not self._metrics is None:
+                self._metrics.observe("throttle", task_api_method(task), perf_counter() - start)
+
+        if not self._cassette is None and self._cassette.is_replay():
+            response = self._cassette.play(task)
+            await asyncio.sleep(self._cassette.delay([response]))
+
+            return response
+
+        return await self.get_async_transport().send(task)
+
+    async def _process_asyncio(self, tasks: list) -> list:
+        """
+        Process the tasks using the asyncio transport.
+
+        ** If the concurrency controller is set, the tasks are sent in waves of at most window tasks. **
+
+        :param tasks: A list of tasks.
+        :return: A list of results from the tasks(None for the failed tasks).
+        """
+
+        results = []
+        for wave in self._iter_waves(tasks):
+            responses = list(await asyncio.gather(*(self._send_async(task) for task in wave)))
+            self._observe_wave(responses)
+            results.extend(responses)
+
+        return results
+
+    def _iter_waves(self, tasks: list):
+        """
+        Split the tasks into waves according to the window of the concurrency controller.
+
+        ** The window is read before each wave, so it follows the adaptation after the previous wave. **
+
+        :param tasks: A list of tasks.
+        :return: A generator of lists of tasks.
+        """
+
+        if self._concurrency is None:
+            yield tasks
+            return
+
+        index = 0
+        while index < len(tasks):
+            wave = tasks[index : index + self._concurrency.window]
+            index += len(wave)
+            yield wave
+
+    def _observe_wave(self, responses: list) -> None:
+        """
+        Pass the responses of the wave to the concurrency controller.
+
+        :param responses: The responses of the wave.
+        """
+
+        if not self._concurrency is None:
+            self._concurrency.observe(responses)
+
+    def _process_grequests(self, tasks: list) -> list:
+        """
+        Process the tasks using grequests.
+
+        ** If the concurrency controller is set, the tasks are sent in waves of at most window tasks. **
+
+        :param tasks: A list of tasks.
+        :return: A list of results from the tasks(None for the failed tasks).
+        """
+
+        results = []
+        for wave in self._iter_waves(tasks):
+            if self._token_scheduler is None:
+                responses = load_grequests().map(wave)
             else:
-                response = self.session.post(**task)
-            self._results.append(response)
+                gevent = load_gevent()
+                gevent.joinall([gevent.spawn(self._send_grequest, task) for task in wave])
+                responses = [task.response for task in wave]
 
-        return self._results
+            self._observe_wave(responses)
+            results.extend(responses)
+
+        return results
+
+    def _process_requests(self, tasks: list) -> list:
+        """
+        Process the tasks using the transport of the requests tasks(See TRANSPORTS).
+
+        ** If the concurrency controller is set, the tasks are sent in waves of at most window tasks. **
+
+        :param tasks: A list of tasks.
+        :return: A list of results from the tasks(None for the failed tasks).
+        """
+
+        transport = self.get_transport()
+        results = []
+        for wave in self._iter_waves(tasks):
+            responses = transport.send(wave, self._prepare_task)
+            self._observe_wave(responses)
+            results.extend(responses)
+
+        return results
 
     @property
     def tasks(self) -> list[Union[str, dict, grequests.AsyncRequest]]:
@@ -358,7 +1060,7 @@ class PoolManager:
                 f"Tasks should be of the list type, not the type {new_tasks.__class__.__name__}"
             )
         self._tasks = new_tasks
-        self._tasks_ids = get_ids(self._tasks)
+        self._tasks_ids = self.get_ids(self._tasks)
         return self._tasks
 
     @property
@@ -389,6 +1091,118 @@ class PoolManager:
         self._tasks_type = type
         return self._tasks_type
 
+    @property
+    def batcher(self) -> Optional[ExecuteBatcher]:
+        """
+        Get the execute batcher.
+
+        :return: ExecuteBatcher if the tasks are packed into execute requests, otherwise None.
+        """
+
+        return self._batcher
+
+    @batcher.setter
+    def batcher(self, new_batcher: Optional[ExecuteBatcher]) -> Optional[ExecuteBatcher]:
+        """
+        Set the execute batcher.
+
+        :param new_batcher: ExecuteBatcher or None to disable packing.
+        :raises TypeError: If the new batcher is not an ExecuteBatcher or None.
+        :return: The updated batcher.
+        """
+
+        if not new_batcher is None and not isinstance(new_batcher, ExecuteBatcher):
+            raise TypeError(
+                f"The batcher should be of the ExecuteBatcher type, not the type {new_batcher.__class__.__name__}"
+            )
+
+        self._batcher = new_batcher
+        return self._batcher
+
+    @property
+    def token_scheduler(self) -> Optional[TokenScheduler]:
+        """
+        Get the token scheduler.
+
+        :return: TokenScheduler if the access tokens are stamped on dispatch, otherwise None.
+        """
+
+        return self._token_scheduler
+
+    def get_transport(self) -> Transport:
+        """
+        Get the transport of the requests tasks, it is created on the first use if it was not passed.
+
+        :return: Transport.
+        """
+
+        if self._transport is None:
+            self._transport = RequestsTransport()
+
+        return self._transport
+
+    def get_async_transport(self) -> AsyncTransport:
+        """
+        Get the asyncio transport, it is created on the first use if it was not passed.
+
+        :return: AsyncTransport.
+        """
+
+        if self._async_transport is None:
+            self._async_transport = AsyncTransport()
+
+        return self._async_transport
+
+    @property
+    def concurrency(self) -> Optional[ConcurrencyController]:
+        """
+        Get the concurrency controller, its window and stats show the current limit of the requests in flight.
+
+        :return: ConcurrencyController if the requests in flight are capped, otherwise None.
+        """
+
+        return self._concurrency
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """
+        Get the response cache.
+
+        :return: ResponseCache if the records of the cached methods are reused, otherwise None.
+        """
+
+        return self._cache
+
+    @property
+    def cassette(self) -> Optional[Cassette]:
+        """
+        Get the cassette.
+
+        :return: Cassette if the requests are recorded or replayed, otherwise None.
+        """
+
+        return self._cassette
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        """
+        Get the metrics of the requests.
+
+        :return: Metrics if the stages of the tasks are timed, otherwise None.
+        """
+
+        return self._metrics
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """
+        Get the retry policy.
+
+        :return: RetryPolicy if the failed tasks are requeued, otherwise None.
+        """
+
+        return self._retry_policy
+
     @property
     def results(self) -> list:
         """
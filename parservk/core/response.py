@@ -0,0 +1,204 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+from requests import HTTPError
+
+from . import jsonlib
+
+
+class StaticResponse:
+    """
+    A response built locally from already received data.
+
+    ** Mimics the part of the requests.Response interface used by the handlers (url, status_code, json, raise_for_status, request.body). **
+    """
+
+    def __init__(
+        self,
+        url: str,
+        payload: Any = None,
+        *,
+        content: Optional[bytes] = None,
+        status_code: int = 200,
+        data: Optional[dict] = None,
+        elapsed: Optional[timedelta] = None,
+    ) -> None:
+        """
+        Initializes the response.
+
+        :param url: The URL of the original query.
+        :param payload: Decoded body of the response(Optional if content is passed).
+        :param content: Raw body of the response(Optional if payload is passed).
+        :param status_code: HTTP status code. Default: 200.
+        :param data: POST data of the original query(Optional).
+        :param elapsed: Time spent on the original query(Optional).
+        """
+
+        self.url = url
+        self.status_code = status_code
+        self._payload = payload
+        self._content = content
+        self.elapsed = elapsed or timedelta()
+        self.request = SimpleNamespace(url=url, body=urlencode(data or {}))
+
+    @property
+    def ok(self) -> bool:
+        """
+        Check if the status code is less than 400.
+
+        :return: True if the status code is less than 400, False otherwise.
+        """
+
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        """
+        Get the raw body of the response.
+
+        :return: The body of the response.
+        """
+
+        if self._content is None:
+            self._content = jsonlib.dumps(self._payload)
+
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """
+        Get the body of the response as a string.
+
+        :return: The body of the response.
+        """
+
+        return self.content.decode()
+
+    def json(self, **kwargs: Any) -> Any:
+        """
+        Get the decoded body of the response.
+
+        :param kwargs: Not used, kept for compatibility with requests.Response.json.
+        :return: The decoded body.
+        """
+
+        if self._payload is None:
+            self._payload = jsonlib.loads(self._content)
+
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        """
+        Raises HTTPError if the status code is 400 or higher.
+
+        :raises HTTPError: If the status code is 400 or higher.
+        """
+
+        if not self.ok:
+            raise HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class VKResponse:
+    """
+    Wrapper of a response decoding its body exactly once.
+
+    ** The handlers get the decoded payload through `data` and `error` instead of calling json() on every check. The other attributes are taken from the wrapped response. **
+    """
+
+    def __init__(self, response: Any) -> None:
+        """
+        Initializes the wrapper.
+
+        :param response: The response (requests.Response or StaticResponse).
+        """
+
+        self.response = response
+        self._payload = None
+        self._exception = None
+        self._decoded = False
+
+    @classmethod
+    def wrap(cls, response: Any) -> "VKResponse":
+        """
+        Wraps the response if it is not wrapped yet.
+
+        :param response: The response or VKResponse.
+        :return: VKResponse.
+        """
+
+        return response if isinstance(response, cls) else cls(response)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.response, name)
+
+    def json(self, **kwargs: Any) -> Any:
+        """
+        Get the decoded body, the body is decoded on the first call only.
+
+        :param kwargs: Not used, kept for compatibility with requests.Response.json.
+        :return: The decoded body.
+        :raises ValueError: If the body is not valid JSON.
+        """
+
+        if not self._decoded:
+            try:
+                if isinstance(self.response, StaticResponse):
+                    self._payload = self.response.json()
+                else:
+                    self._payload = jsonlib.loads(self.response.content)
+            except Exception as e:
+                self._exception = e
+
+            self._decoded = True
+
+        if not self._exception is None:
+            raise ValueError(f"Invalid JSON in the response: {self._exception}") from self._exception
+
+        return self._payload
+
+    def is_valid(self) -> bool:
+        """
+        Check if the request succeeded and VK returned the response without an error.
+
+        :return: True if the response is valid, False otherwise.
+        """
+
+        try:
+            self.response.raise_for_status()
+
+            return not "error" in self.json()
+        except Exception:
+
+            return False
+
+    @property
+    def data(self) -> Any:
+        """
+        Get the "response" part of the decoded body.
+
+        :return: The data of the response or None if there is no data.
+        """
+
+        try:
+            payload = self.json()
+        except ValueError:
+            return None
+
+        return payload.get("response") if isinstance(payload, dict) else None
+
+    @property
+    def error(self) -> Optional[dict]:
+        """
+        Get the VK error of the response.
+
+        :return: The "error" part of the decoded body or None if there is no error.
+        """
+
+        try:
+            payload = self.json()
+        except ValueError:
+            return None
+
+        return payload.get("error") if isinstance(payload, dict) else None
@@ -0,0 +1,184 @@
+import re
+import random
+
+from typing import Any, Optional
+
+from .response import StaticResponse
+from .utils import task_url, task_data, task_api_method
+
+
+RE_ERROR_CODE = re.compile(rb'"error_code"\s*:\s*(\d+)')
+
+# Error codes of the failed requests without a VK error: network errors, 5xx and 429 statuses, and the other 4xx statuses
+NETWORK_ERROR_CODE = 0
+CLIENT_ERROR_CODE = -1
+
+
+def is_client_error(response: Any) -> bool:
+    """
+    Check if the response has a 4xx status that will not change on retry(Any 4xx except 429 Too Many Requests).
+
+    :param response: The response (requests.Response, StaticResponse or None).
+    :return: True if the status is a permanent client error, False otherwise.
+    """
+
+    return not response is None and 400 <= response.status_code < 500 and response.status_code != 429
+
+
+def get_error_code(response: Any) -> Optional[int]:
+    """
+    Get the VK error code of the response without decoding the whole body.
+
+    :param response: The response (requests.Response, StaticResponse or None).
+    :return: The error code, CLIENT_ERROR_CODE(-1) for 4xx statuses except 429, NETWORK_ERROR_CODE(0) if the request failed or the status is not ok otherwise,
+        None if there is no error.
+    """
+
+    if is_client_error(response):
+        return CLIENT_ERROR_CODE
+
+    if response is None or not response.ok:
+        return NETWORK_ERROR_CODE
+
+    content = response.content
+    if not content.lstrip()[:9] == b'{"error":':
+        return None
+
+    match = RE_ERROR_CODE.search(content)
+
+    return int(match.group(1)) if match else 0
+
+
+class VKError(Exception):
+    """
+    Structured error of a VK API call that could not be completed.
+
+    ** The full list of error codes can be viewed on the official website at the url: `https://dev.vk.com/en/reference/errors` **
+    """
+
+    def __init__(self, code: int, message: str, method: str = "", params: Optional[dict] = None, kind: str = "permanent") -> None:
+        """
+        Initializes the error.
+
+        :param code: VK error code, 0 if the request failed without a VK error(Network error, 5xx or 429 status), -1 for the other 4xx statuses.
+        :param message: Error message.
+        :param method: VK API method, e.g. "wall.get".
+        :param params: Params of the call without the access token(Optional).
+        :param kind: Kind of the error(retryable, token or permanent). Default: permanent.
+        """
+
+        super().__init__(f"[{code}] {message} ({method})")
+        self.code = code
+        self.message = message
+        self.method = method
+        self.params = params or {}
+        self.kind = kind
+
+    @classmethod
+    def from_response(cls, response: Any, kind: str = "permanent") -> "VKError":
+        """
+        Creates the error from the response.
+
+        :param response: The response of the call.
+        :param kind: Kind of the error. Default: permanent.
+        :return: VKError.
+        """
+
+        method = task_api_method(response)
+
+        try:
+            response.raise_for_status()
+            error = response.json()["error"]
+        except Exception as e:
+            code = CLIENT_ERROR_CODE if is_client_error(response) else NETWORK_ERROR_CODE
+
+            return cls(code, f"HTTP {response.status_code}: {e}", method, kind=kind)
+
+        params = {
+            param.get("key"): param.get("value")
+            for param in error.get("request_params", [])
+            if not param.get("key") in ("access_token", "method", "oauth")
+        }
+
+        return cls(error.get("error_code", 0), error.get("error_msg", ""), method, params, kind)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the error as a dict.
+
+        :return: Dict with code, message, method, params and kind.
+        """
+
+        return {"code": self.code, "message": self.message, "method": self.method, "params": self.params, "kind": self.kind}
+
+
+class RetryPolicy:
+    """
+    Policy classifying VK error codes and computing the delays of the retries.
+
+    ** Retryable errors are requeued with exponential backoff and full jitter, token errors are requeued on another token, permanent errors are reported.
+    Of the failed requests without a VK error only the network errors, 5xx and 429 statuses are retried, the other 4xx statuses(CLIENT_ERROR_CODE) are permanent. **
+    """
+
+    RETRYABLE = "retryable"
+    TOKEN = "token"
+    PERMANENT = "permanent"
+
+    RETRYABLE_CODES = (NETWORK_ERROR_CODE, 1, 6, 9, 10)
+    TOKEN_CODES = (5, 17, 29)
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 8.0) -> None:
+        """
+        Initializes the policy.
+
+        :param max_retries: Maximum number of retries of one call. Default: 3.
+        :param base_delay: Delay of the first retry in seconds. Default: 0.5.
+        :param max_delay: Maximum delay of a retry in seconds. Default: 8.0.
+        """
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def classify(self, code: Optional[int]) -> Optional[str]:
+        """
+        Classify the error code.
+
+        :param code: VK error code, 0 for network errors, 5xx and 429 statuses, -1 for the other 4xx statuses, None if there is no error.
+        :return: retryable, token, permanent or None if there is no error.
+        """
+
+        if code is None:
+            return None
+
+        if code in self.RETRYABLE_CODES:
+            return self.RETRYABLE
+
+        if code in self.TOKEN_CODES:
+            return self.TOKEN
+
+        return self.PERMANENT
+
+    def delay(self, attempt: int) -> float:
+        """
+        Get the delay before the retry.
+
+        :param attempt: Number of the retry, starting from 1.
+        :return: Random delay in seconds from 0 to base_delay * 2 ** (attempt - 1)(But not more than max_delay).
+        """
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def create_failed_response(task: Any) -> StaticResponse:
+    """
+    Creates a response for a task that failed without a response(Network error).
+
+    :param task: The failed task.
+    :return: StaticResponse with the VK-like error payload.
+    """
+
+    exception = getattr(task, "exception", None)
+    message = f"Request failed: {exception}" if exception else "Request failed"
+
+    return StaticResponse(task_url(task), {"error": {"error_code": 0, "error_msg": message}}, data=task_data(task))
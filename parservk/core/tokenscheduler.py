@@ -0,0 +1,195 @@
+import time
+import asyncio
+import threading
+
+from typing import Any, Callable, Iterable, Optional
+
+from .utils import task_data
+
+
+class TokenBucket:
+    """
+    Token bucket limiting the rate of requests of one access token.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes the bucket.
+
+        :param rate: The number of requests per second.
+        :param capacity: Maximum burst of requests. Default: rate.
+        :param clock: Function returning the current time in seconds. Default: time.monotonic.
+        :raises ValueError: If rate is not positive.
+        """
+
+        if rate <= 0:
+            raise ValueError("The rate must be positive.")
+
+        self.rate = rate
+        self.capacity = max(capacity or rate, 1)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+
+    def _refill(self, now: float) -> None:
+        """
+        Adds the tokens accumulated since the last update.
+
+        :param now: Current time.
+        """
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: Optional[float] = None) -> float:
+        """
+        Get the time until the next request can be sent.
+
+        :param now: Current time(Optional).
+        :return: Delay in seconds, 0 if the request can be sent now.
+        """
+
+        self._refill(self.clock() if now is None else now)
+
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def reserve(self, now: Optional[float] = None) -> float:
+        """
+        Reserves a request.
+
+        ** The tokens can go negative, so the following reservations are delayed accordingly. **
+
+        :param now: Current time(Optional).
+        :return: Delay in seconds after which the reserved request can be sent.
+        """
+
+        delay = self.delay(now)
+        self.tokens -= 1
+
+        return delay
+
+
+class TokenScheduler:
+    """
+    Scheduler distributing the requests between access tokens, each token has its own token bucket.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        rate: float = 3.0,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], Any]] = None,
+    ) -> None:
+        """
+        Initializes the scheduler.
+
+        :param tokens: Access tokens.
+        :param rate: The number of requests per second for each token. Default: 3.0.
+        :param capacity: Maximum burst of requests for each token. Default: rate.
+        :param clock: Function returning the current time in seconds. Default: time.monotonic.
+        :param sleep: Function for waiting(Optional, time.sleep is looked up on each wait, so it is cooperative once gevent patches the process).
+        :raises ValueError: If tokens is empty.
+        """
+
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets = {token: TokenBucket(rate, capacity, clock) for token in tokens}
+
+        if not self._buckets:
+            raise ValueError("At least one token is required.")
+
+    def reserve(self) -> tuple[str, float]:
+        """
+        Reserves a request on the token that can send it soonest.
+
+        :return: A tuple containing the token and delay in seconds after which the request can be sent.
+        :raises RuntimeError: If all tokens are disabled.
+        """
+
+        with self._lock:
+            if not self._buckets:
+                raise RuntimeError("All tokens are disabled.")
+
+            now = self.clock()
+            token = min(self._buckets, key=lambda token: self._buckets[token].delay(now))
+
+            return token, self._buckets[token].reserve(now)
+
+    def acquire(self) -> str:
+        """
+        Waits until one of the tokens can send a request.
+
+        :return: Access token.
+        """
+
+        token, delay = self.reserve()
+        if delay:
+            (time.sleep if self.sleep is None else self.sleep)(delay)
+
+        return token
+
+    async def acquire_async(self) -> str:
+        """
+        Waits on the event loop until one of the tokens can send a request.
+
+        :return: Access token.
+        """
+
+        token, delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+        return token
+
+    def stamp(self, task: Any) -> Any:
+        """
+        Waits for a token and stamps it onto the task.
+
+        ** The token is stamped into the data of the POST task or into the params of the GET task, so the HTTP method of the task is kept. **
+
+        :param task: Pool task.
+        :return: The same task with the access token.
+        """
+
+        if not isinstance(task, str):
+            task_data(task, create=True)["access_token"] = self.acquire()
+
+        return task
+
+    async def stamp_async(self, task: Any) -> Any:
+        """
+        Waits for a token on the event loop and stamps it onto the task.
+
+        :param task: Pool task.
+        :return: The same task with the access token.
+        """
+
+        if not isinstance(task, str):
+            task_data(task, create=True)["access_token"] = await self.acquire_async()
+
+        return task
+
+    def disable(self, token: str) -> None:
+        """
+        Removes the token from the rotation.
+
+        :param token: Access token.
+        """
+
+        with self._lock:
+            self._buckets.pop(token, None)
+
+    @property
+    def tokens(self) -> list[str]:
+        """
+        Get the tokens in rotation.
+
+        :return: A list of tokens.
+        """
+
+        return list(self._buckets)
@@ -0,0 +1,295 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from time import perf_counter
+from typing import Any, Callable, Optional, Union
+from urllib.parse import urlencode, urlsplit
+
+import requests
+import urllib3
+
+from .response import StaticResponse
+from .utils import is_get_task
+
+
+class Transport:
+    """
+    Base class of the synchronous transports of the requests tasks(A dict with the url and data or params, or a URL string).
+
+    ** A transport sends a wave of tasks and returns the responses in the order of the tasks, None for the failed tasks.
+    With pool_size above 1 the tasks of the wave are sent simultaneously on a pool of threads, so gevent is not needed.
+    Each thread has its own client(Session, connection pool), the connections are never shared between the threads.
+    The transports are registered in TRANSPORTS by name and selected with the transport param of ParserVK. **
+    """
+
+    def __init__(self, pool_size: int = 1, timeout: Optional[float] = None) -> None:
+        """
+        Initializes the transport.
+
+        :param pool_size: Maximum number of simultaneous requests(The number of threads). Default: 1.
+        :param timeout: Timeout of one request in seconds(Optional).
+        :raises ValueError: If pool_size is not positive.
+        """
+
+        if pool_size <= 0:
+            raise ValueError("The pool_size must be positive.")
+
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._executor = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._clients = []
+
+    def send(self, tasks: list, prepare: Callable[[Any], Any]) -> list:
+        """
+        Sends the tasks.
+
+        :param tasks: A list of tasks.
+        :param prepare: Function preparing the task right before it is sent(Stamping the access token).
+        :return: A list of responses(None for the failed tasks).
+        """
+
+        if self.pool_size == 1 or len(tasks) < 2:
+            return [self.request(prepare(task)) for task in tasks]
+
+        return list(self.get_executor().map(lambda task: self.request(prepare(task)), tasks))
+
+    @staticmethod
+    def get_method(task: dict) -> str:
+        """
+        Get the HTTP method of the task by its shape.
+
+        ** The GET tasks have params and no data(See Base._create_requests with type_query="get"), the other tasks are sent with POST. **
+
+        :param task: The task as a dict.
+        :return: GET or POST.
+        """
+
+        return "GET" if is_get_task(task) else "POST"
+
+    def request(self, task: Union[str, dict]) -> Any:
+        """
+        Sends one task with the client of the current thread.
+
+        :param task: The task.
+        :return: The response or None if the request failed.
+        """
+
+        raise NotImplementedError
+
+    def create_client(self) -> Any:
+        """
+        Creates the client of the thread.
+
+        :return: The client.
+        """
+
+        raise NotImplementedError
+
+    def close_client(self, client: Any) -> None:
+        """
+        Releases the connections of the client.
+
+        :param client: The client.
+        """
+
+    def get_client(self) -> Any:
+        """
+        Get the client of the current thread, it is created on the first use.
+
+        :return: The client.
+        """
+
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.create_client()
+            with self._lock:
+                self._clients.append(client)
+
+        return client
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the pool of threads, it is created on the first use.
+
+        :return: ThreadPoolExecutor.
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.pool_size, thread_name_prefix="parservk-transport")
+
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Stop the pool of threads and release the connections of the clients.
+        """
+
+        if not self._executor is None:
+            self._executor.shutdown()
+            self._executor = None
+
+        with self._lock:
+            clients, self._clients = self._clients, []
+
+        for client in clients:
+            self.close_client(client)
+
+        self._local = threading.local()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    Transport sending the tasks with requests.Session, one by one by default.
+    """
+
+    def create_client(self) -> requests.Session:
+        return requests.Session()
+
+    def close_client(self, client: requests.Session) -> None:
+        client.close()
+
+    def request(self, task: Union[str, dict]) -> Optional[requests.Response]:
+        session = self.get_client()
+        task = {"url": task} if isinstance(task, str) else task
+        try:
+            return session.request(self.get_method(task), **task, timeout=self.timeout)
+        except requests.RequestException:
+            return None
+
+
+class ThreadPoolTransport(RequestsTransport):
+    """
+    Transport sending the tasks of the wave simultaneously on a pool of threads with requests.
+    """
+
+    def __init__(self, pool_size: int = 32, timeout: Optional[float] = None) -> None:
+        super().__init__(pool_size, timeout)
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport sending the tasks on a pool of threads directly with urllib3, without the per-request overhead of requests
+    (Preparing the request, hooks, cookies, redirects, the response object).
+    """
+
+    def __init__(self, pool_size: int = 32, timeout: Optional[float] = None, proxy: Optional[str] = None) -> None:
+        """
+        Initializes the transport.
+
+        :param pool_size: Maximum number of simultaneous requests(The number of threads). Default: 32.
+        :param timeout: Timeout of one request in seconds(Optional).
+        :param proxy: URL of the proxy server(Optional, the proxies of the tasks take precedence).
+        """
+
+        super().__init__(pool_size, timeout)
+        self.proxy = proxy
+
+    def create_client(self) -> dict[Optional[str], urllib3.PoolManager]:
+        return {}
+
+    def close_client(self, client: dict[Optional[str], urllib3.PoolManager]) -> None:
+        for manager in client.values():
+            manager.clear()
+
+    def get_manager(self, proxy: Optional[str] = None) -> urllib3.PoolManager:
+        """
+        Get the pool of connections of the current thread for the proxy, it is created on the first use.
+
+        :param proxy: URL of the proxy server(Optional, direct connections by default).
+        :return: urllib3.PoolManager or urllib3.ProxyManager.
+        """
+
+        managers = self.get_client()
+        manager = managers.get(proxy)
+        if manager is None:
+            options = {"maxsize": 1, "retries": False, "timeout": urllib3.Timeout(total=self.timeout)}
+            manager = managers[proxy] = urllib3.PoolManager(**options) if proxy is None else urllib3.ProxyManager(proxy, **options)
+
+        return manager
+
+    def get_proxy(self, task: dict) -> Optional[str]:
+        """
+        Get the proxy of the task like requests: by the scheme of the URL or "all" from the proxies of the task, otherwise the proxy of the transport.
+
+        :param task: The task as a dict.
+        :return: URL of the proxy server or None.
+        """
+
+        proxies = task.get("proxies") or {}
+
+        return proxies.get(urlsplit(task["url"]).scheme) or proxies.get("all") or self.proxy
+
+    def request(self, task: Union[str, dict]) -> Optional[StaticResponse]:
+        task = {"url": task} if isinstance(task, str) else task
+        http = self.get_manager(self.get_proxy(task))
+        data = task.get("data") or {}
+        start = perf_counter()
+
+        try:
+            if self.get_method(task) == "GET":
+                response = http.request("GET", task["url"], fields=task["params"], headers=task.get("headers") or None)
+            else:
+                response = http.request(
+                    "POST",
+                    task["url"],
+                    body=urlencode(data),
+                    headers={**(task.get("headers") or {}), "Content-Type": "application/x-www-form-urlencoded"},
+                )
+        except urllib3.exceptions.HTTPError:
+            return None
+
+        return StaticResponse(
+            task["url"],
+            content=response.data,
+            status_code=response.status,
+            data=data,
+            elapsed=timedelta(seconds=perf_counter() - start),
+        )
+
+
+# The synchronous transports of the requests tasks by name, the transport param of ParserVK selects one of them
+TRANSPORTS = {
+    "requests": RequestsTransport,
+    "threads": ThreadPoolTransport,
+    "urllib3": Urllib3Transport,
+}
+
+
+def register_transport(name: str, class_: type) -> None:
+    """
+    Registers the transport, so it can be selected by name.
+
+    :param name: Name of the transport.
+    :param class_: Subclass of Transport.
+    :raises TypeError: If the class is not a subclass of Transport.
+    """
+
+    if not isinstance(class_, type) or not issubclass(class_, Transport):
+        raise TypeError(f"The transport should be a subclass of Transport, not {class_!r}")
+
+    TRANSPORTS[name] = class_
+
+
+def create_transport(name: str, **options: Any) -> Transport:
+    """
+    Creates the registered transport.
+
+    :param name: Name of the transport.
+    :param options: Params of the transport(pool_size, timeout, ...).
+    :raises ValueError: If the transport is not registered.
+    :return: New instance of the transport.
+    """
+
+    if not name in TRANSPORTS:
+        raise ValueError(f"Transport {name} not found, expected one of {list(TRANSPORTS)}")
+
+    return TRANSPORTS[name](**options)
@@ -1,5 +1,26 @@
+import sys
 import inspect
 
+from typing import NamedTuple, Optional
+
+
+class MethodDescriptor(NamedTuple):
+    """
+    Precomputed data of the submethod of a section for building the querys.
+
+    :param name: Name of the section, e.g. "USERS".
+    :param submethod: Name of the submethod in lowercase, e.g. "get".
+    :param url: URL of the submethod, e.g. "https://api.vk.com/method/users.get".
+    :param multi_ids: The default name of the ids param(Optional).
+    :param limits: Maximum number of ids in one query by the name of the ids param.
+    """
+
+    name: str
+    submethod: str
+    url: str
+    multi_ids: Optional[str]
+    limits: dict[str, int]
+
 
 def name_from_class(class_: object) -> str:
     """
@@ -11,15 +32,16 @@ def name_from_class(class_: object) -> str:
     
     return class_.__name__.lower()
 
-def url_from_class(class_: object) -> str:
+def url_from_class(class_: object, url_api: Optional[str] = None) -> str:
     """
     Returns the URL for the class.
 
     :param class_: subclass of Base.
+    :param url_api: URL of the VK API(Optional, URL_API of the class is used by default).
     :return: URL for the class.
     """
     
-    return f"{class_.URL_API}{name_from_class(class_)}"
+    return f"{url_api or class_.URL_API}{name_from_class(class_)}"
 
 def submethods_from_class(class_: object) -> dict:
     """
@@ -41,30 +63,110 @@ def multi_ids_from_class(class_: object) -> list:
     
     return [attr for attr in class_.DATACLASS.__fields__ if attr.endswith("ids")]
 
-def method_from_class(class_: object) -> dict:
+def method_from_class(class_: object, url_api: Optional[str] = None) -> dict:
     """
     Returns a dictionary with class information.
 
     :param class_: subclass of Base.
+    :param url_api: URL of the VK API(Optional, URL_API of the class is used by default).
     :return: dictionary with class information.
     """
     
-    url = url_from_class(class_)
+    url = url_from_class(class_, url_api)
     methods = submethods_from_class(class_)
     multi_ids = multi_ids_from_class(class_)
     name = name_from_class(class_)
     
     return {"url": url, "methods": methods, "multi_ids": multi_ids, "name": name}
 
+def descriptors_from_class(class_: object, url_api: Optional[str] = None) -> dict[str, MethodDescriptor]:
+    """
+    Returns the descriptors of the submethods of the class.
+
+    :param class_: subclass of Base.
+    :param url_api: URL of the VK API(Optional, URL_API of the class is used by default).
+    :return: dictionary where keys are the submethod names in lowercase and values are MethodDescriptor.
+    """
+
+    data = method_from_class(class_, url_api)
+    multi_ids = data["multi_ids"][0] if data["multi_ids"] else None
+
+    return {
+        submethod: MethodDescriptor(class_._NAME, submethod, data["url"] + path, multi_ids, class_._limits)
+        for submethod, path in data["methods"].items()
+    }
+
 def called_from(is_nested_function: bool = False) -> str:
     """
     Returns the name of the function that called the current function.
 
+    ** Only the frames of the call stack are walked, the source code is not read(Unlike inspect.stack). **
+
     :param is_nested_function: flag indicating whether the function is nested.
     :return: name of the function that called the current function.
     """
     
-    stack = inspect.stack()[2][0] if is_nested_function else inspect.stack()[1][0]
-    frame_func = inspect.getframeinfo(stack)
-    
-    return frame_func.function
\ No newline at end of file
+    return sys._getframe(2 if is_nested_function else 1).f_code.co_name
+
+def task_url(task: object) -> str:
+    """
+    Returns the URL of a pool task.
+
+    :param task: grequests.AsyncRequest, dict with the "url" key or url string.
+    :return: URL of the task.
+    """
+
+    if isinstance(task, str):
+        return task
+
+    if isinstance(task, dict):
+        return task.get("url", "")
+
+    return task.url
+
+def is_get_task(task: object) -> bool:
+    """
+    Check if the pool task is sent with GET: the task has params and no data(See Base._create_requests with type_query="get").
+
+    :param task: pool task.
+    :return: True if the task is sent with GET, False otherwise(The url strings are sent with POST).
+    """
+
+    if isinstance(task, str):
+        return False
+
+    kwargs = task if isinstance(task, dict) else task.kwargs
+
+    return "params" in kwargs and not kwargs.get("data")
+
+def task_data(task: object, create: bool = False) -> dict:
+    """
+    Returns the params of the call of a pool task: the POST data or the query params of the GET task(See is_get_task).
+
+    :param task: grequests.AsyncRequest, AsyncQuery, dict with the "data" or "params" key or url string.
+    :param create: Flag about adding the empty params to the task if it has none, so they can be updated in place. Default: False(The task is not changed).
+    :return: The params of the call(the same dict object as in the task if it has them).
+    """
+
+    if isinstance(task, str):
+        return {}
+
+    kwargs = task if isinstance(task, dict) else task.kwargs
+    key = "params" if is_get_task(task) else "data"
+    data = kwargs.get(key)
+    if data is None:
+        data = {}
+        if create:
+            kwargs[key] = data
+
+    return data
+
+def task_api_method(task: object) -> str:
+    """
+    Returns the VK API method name of a pool task.
+
+    :param task: pool task.
+    :return: method name, e.g. "users.get".
+    """
+
+    return task_url(task).rsplit("/", 1)[-1]
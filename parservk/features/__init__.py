@@ -1,2 +1,4 @@
 from . import dao
+from . import graph
+from . import membership
 from ..version import __metadata__
\ No newline at end of file
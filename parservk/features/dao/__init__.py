@@ -1,3 +1,17 @@
 from .dbmanager import DBManager
 from .dynamictablemeta import DynamicTableMeta
-from .models import DataModel, DBSettings
\ No newline at end of file
+from .models import DataModel, DBSettings
+from .sink import BulkSink
+from .pipeline import WritePipeline
+from .profiles import SQLITE_PROFILES, apply_sqlite_profile, get_sqlite_profile
+from .schema import (
+    create_columns,
+    create_table,
+    create_users_table,
+    create_groups_table,
+    create_posts_table,
+    create_memberships_table,
+    create_schema,
+    create_memberships,
+    flatten,
+)
\ No newline at end of file
@@ -3,12 +3,15 @@ import json
 from logging import Logger
 from typing import Optional, Union, Any
 
-from sqlalchemy import create_engine, Engine, MetaData
+from sqlalchemy import create_engine, Engine, MetaData, Table
 from sqlalchemy.orm import declarative_base, DeclarativeMeta, sessionmaker
 
 from ...core import _logger
 from .dynamictablemeta import DynamicTableMeta
 from .models import DataModel, DBSettings
+from .sink import BulkSink
+from .schema import create_schema
+from .profiles import apply_sqlite_profile
 
 class DBManager:
     """
@@ -32,7 +35,8 @@ class DBManager:
         host: str = "localhost",
         port: int = 8000,
         settings: DBSettings = DBSettings(),
-        logger: Logger = _logger
+        logger: Logger = _logger,
+        sqlite_profile: Optional[Union[str, dict]] = None
     ):
         """
         Initialize database manager
@@ -45,6 +49,7 @@ class DBManager:
         :param host: database host (optional)
         :param port: database port (optional)
         :param settings: database settings (optional)
+        :param sqlite_profile: SQLite profile name (bulk_ingest, read_mostly) or dict of pragmas (optional)
         """
         self.database = database
         self.dialect = dialect
@@ -54,6 +59,8 @@ class DBManager:
         self.host = host
         self.port = port
         self.settings = settings
+        self.sqlite_profile = sqlite_profile
+        self.LOGGER = logger
         self._url = self._create_url(
             database, dialect, username=username, password=password, host=host, port=port, driver=driver
         )
@@ -61,7 +68,6 @@ class DBManager:
         self._metadata = self._declarative_meta.metadata
         self._engine = self._create_engine(self.settings)
         self.Session = sessionmaker(bind=self._engine, autoflush=False)
-        self.LOGGER = logger
 
     def _create_url(self, *args, **kwargs) -> str:
         """
@@ -99,7 +105,10 @@ class DBManager:
         """
         try:
             settings_dict = {key.lower(): value for key, value in json.loads(settings.json()).items()}
-            return create_engine(self._url, **settings_dict)
+            engine = create_engine(self._url, **settings_dict)
+            if self.sqlite_profile is not None:
+                apply_sqlite_profile(engine, self.sqlite_profile)
+            return engine
         except ModuleNotFoundError as e:
             self.LOGGER.error(f"Error creating engine: {e}")
     def create_table(self, isclass: bool =True, nameclass: Optional[str] = None, bases: tuple = (), **kwargs):
@@ -111,6 +120,29 @@ class DBManager:
      	else:
      		...
 
+    def create_schema(self, prefix: str = "", create: bool = True) -> dict[str, Table]:
+        """
+        Create the tables of the users, groups, posts and memberships from the field lists of the sections
+
+        :param prefix: prefix of the names of the tables (optional)
+        :param create: create the missing tables in the database (default: True)
+        :return: dict where keys are the kinds of the tables and values are the tables
+        """
+        tables = create_schema(self._metadata, prefix)
+        if create:
+            self._metadata.create_all(self._engine, tables=list(tables.values()))
+        return tables
+
+    def create_sink(self, table: Any, **kwargs: Any) -> BulkSink:
+        """
+        Create the sink writing the results of the parser to the table in batched transactions
+
+        :param table: the table, the ORM class or the name of the table
+        :param kwargs: parameters of BulkSink (batch_size, flush_interval, conflict, update, transform)
+        :return: the sink
+        """
+        return BulkSink(self, table, **kwargs)
+
     @property
     def engine(self) -> Engine:
         """Get database engine"""
@@ -0,0 +1,286 @@
+import time
+import queue
+import asyncio
+import threading
+
+from typing import Any, AsyncIterable, Iterable, Optional, Union
+
+from ...core import _logger
+from .sink import BulkSink
+
+
+class WritePipeline:
+    """
+    Write-behind stage between the parser and the database.
+
+    ** The results are put into a bounded queue and written by the writer threads through BulkSink, so the fetching does not wait for the commits.
+    The producer is blocked only when the queue is full(Backpressure), the depth of the queue and the latency of the commits are exposed in metrics. **
+
+    Example:
+        with WritePipeline(manager.create_sink("posts", conflict=("owner_id", "id"), transform=flatten)) as pipeline:
+            pipeline.consume(parser.wall.iter_wall(owner_id=1, pages=True))
+    """
+
+    def __init__(
+        self,
+        sink: Optional[BulkSink] = None,
+        maxsize: int = 1000,
+        workers: int = 1,
+        idle_flush: float = 1.0,
+        logger: Any = _logger(__name__),
+    ) -> None:
+        """
+        Initializes the pipeline and starts the writer threads.
+
+        :param sink: The default sink of the results(Optional, the sink can be passed to put).
+        :param maxsize: Maximum number of batches in the queue. Default: 1000.
+        :param workers: Number of the writer threads. Default: 1.
+        :param idle_flush: Seconds without new results after which the buffers of the sinks are written. Default: 1.0.
+        :param logger: Logger of the write errors.
+        :raises ValueError: If maxsize or workers is not positive.
+        """
+
+        if maxsize <= 0 or workers <= 0:
+            raise ValueError("The maxsize and workers must be positive.")
+
+        self.sink = sink
+        self.maxsize = maxsize
+        self.idle_flush = idle_flush
+        self.logger = logger
+        self.errors = []
+        self.failed = []
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._sinks = {} if sink is None else {id(sink): sink}
+        self._closed = False
+        self._metrics = {"enqueued": 0, "dequeued": 0, "max_depth": 0, "blocked": 0, "blocked_seconds": 0.0, "errors": 0, "failed": 0}
+        self._threads = [
+            threading.Thread(target=self._work, name=f"parservk-writer-{number}", daemon=True) for number in range(workers)
+        ]
+
+        for thread in self._threads:
+            thread.start()
+
+    def _get_sink(self, sink: Optional[BulkSink]) -> BulkSink:
+        """
+        Get the sink of the results and registers it for the final flush.
+
+        :param sink: The sink(Optional).
+        :raises ValueError: If the sink is not passed and there is no default sink.
+        :return: The sink.
+        """
+
+        sink = self.sink if sink is None else sink
+        if sink is None:
+            raise ValueError("The sink must be passed if the pipeline has no default sink.")
+
+        with self._lock:
+            self._sinks.setdefault(id(sink), sink)
+
+        return sink
+
+    def put(self, items: Union[list, Any], sink: Optional[BulkSink] = None, timeout: Optional[float] = None) -> None:
+        """
+        Puts the results into the queue, blocks while the queue is full.
+
+        :param items: The items of the result or one item.
+        :param sink: The sink of the items(Optional, the default sink by default).
+        :param timeout: Maximum number of seconds to wait for a free slot(Optional, unlimited by default).
+        :raises RuntimeError: If the pipeline is closed.
+        :raises queue.Full: If the timeout expired.
+        """
+
+        entry = self._create_entry(items, sink)
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            start = time.perf_counter()
+            self._queue.put(entry, timeout=timeout)
+            self._add_blocked(time.perf_counter() - start)
+
+        self._add_enqueued()
+
+    async def put_async(self, items: Union[list, Any], sink: Optional[BulkSink] = None, delay: float = 0.01) -> None:
+        """
+        Puts the results into the queue without blocking the event loop, waits while the queue is full.
+
+        :param items: The items of the result or one item.
+        :param sink: The sink of the items(Optional, the default sink by default).
+        :param delay: Seconds between the attempts while the queue is full. Default: 0.01.
+        :raises RuntimeError: If the pipeline is closed.
+        """
+
+        entry = self._create_entry(items, sink)
+        start = None
+        while True:
+            try:
+                self._queue.put_nowait(entry)
+                break
+            except queue.Full:
+                start = time.perf_counter() if start is None else start
+                await asyncio.sleep(delay)
+
+        if not start is None:
+            self._add_blocked(time.perf_counter() - start)
+
+        self._add_enqueued()
+
+    def consume(self, results: Iterable[Any], sink: Optional[BulkSink] = None) -> None:
+        """
+        Puts the stream of results into the queue(The items or pages of the iterators, the results of the submethods).
+
+        :param results: The stream of results.
+        :param sink: The sink of the results(Optional, the default sink by default).
+        """
+
+        for result in results:
+            self.put(result, sink)
+
+    async def consume_async(self, results: AsyncIterable[Any], sink: Optional[BulkSink] = None) -> None:
+        """
+        Puts the asynchronous stream of results into the queue.
+
+        :param results: The asynchronous stream of results.
+        :param sink: The sink of the results(Optional, the default sink by default).
+        """
+
+        async for result in results:
+            await self.put_async(result, sink)
+
+    def _create_entry(self, items: Union[list, Any], sink: Optional[BulkSink]) -> tuple[BulkSink, list]:
+        """
+        Creates the entry of the queue.
+
+        :param items: The items of the result or one item.
+        :param sink: The sink(Optional).
+        :raises RuntimeError: If the pipeline is closed.
+        :return: A tuple containing the sink and the list of items.
+        """
+
+        if self._closed:
+            raise RuntimeError("The pipeline is closed.")
+
+        return self._get_sink(sink), items if isinstance(items, list) else [items]
+
+    def _add_enqueued(self) -> None:
+        with self._lock:
+            self._metrics["enqueued"] += 1
+            self._metrics["max_depth"] = max(self._metrics["max_depth"], self._queue.qsize())
+
+    def _add_blocked(self, seconds: float) -> None:
+        with self._lock:
+            self._metrics["blocked"] += 1
+            self._metrics["blocked_seconds"] += seconds
+
+    def _work(self) -> None:
+        """
+        The loop of the writer thread: drains the queue into the sinks and writes their buffers when the queue is idle.
+        """
+
+        while True:
+            try:
+                entry = self._queue.get(timeout=self.idle_flush)
+            except queue.Empty:
+                self._flush_sinks()
+                continue
+
+            if entry is None:
+                self._queue.task_done()
+                return
+
+            sink, items = entry
+            try:
+                sink.write_many(items)
+            except Exception as error:
+                self._add_error(error, sink)
+            finally:
+                with self._lock:
+                    self._metrics["dequeued"] += 1
+
+                self._queue.task_done()
+
+    def _flush_sinks(self) -> None:
+        """
+        Writes the buffers of all sinks.
+        """
+
+        with self._lock:
+            sinks = list(self._sinks.values())
+
+        for sink in sinks:
+            try:
+                sink.flush()
+            except Exception as error:
+                self._add_error(error, sink)
+
+    def _add_error(self, error: Exception, sink: BulkSink) -> None:
+        """
+        Registers the write error, the records of the failed transaction are moved from the sink to the failed attribute,
+        so one bad record does not block the next transactions.
+
+        :param error: The error.
+        :param sink: The sink of the failed transaction.
+        """
+
+        self.logger.error(f"Error writing the results: {error}")
+        records = sink.discard()
+        with self._lock:
+            self.errors.append(error)
+            self.failed.extend(records)
+            self._metrics["errors"] += 1
+            self._metrics["failed"] += len(records)
+
+    def join(self) -> None:
+        """
+        Waits until the queue is drained and writes the buffers of the sinks.
+        """
+
+        self._queue.join()
+        self._flush_sinks()
+
+    def close(self) -> None:
+        """
+        Drains the queue, writes the buffers of the sinks and stops the writer threads.
+        """
+
+        if self._closed:
+            return
+
+        self.join()
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self) -> "WritePipeline":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def metrics(self) -> dict[str, Union[int, float]]:
+        """
+        Get the metrics of the pipeline.
+
+        :return: Dict with the depth of the queue, the number of enqueued and written batches, the time the producers were blocked,
+            the number of commits and the latency of the commits in seconds.
+        """
+
+        with self._lock:
+            metrics = {**self._metrics, "depth": self._queue.qsize(), "maxsize": self.maxsize}
+            sinks = [sink.stats for sink in self._sinks.values()]
+
+        commits = sum(stats["batches"] for stats in sinks)
+        commit_seconds = sum(stats["commit_seconds"] for stats in sinks)
+
+        return {
+            **metrics,
+            "written": sum(stats["written"] for stats in sinks),
+            "commits": commits,
+            "commit_seconds": commit_seconds,
+            "avg_commit_seconds": commit_seconds / commits if commits else 0.0,
+            "max_commit_seconds": max((stats["max_commit_seconds"] for stats in sinks), default=0.0),
+        }
@@ -0,0 +1,80 @@
+import re
+
+from typing import Any, Union
+
+from sqlalchemy import Engine, event
+
+
+# The pragmas of the SQLite profiles, they are executed on every new connection of the pool
+SQLITE_PROFILES = {
+    # Crawler nodes writing large batches: no fsync on commit(An application crash is safe, a power loss may lose the last transactions),
+    # big page cache for the index maintenance and the temporary b-trees in memory.
+    "bulk_ingest": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    # Analytics over the collected data: durable WAL commits, the readers do not block the writer,
+    # the database file is memory-mapped so the reads avoid the copies from the page cache.
+    "read_mostly": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -131072,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+    },
+}
+
+RE_PRAGMA = re.compile(r"^[A-Za-z_]+$")
+RE_VALUE = re.compile(r"^-?\w+$")
+
+
+def get_sqlite_profile(profile: Union[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    Get the pragmas of the SQLite profile.
+
+    :param profile: The name of the profile from SQLITE_PROFILES or the dict of pragmas.
+    :raises ValueError: If the profile is not found or the pragmas are not valid.
+    :return: Dict where keys are the pragmas and values are their values.
+    """
+
+    if isinstance(profile, str):
+        if not profile in SQLITE_PROFILES:
+            raise ValueError(f"Profile {profile} not found, expected one of {list(SQLITE_PROFILES)}")
+
+        return SQLITE_PROFILES[profile]
+
+    for pragma, value in profile.items():
+        if not RE_PRAGMA.match(pragma) or not RE_VALUE.match(str(value)):
+            raise ValueError(f"The pragma {pragma}={value} is not valid")
+
+    return profile
+
+
+def apply_sqlite_profile(engine: Engine, profile: Union[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    Applies the SQLite profile to every new connection of the engine through the connect event.
+
+    :param engine: The engine of the SQLite database.
+    :param profile: The name of the profile from SQLITE_PROFILES or the dict of pragmas.
+    :raises ValueError: If the engine is not SQLite or the profile is not valid.
+    :return: The applied pragmas.
+    """
+
+    if engine.dialect.name != "sqlite":
+        raise ValueError(f"The SQLite engine was expected, not {engine.dialect.name}")
+
+    pragmas = get_sqlite_profile(profile)
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(connection: Any, _: Any) -> None:
+        cursor = connection.cursor()
+        try:
+            for pragma, value in pragmas.items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
+    return pragmas
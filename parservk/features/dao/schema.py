@@ -0,0 +1,229 @@
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, MetaData, Table, Text
+
+from ...core import Users, Groups
+
+
+POST_FIELDS = [
+    'id', 'owner_id', 'from_id', 'created_by', 'date', 'text', 'reply_owner_id', 'reply_post_id', 'friends_only', 'comments',
+    'likes', 'reposts', 'views', 'post_type', 'post_source', 'attachments', 'geo', 'signer_id', 'copy_history', 'can_pin',
+    'can_delete', 'can_edit', 'is_pinned', 'marked_as_ads', 'is_favorite', 'donut', 'postponed_id'
+]
+
+# The nested objects with a fixed shape are flattened into the columns "<field>_<key>"
+FLATTENED = {
+    "city": {"id": Integer, "title": Text},
+    "country": {"id": Integer, "title": Text},
+    "last_seen": {"time": BigInteger, "platform": Integer},
+    "occupation": {"type": Text, "id": BigInteger, "name": Text},
+    "comments": {"count": Integer},
+    "likes": {"count": Integer},
+    "reposts": {"count": Integer},
+    "views": {"count": Integer},
+}
+
+# The nested objects and lists of any shape are stored in the JSON columns
+NESTED = {
+    "counters", "career", "schools", "universities", "personal", "education", "contacts", "crop_photo", "cover", "addresses",
+    "links", "market", "place", "attachments", "geo", "copy_history", "post_source", "donut",
+}
+
+INTEGER_FIELDS = {
+    "sex", "relation", "followers_count", "verified", "online", "has_photo", "is_closed", "age_limits", "members_count",
+    "main_album_id", "main_section", "wall", "wiki_page", "friends_only", "can_pin", "can_delete", "can_edit", "is_pinned",
+    "marked_as_ads", "is_favorite", "postponed_id", "trending",
+}
+
+# The ids and the unix timestamps are BigInteger
+ID_FIELDS = {
+    "id", "owner_id", "from_id", "created_by", "reply_owner_id", "reply_post_id", "group_id", "user_id", "signer_id", "date",
+    "start_date", "finish_date",
+}
+
+
+def create_columns(fields: Iterable[str]) -> list[Column]:
+    """
+    Creates the columns of the fields of the VK objects.
+
+    ** The fields from FLATTENED are split into the columns "<field>_<key>", the fields from NESTED are JSON columns,
+    the ids and timestamps are BigInteger and the other unknown fields are Text. **
+
+    :param fields: The fields of the objects(For example, Users.fields_list).
+    :return: A list of columns.
+    """
+
+    columns = []
+    for field in dict.fromkeys(fields):
+        if field in FLATTENED:
+            columns.extend(Column(f"{field}_{key}", type_()) for key, type_ in FLATTENED[field].items())
+        elif field in NESTED:
+            columns.append(Column(field, JSON()))
+        elif field in ID_FIELDS:
+            columns.append(Column(field, BigInteger()))
+        elif field in INTEGER_FIELDS:
+            columns.append(Column(field, Integer()))
+        else:
+            columns.append(Column(field, Text()))
+
+    return columns
+
+
+def create_table(
+    metadata: MetaData,
+    name: str,
+    fields: Iterable[str],
+    primary_key: Iterable[str] = ("id",),
+    indexes: Iterable[str] = (),
+) -> Table:
+    """
+    Creates the table of the VK objects.
+
+    ** The tables have no foreign keys and only the indexes of the ids and timestamps, so the bulk loads are not slowed down by the index maintenance. **
+
+    :param metadata: The metadata of the table.
+    :param name: The name of the table.
+    :param fields: The fields of the objects.
+    :param primary_key: Columns of the primary key. Default: ("id",).
+    :param indexes: Columns with the secondary indexes(Optional).
+    :raises ValueError: If the columns of the keys are not in the fields.
+    :return: The table.
+    """
+
+    primary_key = list(primary_key)
+    columns = create_columns([*primary_key, *fields])
+    names = {column.name for column in columns}
+
+    unknown = (set(primary_key) | set(indexes)) - names
+    if unknown:
+        raise ValueError(f"The columns {sorted(unknown)} are not in the fields of the table {name}")
+
+    for column in columns:
+        if column.name in primary_key:
+            column.primary_key = True
+            column.nullable = False
+            column.autoincrement = False
+
+    return Table(
+        name,
+        metadata,
+        *columns,
+        *(Index(f"ix_{name}_{column}", column) for column in indexes),
+    )
+
+
+def create_users_table(metadata: MetaData, name: str = "users", fields: Optional[Iterable[str]] = None) -> Table:
+    """
+    Creates the table of the users from users.get.
+
+    :param metadata: The metadata of the table.
+    :param name: The name of the table. Default: "users".
+    :param fields: The fields of the users(Optional, Users.fields_list by default).
+    :return: The table.
+    """
+
+    fields = Users.fields_list if fields is None else fields
+
+    return create_table(
+        metadata,
+        name,
+        ["first_name", "last_name", "deactivated", "is_closed", *fields],
+        indexes=["last_seen_time"] if "last_seen" in fields else [],
+    )
+
+
+def create_groups_table(metadata: MetaData, name: str = "groups", fields: Optional[Iterable[str]] = None) -> Table:
+    """
+    Creates the table of the groups from groups.getById.
+
+    :param metadata: The metadata of the table.
+    :param name: The name of the table. Default: "groups".
+    :param fields: The fields of the groups(Optional, Groups.fields_list by default).
+    :return: The table.
+    """
+
+    return create_table(metadata, name, Groups.fields_list if fields is None else fields)
+
+
+def create_posts_table(metadata: MetaData, name: str = "posts", fields: Optional[Iterable[str]] = None) -> Table:
+    """
+    Creates the table of the posts from wall.get, the post ids are unique within the wall.
+
+    :param metadata: The metadata of the table.
+    :param name: The name of the table. Default: "posts".
+    :param fields: The fields of the posts(Optional, POST_FIELDS by default).
+    :return: The table.
+    """
+
+    return create_table(
+        metadata, name, POST_FIELDS if fields is None else fields, primary_key=("owner_id", "id"), indexes=["date"]
+    )
+
+
+def create_memberships_table(metadata: MetaData, name: str = "memberships") -> Table:
+    """
+    Creates the table of the edges between the groups and their members from groups.getMembers.
+
+    :param metadata: The metadata of the table.
+    :param name: The name of the table. Default: "memberships".
+    :return: The table.
+    """
+
+    return create_table(metadata, name, [], primary_key=("group_id", "user_id"), indexes=["user_id"])
+
+
+def create_schema(metadata: MetaData, prefix: str = "") -> dict[str, Table]:
+    """
+    Creates the tables of the users, groups, posts and memberships.
+
+    :param metadata: The metadata of the tables.
+    :param prefix: The prefix of the names of the tables(Optional).
+    :return: Dict where keys are the kinds of the tables and values are the tables.
+    """
+
+    return {
+        "users": create_users_table(metadata, f"{prefix}users"),
+        "groups": create_groups_table(metadata, f"{prefix}groups"),
+        "posts": create_posts_table(metadata, f"{prefix}posts"),
+        "memberships": create_memberships_table(metadata, f"{prefix}memberships"),
+    }
+
+
+def flatten(item: Any) -> Any:
+    """
+    Flattens the nested objects of the item into the keys "<field>_<key>" of the generated tables.
+
+    ** It can be used as the transform of BulkSink. **
+
+    :param item: The item of the result(A dict, other values are returned as is).
+    :return: The flattened item.
+    """
+
+    if not isinstance(item, dict):
+        return item
+
+    record = {}
+    for field, value in item.items():
+        keys = FLATTENED.get(field)
+        if keys is None or not isinstance(value, dict):
+            record[field] = value
+            continue
+
+        for key in keys:
+            record[f"{field}_{key}"] = value.get(key)
+
+    return record
+
+
+def create_memberships(group_id: int, members: Iterable[Any]) -> list[dict[str, int]]:
+    """
+    Creates the records of the memberships table from the members of the group.
+
+    :param group_id: Numeric id of the group.
+    :param members: The members(Ids or dicts with the id key).
+    :return: A list of records.
+    """
+
+    return [
+        {"group_id": group_id, "user_id": member["id"] if isinstance(member, dict) else int(member)} for member in members
+    ]
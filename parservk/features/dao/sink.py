@@ -0,0 +1,334 @@
+import time
+import threading
+
+from typing import Any, AsyncIterable, Callable, Iterable, Optional, Union
+
+from sqlalchemy import JSON, Table, insert
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from ...core import jsonlib
+
+
+class BulkSink:
+    """
+    Writes the results of the parser to a table in batched transactions.
+
+    ** The records are buffered and written with one executemany per batch in one transaction.
+    With the conflict columns SQLite and PostgreSQL use INSERT ... ON CONFLICT DO UPDATE(MySQL uses ON DUPLICATE KEY UPDATE),
+    other dialects use plain INSERT. The buffer is written when it reaches batch_size or flush_interval seconds have passed since the last write. **
+
+    Example:
+        with BulkSink(manager, "users", conflict=("id",)) as sink:
+            sink.consume(parser.users.get(user_ids=ids)["users"])
+    """
+
+    UPSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+    ISOLATION_LEVELS = {"sqlite": "SERIALIZABLE", "postgresql": "READ COMMITTED", "mysql": "READ COMMITTED"}
+
+    def __init__(
+        self,
+        manager: Any,
+        table: Union[str, Table, Any],
+        batch_size: int = 1000,
+        flush_interval: float = 5.0,
+        conflict: Optional[Iterable[str]] = None,
+        update: Optional[Iterable[str]] = None,
+        transform: Optional[Callable[[Any], Optional[dict]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes the sink.
+
+        :param manager: DBManager.
+        :param table: The table, the ORM class or the name of the table(Reflected from the database if it is not in the metadata).
+        :param batch_size: Number of records in one transaction. Default: 1000.
+        :param flush_interval: Maximum number of seconds the records are kept in the buffer. Default: 5.0.
+        :param conflict: Columns of the unique key for the upsert(Optional, plain INSERT by default).
+        :param update: Columns updated on conflict(Optional, all columns except the conflict ones by default, empty to ignore the conflicting records).
+        :param transform: Function converting the item of the result to the record or None to skip it(Optional).
+        :param clock: Function returning the current time in seconds. Default: time.monotonic.
+        :raises ValueError: If batch_size is not positive or the columns are not in the table.
+        """
+
+        if batch_size <= 0:
+            raise ValueError("The batch_size must be positive.")
+
+        self.manager = manager
+        self.table = self._get_table(manager, table)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.conflict = None if conflict is None else list(conflict)
+        self.transform = transform
+        self.clock = clock
+        self._columns = {column.name: column for column in self.table.columns}
+        self._update = self._get_update_columns(update)
+        self._statements = {}
+        self._lock = threading.RLock()
+        self._buffer = []
+        self._flushed = clock()
+        self._stats = {"written": 0, "batches": 0, "skipped": 0, "commit_seconds": 0.0, "last_commit_seconds": 0.0, "max_commit_seconds": 0.0}
+
+    @staticmethod
+    def _get_table(manager: Any, table: Union[str, Table, Any]) -> Table:
+        """
+        Get the table from the name or the ORM class.
+
+        :param manager: DBManager.
+        :param table: The table, the ORM class or the name of the table.
+        :raises ValueError: If the table is not supported.
+        :return: The table.
+        """
+
+        if isinstance(table, Table):
+            return table
+
+        if isinstance(getattr(table, "__table__", None), Table):
+            return table.__table__
+
+        if isinstance(table, str):
+            if table in manager.metadata.tables:
+                return manager.metadata.tables[table]
+
+            return Table(table, manager.metadata, autoload_with=manager.engine)
+
+        raise ValueError(f"The Table, ORM class or table name was expected, not {table.__class__.__name__}")
+
+    def _get_update_columns(self, update: Optional[Iterable[str]]) -> list[str]:
+        """
+        Get the columns updated on conflict.
+
+        :param update: Columns updated on conflict(Optional).
+        :raises ValueError: If the columns are not in the table.
+        :return: A list of columns.
+        """
+
+        columns = set(self.conflict or ()) | set(update or ())
+        unknown = columns - set(self._columns)
+        if unknown:
+            raise ValueError(f"The columns {sorted(unknown)} are not in the table {self.table.name}")
+
+        if update is None:
+            return [name for name in self._columns if not name in (self.conflict or ())]
+
+        return list(update)
+
+    def _get_statement(self, columns: tuple[str, ...]) -> Any:
+        """
+        Get the insert statement in the dialect of the database for the records with the columns.
+
+        ** Only the columns present in the records are updated on conflict, so the missing values do not overwrite the stored ones. **
+
+        :param columns: The columns of the records.
+        :return: The statement.
+        """
+
+        statement = self._statements.get(columns)
+        if statement is None:
+            statement = self._statements[columns] = self._create_statement([name for name in self._update if name in columns])
+
+        return statement
+
+    def _create_statement(self, update: list[str]) -> Any:
+        """
+        Creates the insert statement in the dialect of the database.
+
+        :param update: Columns updated on conflict.
+        :return: The statement.
+        """
+
+        dialect = self.manager.engine.dialect.name
+        if self.conflict is None:
+            return insert(self.table)
+
+        if dialect in self.UPSERTS:
+            statement = self.UPSERTS[dialect](self.table)
+            if not update:
+                return statement.on_conflict_do_nothing(index_elements=self.conflict)
+
+            return statement.on_conflict_do_update(
+                index_elements=self.conflict, set_={name: statement.excluded[name] for name in update}
+            )
+
+        if dialect == "mysql":
+            statement = mysql.insert(self.table)
+            if not update:
+                return statement.prefix_with("IGNORE")
+
+            return statement.on_duplicate_key_update({name: statement.inserted[name] for name in update})
+
+        return insert(self.table)
+
+    def _create_record(self, item: Any) -> Optional[dict]:
+        """
+        Converts the item of the result to the record with the columns of the table.
+
+        ** The nested values(dicts and lists) are encoded to JSON unless the column has the JSON type. **
+
+        :param item: The item of the result.
+        :return: The record or None if the item is skipped.
+        """
+
+        if not self.transform is None:
+            item = self.transform(item)
+
+        if not isinstance(item, dict):
+            return None
+
+        record = {}
+        for name, value in item.items():
+            column = self._columns.get(name)
+            if column is None:
+                continue
+
+            if isinstance(value, (dict, list)) and not isinstance(column.type, JSON):
+                value = jsonlib.dumps(value).decode()
+
+            record[name] = value
+
+        return record or None
+
+    def write(self, item: Any) -> None:
+        """
+        Adds the item to the buffer, the buffer is written when it is full or the flush interval has passed.
+
+        :param item: The item of the result(For example, a user or a post).
+        """
+
+        self.write_many([item])
+
+    def write_many(self, items: Iterable[Any]) -> None:
+        """
+        Adds the items to the buffer, the buffer is written when it is full or the flush interval has passed.
+
+        :param items: The items of the result.
+        """
+
+        with self._lock:
+            for item in items:
+                record = self._create_record(item)
+                if record is None:
+                    self._stats["skipped"] += 1
+                    continue
+
+                self._buffer.append(record)
+                if len(self._buffer) >= self.batch_size:
+                    self.flush()
+
+            if self._buffer and self.clock() - self._flushed >= self.flush_interval:
+                self.flush()
+
+    def consume(self, results: Iterable[Any]) -> int:
+        """
+        Writes the stream of results and flushes the buffer.
+
+        :param results: The result of the submethod or the generator of the iterator(Items or pages of items).
+        :return: The total number of written records.
+        """
+
+        for result in results:
+            self.write_many(result if isinstance(result, list) else [result])
+
+        self.flush()
+
+        return self._stats["written"]
+
+    async def consume_async(self, results: AsyncIterable[Any]) -> int:
+        """
+        Writes the asynchronous stream of results and flushes the buffer.
+
+        :param results: The asynchronous generator of the iterator(Items or pages of items).
+        :return: The total number of written records.
+        """
+
+        async for result in results:
+            self.write_many(result if isinstance(result, list) else [result])
+
+        self.flush()
+
+        return self._stats["written"]
+
+    def flush(self) -> int:
+        """
+        Writes the buffer in one transaction.
+
+        :return: The number of written records.
+        """
+
+        with self._lock:
+            records, self._buffer = self._buffer, []
+            self._flushed = self.clock()
+            if not records:
+                return 0
+
+            start = time.perf_counter()
+            try:
+                self._execute(records)
+            except Exception:
+                self._buffer = records + self._buffer
+                raise
+
+            elapsed = time.perf_counter() - start
+            self._stats["written"] += len(records)
+            self._stats["batches"] += 1
+            self._stats["commit_seconds"] += elapsed
+            self._stats["last_commit_seconds"] = elapsed
+            self._stats["max_commit_seconds"] = max(self._stats["max_commit_seconds"], elapsed)
+
+            return len(records)
+
+    def discard(self) -> list[dict]:
+        """
+        Removes the records from the buffer without writing them(For example, after a failed flush).
+
+        :return: The removed records.
+        """
+
+        with self._lock:
+            records, self._buffer = self._buffer, []
+
+            return records
+
+    def _execute(self, records: list[dict]) -> None:
+        """
+        Executes the statement for the records in one transaction.
+
+        ** executemany requires the same columns in all records, so the records are grouped by their columns. **
+
+        :param records: The records.
+        """
+
+        groups = {}
+        for record in records:
+            groups.setdefault(tuple(record), []).append(record)
+
+        isolation_level = self.ISOLATION_LEVELS.get(self.manager.engine.dialect.name)
+        with self.manager.engine.connect() as connection:
+            if not isolation_level is None:
+                connection = connection.execution_options(isolation_level=isolation_level)
+
+            with connection.begin():
+                for columns, group in groups.items():
+                    connection.execute(self._get_statement(columns), group)
+
+    def close(self) -> None:
+        """
+        Writes the rest of the buffer.
+        """
+
+        self.flush()
+
+    def __enter__(self) -> "BulkSink":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def stats(self) -> dict[str, Union[int, float]]:
+        """
+        Get the statistics of the sink.
+
+        :return: Dict with the number of written records, transactions and skipped items and the durations of the commits in seconds.
+        """
+
+        return {**self._stats, "buffered": len(self._buffer)}
@@ -0,0 +1,2 @@
+from .idset import IdSet
+from .crawler import GraphCrawler, Edge
@@ -0,0 +1,350 @@
+import heapq
+
+from itertools import count as counter
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+from ...core import CheckpointStore, VKError, VKResponse, task_data
+from .idset import IdSet
+
+
+class Edge(NamedTuple):
+    """
+    Edge of the social graph.
+
+    :param source: Id of the user whose connections were requested.
+    :param target: Id of the connected user.
+    :param kind: Kind of the connection(friends or followers).
+    :param depth: Depth of the target from the seeds.
+    """
+
+    source: int
+    target: int
+    kind: str
+    depth: int
+
+
+class GraphCrawler:
+    """
+    Breadth-first crawler of the social graph from seed users.
+
+    ** The edges are fetched in bulk through the sections of the parser and streamed with PoolManager.imap, they are not kept in Handlers.results.
+    The connections are requested page by page(See PAGES), the next pages of a user are queued after the first page gives the total count.
+    The visited users are kept in IdSet, the frontier is a heap ordered by depth and then by priority.
+    With the checkpoint param the visited users, the frontier and the statistics are saved every `checkpoint.interval` waves,
+    so a resumed crawl continues from the last saved wave(The edges of the waves after it are emitted again). **
+
+    Example:
+        crawler = GraphCrawler(parser, depth=2, kinds=("friends",))
+        for edge in crawler.crawl([1]):
+            ...
+    """
+
+    KINDS = ("friends", "followers")
+    # The section, the submethod and the page size of the connections by kind
+    PAGES = {"friends": ("friends", "get", 5000), "followers": ("users", "getfollowers", 1000)}
+
+    def __init__(
+        self,
+        parser: Any,
+        depth: int = 1,
+        kinds: Iterable[str] = ("friends",),
+        max_nodes: Optional[int] = None,
+        in_flight: int = 25,
+        priority: Optional[Callable[[int, int, Optional[int]], float]] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        job: str = "graph",
+    ) -> None:
+        """
+        Initializes the crawler.
+
+        :param parser: ParserVK or AsyncParserVK.
+        :param depth: Maximum depth of the expansion from the seeds. Default: 1.
+        :param kinds: Kinds of the connections to expand(friends, followers). Default: ("friends",).
+        :param max_nodes: Maximum number of visited users(Optional, unlimited by default).
+        :param in_flight: Maximum number of requests in flight. Default: 25.
+        :param priority: Function (user_id, depth, parent_id) -> priority, users with lower priority are expanded first within the same depth(Optional, order of discovery by default).
+        :param checkpoint: Store of the state of the crawl(Optional).
+        :param job: Name of the job in the store. Default: "graph".
+        :raises ValueError: If depth is negative or the kinds are not supported.
+        """
+
+        kinds = tuple(kinds)
+        if depth < 0:
+            raise ValueError("The depth must be non-negative.")
+
+        if not kinds or not set(kinds).issubset(self.KINDS):
+            raise ValueError(f"The kinds must be selected from {self.KINDS}.")
+
+        self.parser = parser
+        self.depth = depth
+        self.kinds = kinds
+        self.max_nodes = max_nodes
+        self.in_flight = in_flight
+        self.priority = priority
+        self.checkpoint = checkpoint
+        self.job = job
+        self.visited = IdSet()
+        self.errors = []
+        self._frontier = []
+        self._sequence = counter()
+        self._stats = {"nodes": 0, "expanded": 0, "edges": 0, "errors": 0}
+        self._waves = 0
+
+    def crawl(self, seeds: Iterable[Union[int, str]]) -> Union[Iterator[Edge], AsyncIterator[Edge]]:
+        """
+        Crawls the graph from the seeds.
+
+        ** With the asyncio transport returns an asynchronous generator. **
+
+        :param seeds: Numeric ids of the seed users(Ignored if the crawl is restored from the checkpoint).
+        :return: A generator of edges.
+        """
+
+        if self._restore():
+            seeds = ()
+
+        for seed in seeds:
+            self._visit(int(seed), 0)
+
+        if self.parser.transport == "asyncio":
+            return self._crawl_async()
+
+        return self._crawl_sync()
+
+    def _crawl_sync(self) -> Iterator[Edge]:
+        """
+        Synchronous implementation of crawl.
+
+        :return: A generator of edges.
+        """
+
+        poolmanager = self.parser.friends.poolmanager
+        while self._frontier:
+            querys, nodes = self._create_querys(self._pop_wave())
+            while querys:
+                pages = []
+                for task, response in poolmanager.imap(querys, self.in_flight):
+                    yield from self._expand(nodes[id(task)], response, nodes, pages)
+
+                querys = pages
+
+            self._save()
+
+        self._finish()
+
+    async def _crawl_async(self) -> AsyncIterator[Edge]:
+        """
+        Asynchronous implementation of crawl.
+
+        :return: An asynchronous generator of edges.
+        """
+
+        poolmanager = self.parser.friends.poolmanager
+        while self._frontier:
+            querys, nodes = self._create_querys(self._pop_wave())
+            while querys:
+                pages = []
+                async for task, response in poolmanager.imap_async(querys, self.in_flight):
+                    for edge in self._expand(nodes[id(task)], response, nodes, pages):
+                        yield edge
+
+                querys = pages
+
+            self._save()
+
+        self._finish()
+
+    def _visit(self, user_id: int, depth: int, parent_id: Optional[int] = None) -> bool:
+        """
+        Marks the user as visited and adds it to the frontier if it can be expanded.
+
+        :param user_id: Id of the user.
+        :param depth: Depth of the user.
+        :param parent_id: Id of the user from which this user was discovered(Optional).
+        :return: True if the user was not visited before, False otherwise.
+        """
+
+        if user_id in self.visited or (not self.max_nodes is None and len(self.visited) >= self.max_nodes):
+            return False
+
+        self.visited.add(user_id)
+        self._stats["nodes"] += 1
+
+        if depth < self.depth:
+            priority = 0 if self.priority is None else self.priority(user_id, depth, parent_id)
+            heapq.heappush(self._frontier, (depth, priority, next(self._sequence), user_id))
+
+        return True
+
+    def _pop_wave(self) -> list[tuple[int, int]]:
+        """
+        Pops the users of the next wave from the frontier.
+
+        ** The wave contains only the users of the smallest depth, so the depth order of the expansion is kept. **
+
+        :return: A list of tuples (user id, depth).
+        """
+
+        wave = []
+        depth = self._frontier[0][0]
+        while self._frontier and self._frontier[0][0] == depth and len(wave) < self.in_flight:
+            wave.append(heapq.heappop(self._frontier))
+
+        return [(user_id, depth) for depth, _, _, user_id in wave]
+
+    def _create_querys(self, users: list[tuple[int, int]]) -> tuple[list, dict[int, tuple[int, int, str, int]]]:
+        """
+        Creates the querys of the first pages of the connections of the users.
+
+        :param users: A list of tuples (user id, depth).
+        :return: A tuple containing the list of querys and the dict where keys are the ids of the querys and values are the tuples (user id, depth, kind, offset).
+        """
+
+        querys = []
+        nodes = {}
+
+        for user_id, depth in users:
+            for kind in self.kinds:
+                section, submethod, count = self._get_page_params(kind)
+                params = section._update_all(params=section.base_params.copy(), count=count, offset=0)
+
+                for query in section.get_querys_from_data([user_id], params, submethod=submethod, multi_ids="user_ids"):
+                    nodes[id(query)] = (user_id, depth, kind, 0)
+                    querys.append(query)
+
+        self._stats["expanded"] += len(users)
+
+        return querys, nodes
+
+    def _create_page_querys(self, node: tuple[int, int, str, int], total: int, nodes: dict[int, tuple[int, int, str, int]]) -> list:
+        """
+        Creates the querys of the next pages of the connections of the user.
+
+        :param node: The tuple (user id, depth, kind, offset) of the first page.
+        :param total: The total count of the connections.
+        :param nodes: The dict of the nodes of the querys, the new querys are added to it.
+        :return: A list of querys.
+        """
+
+        user_id, depth, kind, _ = node
+        section, submethod, count = self._get_page_params(kind)
+        querys = []
+        for query in section._iter_paginate_querys(
+            ids=[user_id],
+            method=section._NAME,
+            submethod=submethod,
+            params=section._update_all(params=section.base_params.copy(), count=count),
+            min=count,
+            max=total,
+            count=count,
+            multi_ids="user_ids",
+        ):
+            nodes[id(query)] = (user_id, depth, kind, task_data(query)["offset"])
+            querys.append(query)
+
+        return querys
+
+    def _get_page_params(self, kind: str) -> tuple[Any, str, int]:
+        """
+        Get the section, the submethod and the page size of the connections.
+
+        :param kind: Kind of the connections(friends, followers).
+        :return: A tuple (section, submethod, count).
+        """
+
+        name, submethod, count = self.PAGES[kind]
+
+        return getattr(self.parser, name), submethod, count
+
+    def _expand(
+        self, node: tuple[int, int, str, int], response: Any, nodes: dict[int, tuple[int, int, str, int]], pages: list
+    ) -> Iterator[Edge]:
+        """
+        Emits the edges of the user and adds the new users to the frontier.
+
+        ** For the first page the querys of the next pages are added to pages. **
+
+        :param node: The tuple (user id, depth, kind, offset).
+        :param response: The response of the query of the connections.
+        :param nodes: The dict of the nodes of the querys.
+        :param pages: A list of the querys of the next pages.
+        :return: A generator of edges.
+        """
+
+        user_id, depth, kind, offset = node
+        response = VKResponse.wrap(response)
+
+        if not response.is_valid():
+            self.errors.append(VKError.from_response(response))
+            self._stats["errors"] += 1
+            return
+
+        data = response.data
+        if not offset and data.get("count", 0) > len(data.get("items", [])):
+            pages.extend(self._create_page_querys(node, data["count"], nodes))
+
+        for item in data.get("items", []):
+            target = item["id"] if isinstance(item, dict) else int(item)
+            self._visit(target, depth + 1, user_id)
+            self._stats["edges"] += 1
+
+            yield Edge(user_id, target, kind, depth + 1)
+
+    def _restore(self) -> bool:
+        """
+        Restores the state of the crawl from the checkpoint.
+
+        :return: True if the state was restored, False otherwise.
+        """
+
+        state = None if self.checkpoint is None else self.checkpoint.get_state(self.job)
+        if state is None:
+            return False
+
+        self.visited = IdSet(state["visited"])
+        self._frontier = [tuple(node) for node in state["frontier"]]
+        heapq.heapify(self._frontier)
+        self._sequence = counter(state["sequence"])
+        self._stats.update(state["stats"])
+
+        return True
+
+    def _save(self, force: bool = False) -> None:
+        """
+        Saves the state of the crawl to the checkpoint every `checkpoint.interval` waves.
+
+        :param force: Flag about saving regardless of the interval. Default: False.
+        """
+
+        if self.checkpoint is None:
+            return
+
+        self._waves += 1
+        if not force and self._waves % self.checkpoint.interval:
+            return
+
+        sequence = next(self._sequence)
+        self._sequence = counter(sequence)
+        self.checkpoint.set_state(
+            self.job,
+            {"visited": list(self.visited), "frontier": self._frontier, "sequence": sequence, "stats": self._stats},
+        )
+
+    def _finish(self) -> None:
+        """
+        Saves the final state of the crawl and marks the job as finished.
+        """
+
+        if not self.checkpoint is None:
+            self._save(force=True)
+            self.checkpoint.finish(self.job)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get the statistics of the crawl.
+
+        :return: Dict with the number of visited and expanded users, emitted edges and errors.
+        """
+
+        return {**self._stats, "frontier": len(self._frontier)}
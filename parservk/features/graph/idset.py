@@ -0,0 +1,138 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+
+class IdSet:
+    """
+    Compact set of non-negative integer ids.
+
+    ** The ids are split into pages by the high bits. A sparse page keeps the sorted low bits in array("H") (2 bytes per id),
+    a page with more than SPARSE_LIMIT ids is converted to a bitmap of 8 KiB. **
+    """
+
+    PAGE_BITS = 16
+    PAGE_SIZE = 1 << PAGE_BITS
+    SPARSE_LIMIT = 4096
+
+    def __init__(self, ids: Iterable[int] = ()) -> None:
+        """
+        Initializes the set.
+
+        :param ids: Initial ids(Optional).
+        """
+
+        self._pages = {}
+        self._length = 0
+
+        for id in ids:
+            self.add(id)
+
+    def _split(self, id: int) -> tuple[int, int]:
+        """
+        Splits the id into the number of the page and the position in the page.
+
+        :param id: The id.
+        :raises ValueError: If the id is negative.
+        :return: A tuple containing the number of the page and the position.
+        """
+
+        if id < 0:
+            raise ValueError("The ids must be non-negative.")
+
+        return id >> self.PAGE_BITS, id & (self.PAGE_SIZE - 1)
+
+    def add(self, id: int) -> bool:
+        """
+        Adds the id.
+
+        :param id: The id.
+        :return: True if the id was added, False if it is already in the set.
+        """
+
+        number, low = self._split(id)
+        page = self._pages.get(number)
+
+        if page is None:
+            self._pages[number] = array("H", [low])
+            self._length += 1
+            return True
+
+        if isinstance(page, bytearray):
+            if page[low >> 3] & (1 << (low & 7)):
+                return False
+
+            page[low >> 3] |= 1 << (low & 7)
+            self._length += 1
+            return True
+
+        index = bisect_left(page, low)
+        if index < len(page) and page[index] == low:
+            return False
+
+        page.insert(index, low)
+        self._length += 1
+        if len(page) > self.SPARSE_LIMIT:
+            self._pages[number] = self._to_bitmap(page)
+
+        return True
+
+    @staticmethod
+    def _to_bitmap(page: array) -> bytearray:
+        """
+        Converts the sparse page into the bitmap.
+
+        :param page: The sorted low bits.
+        :return: The bitmap.
+        """
+
+        bitmap = bytearray(IdSet.PAGE_SIZE >> 3)
+        for low in page:
+            bitmap[low >> 3] |= 1 << (low & 7)
+
+        return bitmap
+
+    def __contains__(self, id: int) -> bool:
+        if id < 0:
+            return False
+
+        number, low = self._split(id)
+        page = self._pages.get(number)
+
+        if page is None:
+            return False
+
+        if isinstance(page, bytearray):
+            return bool(page[low >> 3] & (1 << (low & 7)))
+
+        index = bisect_left(page, low)
+
+        return index < len(page) and page[index] == low
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        for number in sorted(self._pages):
+            page = self._pages[number]
+            base = number << self.PAGE_BITS
+
+            if isinstance(page, bytearray):
+                for index, byte in enumerate(page):
+                    if byte:
+                        for bit in range(8):
+                            if byte & (1 << bit):
+                                yield base + (index << 3) + bit
+            else:
+                for low in page:
+                    yield base + low
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the size of the pages in bytes(Without the overhead of the dict of pages).
+
+        :return: The number of bytes.
+        """
+
+        return sum(len(page) if isinstance(page, bytearray) else page.itemsize * len(page) for page in self._pages.values())
@@ -0,0 +1,2 @@
+from .snapshot import MembershipSnapshot, MembershipDelta
+from .tracker import MembershipTracker
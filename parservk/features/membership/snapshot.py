@@ -0,0 +1,181 @@
+import sys
+
+from array import array
+from bisect import bisect_left
+from heapq import merge
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Iterator, NamedTuple
+
+
+class MembershipDelta(NamedTuple):
+    """
+    Difference between two snapshots of the members of a group.
+
+    :param group_id: Id of the group.
+    :param joined: Sorted ids of the users that joined the group.
+    :param left: Sorted ids of the users that left the group.
+    :param count: The number of members in the new snapshot.
+    """
+
+    group_id: str
+    joined: array
+    left: array
+    count: int
+
+
+class MembershipSnapshot:
+    """
+    Sorted array of unique member ids.
+
+    ** The ids are kept in array("q") (8 bytes per id) instead of a list of ints (about 36 bytes per id),
+    the snapshots are compared with a linear merge. **
+    """
+
+    MAGIC = b"PVKMEM01"
+    TYPECODE = "q"
+    # Number of ids sorted as a list of ints at once
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, ids: array = None) -> None:
+        """
+        Initializes the snapshot.
+
+        :param ids: Sorted array("q") of unique ids(Optional, use from_ids for unsorted ids).
+        """
+
+        self.ids = array(self.TYPECODE) if ids is None else ids
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "MembershipSnapshot":
+        """
+        Creates the snapshot from the ids in any order.
+
+        ** The ids of groups.getMembers with sort="id_asc" are already sorted, then they are only appended.
+        Otherwise the array is sorted once at the end(See _sort). **
+
+        :param ids: The ids of the members.
+        :return: The snapshot.
+        """
+
+        result = array(cls.TYPECODE)
+        ordered = True
+
+        for id in ids:
+            if result and id <= result[-1]:
+                if id == result[-1]:
+                    continue
+                ordered = False
+
+            result.append(id)
+
+        if not ordered:
+            result = cls._sort(result)
+
+        return cls(result)
+
+    @classmethod
+    def _sort(cls, ids: array) -> array:
+        """
+        Sorts the ids and removes the duplicates.
+
+        ** The chunks of CHUNK_SIZE ids are taken from the end of the array, sorted and merged with heapq.merge, the duplicates are skipped by groupby.
+        Only one chunk is kept as a list of ints, so the memory stays about two arrays. The passed array is emptied. **
+
+        :param ids: The ids in any order.
+        :return: Sorted array of unique ids.
+        """
+
+        chunks = []
+        while ids:
+            chunks.append(array(cls.TYPECODE, sorted(ids[-cls.CHUNK_SIZE :])))
+            del ids[-cls.CHUNK_SIZE :]
+
+        return array(cls.TYPECODE, map(itemgetter(0), groupby(merge(*chunks))))
+
+    def diff(self, new: "MembershipSnapshot") -> tuple[array, array]:
+        """
+        Compares the snapshot with the newer one with a linear merge.
+
+        :param new: The newer snapshot.
+        :return: A tuple containing the ids that are only in the newer snapshot(Joined) and the ids that are only in this snapshot(Left).
+        """
+
+        old, new = self.ids, new.ids
+        joined, left = array(self.TYPECODE), array(self.TYPECODE)
+        i = j = 0
+
+        while i < len(old) and j < len(new):
+            if old[i] == new[j]:
+                i += 1
+                j += 1
+            elif old[i] < new[j]:
+                left.append(old[i])
+                i += 1
+            else:
+                joined.append(new[j])
+                j += 1
+
+        left.extend(old[i:])
+        joined.extend(new[j:])
+
+        return joined, left
+
+    def save(self, path: str) -> None:
+        """
+        Writes the snapshot to the file.
+
+        :param path: Path to the file.
+        """
+
+        ids = self.ids
+        if sys.byteorder == "big":
+            ids = array(self.TYPECODE, ids)
+            ids.byteswap()
+
+        with open(path, "wb") as file:
+            file.write(self.MAGIC)
+            ids.tofile(file)
+
+    @classmethod
+    def load(cls, path: str) -> "MembershipSnapshot":
+        """
+        Reads the snapshot from the file.
+
+        :param path: Path to the file.
+        :raises ValueError: If the file is not a snapshot.
+        :return: The snapshot.
+        """
+
+        ids = array(cls.TYPECODE)
+        with open(path, "rb") as file:
+            if file.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"The file {path} is not a membership snapshot.")
+
+            ids.frombytes(file.read())
+
+        if sys.byteorder == "big":
+            ids.byteswap()
+
+        return cls(ids)
+
+    def __contains__(self, id: int) -> bool:
+        index = bisect_left(self.ids, id)
+
+        return index < len(self.ids) and self.ids[index] == id
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the size of the ids in bytes.
+
+        :return: The number of bytes.
+        """
+
+        return self.ids.itemsize * len(self.ids)
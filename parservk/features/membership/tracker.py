@@ -0,0 +1,200 @@
+import os
+import time
+
+from array import array
+from typing import Any, AsyncIterator, Coroutine, Iterable, Iterator, Optional, Union
+
+from ...core import VKError
+from .snapshot import MembershipDelta, MembershipSnapshot
+
+
+class MembershipTracker:
+    """
+    Tracker of the members of groups, each groups.getMembers result is stored on disk as a snapshot and compared with the previous one.
+
+    ** The members are streamed page by page into the snapshot, so only the compact arrays of the two snapshots are kept in memory.
+    The callers receive only the joined and left ids. **
+
+    Example:
+        tracker = MembershipTracker(parser, "membership")
+        for delta in tracker.update_many(["apiclub", "vk"]):
+            ...
+    """
+
+    SUFFIX = ".snap"
+
+    def __init__(self, parser: Any, directory: str = "membership", keep: int = 2, in_flight: int = 10) -> None:
+        """
+        Initializes the tracker.
+
+        :param parser: ParserVK or AsyncParserVK.
+        :param directory: Directory of the snapshots, one subdirectory per group. Default: "membership".
+        :param keep: The number of the newest snapshots kept for each group. Default: 2.
+        :param in_flight: Maximum number of pages in flight. Default: 10.
+        :raises ValueError: If keep is less than 1.
+        """
+
+        if keep < 1:
+            raise ValueError("At least one snapshot must be kept.")
+
+        self.parser = parser
+        self.directory = directory
+        self.keep = keep
+        self.in_flight = in_flight
+        self.errors = []
+
+    def get_directory(self, group_id: Union[str, int]) -> str:
+        """
+        Get the directory of the snapshots of the group.
+
+        :param group_id: Id or username of the group.
+        :return: Path to the directory.
+        """
+
+        return os.path.join(self.directory, str(group_id).replace(os.sep, "_"))
+
+    def get_snapshots(self, group_id: Union[str, int]) -> list[str]:
+        """
+        Get the paths to the snapshots of the group.
+
+        :param group_id: Id or username of the group.
+        :return: A list of paths, oldest first.
+        """
+
+        directory = self.get_directory(group_id)
+        if not os.path.isdir(directory):
+            return []
+
+        return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(self.SUFFIX)]
+
+    def latest(self, group_id: Union[str, int]) -> Optional[MembershipSnapshot]:
+        """
+        Get the newest snapshot of the group.
+
+        :param group_id: Id or username of the group.
+        :return: The snapshot or None if the group is not tracked yet.
+        """
+
+        snapshots = self.get_snapshots(group_id)
+
+        return MembershipSnapshot.load(snapshots[-1]) if snapshots else None
+
+    def update(self, group_id: Union[str, int], **kwargs: Any) -> Union[MembershipDelta, Coroutine[Any, Any, MembershipDelta]]:
+        """
+        Takes the new snapshot of the members of the group and compares it with the previous one.
+
+        ** The first snapshot of the group is compared with the empty one, so all members are reported as joined.
+        With the asyncio transport returns a coroutine. **
+
+        :param group_id: Id or username of the group.
+        :param kwargs: Additional params of groups.getMembers(count, sort, ...).
+        :raises VKError: If a page could not be retrieved(The previous snapshot is kept).
+        :return: The delta between the snapshots.
+        """
+
+        pages = self.parser.groups.iter_members(group_id=group_id, in_flight=self.in_flight, pages=True, **kwargs)
+
+        if self.parser.transport == "asyncio":
+            return self._update_async(group_id, pages)
+
+        return self._commit(group_id, MembershipSnapshot.from_ids(self._get_ids(pages)))
+
+    async def _update_async(self, group_id: Union[str, int], pages: AsyncIterator[list]) -> MembershipDelta:
+        """
+        Asynchronous implementation of update.
+
+        :param group_id: Id or username of the group.
+        :param pages: An asynchronous generator of the pages of members.
+        :return: The delta between the snapshots.
+        """
+
+        ids = array(MembershipSnapshot.TYPECODE)
+        async for page in pages:
+            ids.extend(self._get_ids([page]))
+
+        snapshot = MembershipSnapshot.from_ids(ids)
+
+        return self._commit(group_id, snapshot)
+
+    def update_many(self, group_ids: Iterable[Union[str, int]], **kwargs: Any) -> Union[Iterator[MembershipDelta], AsyncIterator[MembershipDelta]]:
+        """
+        Updates the snapshots of the groups one by one.
+
+        ** The groups that failed are skipped, their errors are collected in the errors attribute.
+        With the asyncio transport returns an asynchronous generator. **
+
+        :param group_ids: Ids or usernames of the groups.
+        :param kwargs: Additional params of groups.getMembers.
+        :return: A generator of deltas.
+        """
+
+        if self.parser.transport == "asyncio":
+            return self._update_many_async(group_ids, **kwargs)
+
+        return self._update_many_sync(group_ids, **kwargs)
+
+    def _update_many_sync(self, group_ids: Iterable[Union[str, int]], **kwargs: Any) -> Iterator[MembershipDelta]:
+        """
+        Synchronous implementation of update_many.
+
+        :param group_ids: Ids or usernames of the groups.
+        :param kwargs: Additional params of groups.getMembers.
+        :return: A generator of deltas.
+        """
+
+        for group_id in group_ids:
+            try:
+                yield self.update(group_id, **kwargs)
+            except VKError as error:
+                self.errors.append(error)
+
+    async def _update_many_async(self, group_ids: Iterable[Union[str, int]], **kwargs: Any) -> AsyncIterator[MembershipDelta]:
+        """
+        Asynchronous implementation of update_many.
+
+        :param group_ids: Ids or usernames of the groups.
+        :param kwargs: Additional params of groups.getMembers.
+        :return: An asynchronous generator of deltas.
+        """
+
+        for group_id in group_ids:
+            try:
+                yield await self.update(group_id, **kwargs)
+            except VKError as error:
+                self.errors.append(error)
+
+    @staticmethod
+    def _get_ids(pages: Iterable[list]) -> Iterator[int]:
+        """
+        Get the ids of the members from the pages(The members are ids or dicts when the fields param is set).
+
+        :param pages: Pages of members.
+        :return: A generator of ids.
+        """
+
+        for page in pages:
+            for member in page:
+                yield member["id"] if isinstance(member, dict) else int(member)
+
+    def _commit(self, group_id: Union[str, int], snapshot: MembershipSnapshot) -> MembershipDelta:
+        """
+        Compares the snapshot with the previous one, stores it and removes the old snapshots.
+
+        :param group_id: Id or username of the group.
+        :param snapshot: The new snapshot.
+        :return: The delta between the snapshots.
+        """
+
+        previous = self.latest(group_id) or MembershipSnapshot()
+        joined, left = previous.diff(snapshot)
+
+        directory = self.get_directory(group_id)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{time.time_ns():020d}{self.SUFFIX}")
+        snapshot.save(path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+        for old in self.get_snapshots(group_id)[: -self.keep]:
+            os.remove(old)
+
+        return MembershipDelta(str(group_id), joined, left, len(snapshot))
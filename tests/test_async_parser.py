@@ -0,0 +1,98 @@
+import sys
+import asyncio
+
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.mockvk import MockVK, MockVKServer
+from parservk.core import AsyncParserVK
+
+
+MOCK_PARAMS = {"members": 2500, "posts": 250, "friends": 120}
+
+
+class FlakyVK(MockVK):
+    """
+    MockVK failing the first call of every method with the error 10(Internal server error).
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.failed = set()
+
+    def call(self, method: str, params: dict) -> Any:
+        with self._lock:
+            failed = not method.lower() in self.failed
+            self.failed.add(method.lower())
+
+        if failed:
+            return self.error(10, "Internal server error")
+
+        return super().call(method, params)
+
+
+@pytest.fixture
+def server():
+    with MockVKServer(**MOCK_PARAMS) as server:
+        yield server
+
+
+def run(url: str, func: Callable[[AsyncParserVK], Any], **kwargs: Any) -> Any:
+    """
+    Runs the coroutine function with AsyncParserVK on a new event loop.
+
+    :param url: The URL of the API.
+    :param func: Async function taking the parser.
+    :param kwargs: Params of AsyncParserVK.
+    :return: The result of the function.
+    """
+
+    async def main() -> Any:
+        async with AsyncParserVK(tokens=["token"], api_url=url, rate_limit=None, **kwargs) as parser:
+            if not parser.retry_policy is None:
+                parser.retry_policy.base_delay = 0.01
+
+            return await func(parser)
+
+    return asyncio.run(main())
+
+
+def test_users_get(server):
+    result = run(server.url, lambda parser: parser.users.get(user_ids=list(range(1, 1001))))
+
+    assert [user["id"] for user in result["users"]] == list(range(1, 1001))
+    assert result["friends"] == result["followers"] == []
+
+
+def test_groups_get_members(server):
+    pages = run(server.url, lambda parser: parser.groups.getMembers(group_id=1))
+
+    assert sorted(member for page in pages for member in page) == list(range(1, 2501))
+    assert server.mock.calls["groups.getmembers"] == 3
+
+
+def test_friends_get(server):
+    friends = run(server.url, lambda parser: parser.friends.get(user_id=5))
+
+    assert len(friends) == len(set(friends)) == 120
+
+
+def test_wall_get(server):
+    pages = run(server.url, lambda parser: parser.wall.get(owner_id=1))
+    posts = [post for page in pages for post in page]
+
+    assert sorted(post["id"] for post in posts) == list(range(1, 251))
+    assert all(post["owner_id"] == 1 for post in posts)
+
+
+def test_retry_injected_error(server):
+    server.mock = FlakyVK(**MOCK_PARAMS)
+    pages = run(server.url, lambda parser: parser.groups.getMembers(group_id=1), max_retries=3)
+
+    assert sorted(member for page in pages for member in page) == list(range(1, 2501))
+    # 3 pages and the retry of the failed one
+    assert server.mock.requests == 4
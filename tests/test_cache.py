@@ -0,0 +1,71 @@
+import sys
+
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parservk.core import MemoryCache, ResponseCache
+
+
+URL = "https://api.vk.com/method/users.get"
+PARAMS = {"fields": "city", "v": 5.131, "access_token": "token"}
+
+
+class CountingCache(MemoryCache):
+    """
+    MemoryCache counting the keys read from it.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.reads = 0
+
+    def get_many(self, keys):
+        keys = list(keys)
+        self.reads += len(keys)
+
+        return super().get_many(keys)
+
+
+def create_task(ids: list) -> dict:
+    return {"url": URL, "data": {**PARAMS, "user_ids": ",".join(map(str, ids))}}
+
+
+@pytest.fixture
+def cache():
+    cache = ResponseCache(CountingCache())
+    cache.backend.set_many({cache.create_key("users.get", PARAMS, id): {"id": id} for id in (1, 2, 3)}, 60)
+
+    return cache
+
+
+def test_lookup_and_resolve_read_once(cache):
+    hits, misses = cache.lookup(URL, PARAMS, [1, 2, 3, 4, 5])
+    results, indexes = cache.resolve([create_task(hits), create_task(misses)])
+
+    assert (hits, misses) == ([1, 2, 3], [4, 5])
+    assert results[0].json() == {"response": [{"id": 1}, {"id": 2}, {"id": 3}]}
+    assert indexes == [1]
+    # The records and the misses of lookup are not read from the backend again
+    assert cache.backend.reads == 5
+
+
+def test_resolve_without_lookup(cache):
+    results, indexes = cache.resolve([create_task([1, 2]), create_task([2, 9])])
+
+    assert results[0].json() == {"response": [{"id": 1}, {"id": 2}]}
+    assert indexes == [1]
+    assert cache.backend.reads == 4
+
+
+def test_max_looked_up(cache):
+    cache.MAX_LOOKED_UP = 3
+    cache.lookup(URL, PARAMS, [1, 2])
+    cache.lookup(URL, PARAMS, [3, 4])
+    results, indexes = cache.resolve([create_task([1, 2])])
+
+    # The keys of the first lookup are dropped, the task is resolved from the backend
+    assert results[0].json() == {"response": [{"id": 1}, {"id": 2}]}
+    assert cache.backend.reads == 6
@@ -0,0 +1,45 @@
+import sys
+
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.mockvk import MockVKServer
+from parservk.core import ParserVK, VKError
+
+
+@pytest.fixture
+def server():
+    with MockVKServer(error_rate=1.0) as server:
+        yield server
+
+
+def create_parser(server: MockVKServer, **kwargs) -> ParserVK:
+    return ParserVK(tokens=["token"], transport="requests", api_url=server.url, rate_limit=None, max_retries=0, **kwargs)
+
+
+def test_errors_of_the_last_call(server):
+    parser = create_parser(server)
+    result = parser.users.get(user_ids=list(range(1, 2000)))
+
+    assert result["users"] == []
+    assert len(parser.errors) == 2
+    assert all(isinstance(error, VKError) and error.method == "users.get" for error in parser.errors)
+
+    server.mock.error_rate = 0.0
+    result = parser.users.get(user_ids=[1, 2])
+
+    assert [user["id"] for user in result["users"]] == [1, 2]
+    assert parser.errors == []
+
+
+def test_raise_on_error(server):
+    parser = create_parser(server, raise_on_error=True)
+
+    with pytest.raises(VKError) as error:
+        parser.groups.getMembers(group_id=1)
+
+    assert error.value.method == "groups.getMembers"
+    assert parser.errors == [error.value]
@@ -0,0 +1,130 @@
+import sys
+import json
+
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parservk.core import ExecuteBatcher, StaticResponse
+
+
+URL_API = "https://api.vk.com/method/"
+
+
+def create_task(method: str = "users.get", token: str = "token", v: float = 5.131, **params) -> dict:
+    return {"url": URL_API + method, "data": {**params, "access_token": token, "v": v}}
+
+
+def create_result(payload: dict, status_code: int = 200) -> StaticResponse:
+    return StaticResponse(URL_API + "execute", payload, status_code=status_code)
+
+
+@pytest.fixture
+def batcher():
+    return ExecuteBatcher(URL_API, excluded_params=["User-Agent"])
+
+
+def test_max_calls():
+    with pytest.raises(ValueError):
+        ExecuteBatcher(URL_API, max_calls=26)
+
+
+def test_pack_max_calls(batcher):
+    tasks = [create_task(user_ids=str(index)) for index in range(30)]
+    packed_tasks, layout = batcher.pack(tasks)
+
+    assert layout == [list(range(25)), list(range(25, 30))]
+    assert all(task["url"] == URL_API + "execute" for task in packed_tasks)
+    assert packed_tasks[0]["data"]["code"].count("API.users.get(") == 25
+    assert packed_tasks[0]["data"]["access_token"] == "token"
+    assert packed_tasks[0]["data"]["v"] == 5.131
+
+
+def test_pack_groups(batcher):
+    tasks = [
+        create_task(token="a", user_ids="1"),
+        create_task(token="b", user_ids="2"),
+        create_task(token="a", user_ids="3"),
+        create_task(token="a", v=5.199, user_ids="4"),
+    ]
+    packed_tasks, layout = batcher.pack(tasks)
+
+    # The calls are grouped by token and version, a group of one call is sent as is
+    assert layout == [[0, 2], [1], [3]]
+    assert packed_tasks[1] is tasks[1]
+    assert packed_tasks[2] is tasks[3]
+
+
+def test_pack_not_packable(batcher):
+    tasks = [
+        "https://example.com",
+        {"url": URL_API + "users.get", "params": {"user_ids": "1"}, "headers": {}, "proxies": {}},
+        create_task("execute", code="return 1;"),
+        create_task(user_ids="1"),
+        create_task(user_ids="2"),
+    ]
+    packed_tasks, layout = batcher.pack(tasks)
+
+    assert layout == [[0], [1], [2], [3, 4]]
+    assert packed_tasks[:3] == tasks[:3]
+
+
+def test_create_code(batcher):
+    code = batcher.create_code([create_task(user_ids="1,2", fields="city", **{"User-Agent": "agent"})])
+    calls = json.loads(code[code.index("(") + 1 : code.rindex(")")])
+
+    assert code.startswith("return [API.users.get(")
+    assert calls == {"user_ids": "1,2", "fields": "city"}
+
+
+def test_split_errors(batcher):
+    tasks = [create_task("users.get"), create_task("wall.get"), create_task("users.get")]
+    result = create_result(
+        {
+            "response": [[{"id": 1}], False, False],
+            "execute_errors": [
+                {"method": "users.get", "error_code": 18, "error_msg": "User was deleted"},
+                {"method": "wall.get", "error_code": 15, "error_msg": "Access denied"},
+            ],
+        }
+    )
+    responses = batcher.split(result, tasks)
+
+    assert responses[0].json() == {"response": [{"id": 1}]}
+    # The false entries are matched to the execute errors by method, not by position
+    assert responses[1].json()["error"]["error_code"] == 15
+    assert responses[2].json()["error"]["error_code"] == 18
+    assert all(response.url == task["url"] for response, task in zip(responses, tasks))
+
+
+def test_split_missing_error(batcher):
+    responses = batcher.split(create_result({"response": [False]}), [create_task()])
+
+    assert responses[0].json()["error"]["error_code"] == 0
+
+
+def test_split_failed_execute(batcher):
+    tasks = [create_task(), create_task()]
+
+    assert batcher.split(None, tasks) == [None, None]
+    assert batcher.split(create_result({}, status_code=500), tasks) == [None, None]
+
+    responses = batcher.split(create_result({"error": {"error_code": 5, "error_msg": "User authorization failed"}}), tasks)
+
+    assert [response.json()["error"]["error_code"] for response in responses] == [5, 5]
+
+
+def test_unpack(batcher):
+    tasks = [create_task(user_ids="1"), "https://example.com", create_task(user_ids="2")]
+    packed_tasks, layout = batcher.pack(tasks)
+    # The token scheduler stamps another token onto the execute task when it is sent
+    packed_tasks[1]["data"]["access_token"] = "other"
+    results = ["raw", create_result({"response": [[{"id": 1}], [{"id": 2}]]})]
+    unpacked = batcher.unpack(tasks, packed_tasks, layout, results)
+
+    assert unpacked[1] == "raw"
+    assert unpacked[0].json() == {"response": [{"id": 1}]}
+    assert unpacked[2].json() == {"response": [{"id": 2}]}
+    assert tasks[0]["data"]["access_token"] == tasks[2]["data"]["access_token"] == "other"
@@ -0,0 +1,61 @@
+import sys
+import random
+
+from array import array
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parservk.features.membership import MembershipSnapshot
+
+
+def create_snapshot(*ids: int) -> MembershipSnapshot:
+    return MembershipSnapshot(array(MembershipSnapshot.TYPECODE, ids))
+
+
+def test_from_ids_sorted():
+    snapshot = MembershipSnapshot.from_ids([1, 2, 2, 5, 9])
+
+    assert list(snapshot) == [1, 2, 5, 9]
+
+
+def test_from_ids_unsorted(monkeypatch):
+    # Small chunks, so the ids are merged from several sorted chunks
+    monkeypatch.setattr(MembershipSnapshot, "CHUNK_SIZE", 7)
+    ids = list(range(1, 101)) * 2
+    random.Random(0).shuffle(ids)
+    snapshot = MembershipSnapshot.from_ids(ids)
+
+    assert list(snapshot) == list(range(1, 101))
+    assert snapshot.ids.typecode == MembershipSnapshot.TYPECODE
+
+
+@pytest.mark.parametrize(
+    "old, new, joined, left",
+    [
+        ((1, 2, 3, 5), (2, 3, 4, 6, 7), [4, 6, 7], [1, 5]),
+        ((1, 2, 3), (1, 2, 3), [], []),
+        ((), (1, 2), [1, 2], []),
+        ((1, 2), (), [], [1, 2]),
+        ((), (), [], []),
+        ((1, 2), (3, 4), [3, 4], [1, 2]),
+    ],
+)
+def test_diff(old, new, joined, left):
+    result = create_snapshot(*old).diff(create_snapshot(*new))
+
+    assert (list(result[0]), list(result[1])) == (joined, left)
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "members.bin")
+    create_snapshot(1, 5, 2 ** 40).save(path)
+
+    assert list(MembershipSnapshot.load(path)) == [1, 5, 2 ** 40]
+    assert 5 in MembershipSnapshot.load(path)
+
+    (tmp_path / "other.bin").write_bytes(b"other")
+    with pytest.raises(ValueError):
+        MembershipSnapshot.load(str(tmp_path / "other.bin"))
@@ -0,0 +1,40 @@
+import sys
+
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.mockvk import MockVKServer
+from parservk.core import ParserVK
+
+
+@pytest.fixture
+def server():
+    with MockVKServer(members=2500, posts=250) as server:
+        yield server
+
+
+@pytest.fixture
+def parser(server):
+    return ParserVK(tokens=["token"], transport="requests", api_url=server.url, rate_limit=None)
+
+
+def test_repeated_get_members(server, parser):
+    # The tasks of the previous calls are freed, their ids must not be taken for the ids of the subquerys
+    for group_id in range(1, 31):
+        requests = server.mock.requests
+        pages = parser.groups.getMembers(group_id=group_id)
+
+        assert [len(page) for page in pages] == [1000, 1000, 500]
+        assert sorted(member for page in pages for member in page) == list(range(1, 2501))
+        assert server.mock.requests - requests == 3
+
+
+def test_repeated_wall_get(server, parser):
+    for owner_id in range(1, 11):
+        pages = parser.wall.get(owner_id=owner_id)
+
+        assert sorted(post["id"] for page in pages for post in page) == list(range(1, 251))
+        assert all(post["owner_id"] == owner_id for page in pages for post in page)
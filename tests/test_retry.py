@@ -0,0 +1,84 @@
+import sys
+
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parservk.core import RetryPolicy, StaticResponse, VKError, get_error_code, NETWORK_ERROR_CODE, CLIENT_ERROR_CODE
+
+
+URL = "https://api.vk.com/method/wall.get"
+
+
+def create_response(payload: dict = None, status_code: int = 200, content: bytes = None) -> StaticResponse:
+    return StaticResponse(URL, payload, content=content, status_code=status_code)
+
+
+@pytest.mark.parametrize(
+    "response, code",
+    [
+        (None, NETWORK_ERROR_CODE),
+        (create_response(content=b"Bad Gateway", status_code=502), NETWORK_ERROR_CODE),
+        (create_response(content=b"Too Many Requests", status_code=429), NETWORK_ERROR_CODE),
+        (create_response(content=b"Not Found", status_code=404), CLIENT_ERROR_CODE),
+        (create_response(content=b"Bad Request", status_code=400), CLIENT_ERROR_CODE),
+        (create_response({"error": {"error_code": 6, "error_msg": "Too many requests per second"}}), 6),
+        (create_response(content=b'{"error": {"error_msg": "Unknown"}}'), 0),
+        (create_response({"response": {"count": 0, "items": []}}), None),
+    ],
+)
+def test_get_error_code(response, code):
+    assert get_error_code(response) == code
+
+
+@pytest.mark.parametrize(
+    "code, kind",
+    [
+        (None, None),
+        (NETWORK_ERROR_CODE, RetryPolicy.RETRYABLE),
+        (6, RetryPolicy.RETRYABLE),
+        (10, RetryPolicy.RETRYABLE),
+        (5, RetryPolicy.TOKEN),
+        (29, RetryPolicy.TOKEN),
+        (CLIENT_ERROR_CODE, RetryPolicy.PERMANENT),
+        (15, RetryPolicy.PERMANENT),
+        (18, RetryPolicy.PERMANENT),
+    ],
+)
+def test_classify(code, kind):
+    assert RetryPolicy().classify(code) == kind
+
+
+def test_delay():
+    policy = RetryPolicy(base_delay=0.5, max_delay=2.0)
+
+    assert all(0 <= policy.delay(1) <= 0.5 for _ in range(100))
+    assert all(0 <= policy.delay(10) <= 2.0 for _ in range(100))
+
+
+def test_error_from_response():
+    error = VKError.from_response(
+        create_response(
+            {
+                "error": {
+                    "error_code": 15,
+                    "error_msg": "Access denied",
+                    "request_params": [
+                        {"key": "owner_id", "value": "1"},
+                        {"key": "access_token", "value": "token"},
+                        {"key": "method", "value": "wall.get"},
+                    ],
+                }
+            }
+        )
+    )
+
+    assert (error.code, error.message, error.method, error.kind) == (15, "Access denied", "wall.get", "permanent")
+    assert error.params == {"owner_id": "1"}
+
+
+def test_error_from_status():
+    assert VKError.from_response(create_response(content=b"Not Found", status_code=404)).code == CLIENT_ERROR_CODE
+    assert VKError.from_response(create_response(content=b"Service Unavailable", status_code=503)).code == NETWORK_ERROR_CODE